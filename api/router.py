@@ -1,10 +1,11 @@
 from fastapi import APIRouter
 
-from api.routes import health, chat, qna, ws, login
+from api.routes import health, chat, qna, ws, login, metrics
 
 api_router = APIRouter()
 api_router.include_router(health.router)
 api_router.include_router(chat.router)
 api_router.include_router(qna.router)
 api_router.include_router(ws.router)
-api_router.include_router(login.router)
\ No newline at end of file
+api_router.include_router(login.router)
+api_router.include_router(metrics.router)
\ No newline at end of file
@@ -1,12 +1,15 @@
 from fastapi import (
     APIRouter, HTTPException,
-    Path, Body, Depends
+    Path, Body, Depends, Header, Query
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import StreamingResponse
 from sqlalchemy.exc import SQLAlchemyError
 
+import base64
+
+from datetime import datetime
 from uuid import UUID, uuid4
-from typing import Dict
+from typing import Any, Dict, Literal, Optional, Tuple
 
 from schemas.chat import (
     ChatSessionRequest, ChatSessionResponse,
@@ -19,43 +22,50 @@ import crud.persona
 import crud.session
 import crud.chat
 
+from core import serialization
 from core.config import settings
 from core.db import SessionDep, get_async_context_db
+from core.log import get_logger
+from core.persona_catalog import persona_catalog
+from core.serialization import FastJSONResponse
 
 
 router = APIRouter(prefix="/chat", tags=["Chat"])
+logger = get_logger(__name__)
+
+# 세션 생성 후 WebSocket 연결 전까지 대기 중인 세션 ID -> 페르소나 ID
+pending_session: Dict[UUID, int] = {}
 
 @router.get("/personas", response_model=PersonaListResponse)
-async def get_personas(db: SessionDep):
-    """ 사용자 페르소나 목록을 조회합니다. """
+async def get_personas(if_none_match: Optional[str] = Header(default=None)):
+    """ 사용자 페르소나 목록을 조회합니다. (ETag 일치 시 304) """
     try:
-        # DB에서 페르소나 목록 조회
-        personas = await crud.persona.get_personas(db)
-        return {"personas": personas}
+        # 인메모리 카탈로그에서 미리 직렬화된 응답 반환 (DB 조회 없음)
+        return await persona_catalog.response(if_none_match)
     except SQLAlchemyError as e:
         # DB 연결 실패, 쿼리 오류 등 SQLAlchemy 관련 오류가 발생한 경우
-        print(f"--- DB Error in /personas: {e}")
+        logger.error("personas.db_error", error=str(e))
         raise HTTPException(
             status_code=500,
             detail="Internal Server Error: DB operation failed"
         )
     except Exception as e:
         # 기타 알 수 없는 오류가 발생한 경우
-        print(f"--- Unknown Error in /personas: {e}")
+        logger.exception("personas.unknown_error")
         raise HTTPException(
             status_code=500,
             detail="Internal Server Error: Unknown error occurred"
         )
 
 @router.post("/session")
-async def create_session(req: ChatSessionRequest, db: SessionDep):
+async def create_session(req: ChatSessionRequest):
     try:
         # 요청 body에 persona_id가 없으면 422 에러 반환
         if not req.persona_id:
             raise HTTPException(status_code=422, detail="persona_id is required")
         
         # 존재하지 않는 persona_id면 404 에러 반환
-        persona = await crud.persona.get_persona_by_id(db, req.persona_id)
+        persona = await persona_catalog.get(req.persona_id)
         if not persona:
             raise HTTPException(status_code=404, detail="Persona not found")
         
@@ -65,7 +75,7 @@ async def create_session(req: ChatSessionRequest, db: SessionDep):
         pending_session[session_id] = req.persona_id
 
         is_dev = (settings.ENVIRONMENT == "development")
-        res = JSONResponse(content={"session_id": session_id_str})
+        res = FastJSONResponse(content={"session_id": session_id_str})
         res.set_cookie(
             key="session_token",
             value=session_id_str,
@@ -77,9 +87,11 @@ async def create_session(req: ChatSessionRequest, db: SessionDep):
         
         return res
 
+    except HTTPException:
+        raise
     except SQLAlchemyError as e:
         # DB 연결 실패, 쿼리 오류 등 SQLAlchemy 관련 오류가 발생한 경우
-        print(f"--- DB Error in /session: {e}")
+        logger.error("session.db_error", error=str(e))
         raise HTTPException(
             status_code=500,
             detail="Internal Server Error: DB operation failed"
@@ -87,38 +99,121 @@ async def create_session(req: ChatSessionRequest, db: SessionDep):
     
     except Exception as e:
         # 기타 알 수 없는 오류가 발생한 경우
-        print(f"--- Unknown Error in /session: {e}")
+        logger.exception("session.unknown_error")
         raise HTTPException(
             status_code=500,
             detail="Internal Server Error: Unknown error occurred"
         )
 
+def _encode_cursor(created_at: datetime, chat_id: UUID) -> str:
+    """ 페이지 마지막 행의 (created_at, id)를 불투명 커서 문자열로 변환 """
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{chat_id}".encode()).decode()
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    try:
+        created_at, chat_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(chat_id)
+    except (ValueError, UnicodeError):
+        raise HTTPException(status_code=422, detail="Invalid cursor")
+
+def _history_item(session_id: UUID, row) -> Dict[str, Any]:
+    return {
+        "id": str(row.id),
+        "session_id": str(session_id),
+        "persona_id": row.persona_id,
+        "is_user": row.is_user,
+        "content": row.content,
+        "created_at": row.created_at.isoformat()
+    }
+
 @router.get("/history/{session_id}")
-async def get_chat_history(session_id: UUID, db: SessionDep):
+async def get_chat_history(
+    session_id: UUID,
+    db: SessionDep,
+    limit: Optional[int] = Query(default=None, ge=1, le=settings.HISTORY_PAGE_MAX_LIMIT),
+    cursor: Optional[str] = Query(default=None),
+    direction: Literal["asc", "desc"] = Query(default="asc")
+):
+    """
+    채팅 기록을 조회합니다.
+    - limit 미지정 시 전체 기록 반환
+    - limit 지정 시 (created_at, id) 키셋 페이지네이션: 응답의 next_cursor를 cursor로 넘겨 다음 페이지 조회
+    - direction=desc면 최신 메시지부터 조회
+    """
     try:
         # 존재하지 않는 세션 ID면 404 에러 반환
         session = await crud.session.get_chat_session_by_id(db, session_id)
         if not session:
             raise HTTPException(status_code=404, detail="Session not found")
-        
-        chat_history = await crud.chat.fetch_chats_by_session_id(db, session_id)
 
-        return {"session_id": session_id, "history": chat_history}
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        rows = await crud.chat.fetch_chat_page(
+            db, session_id,
+            limit=limit + 1 if limit is not None else None,
+            cursor=_decode_cursor(cursor) if cursor else None,
+            descending=(direction == "desc")
+        )
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = _encode_cursor(rows[-1].created_at, rows[-1].id)
+
+        return {
+            "session_id": session_id,
+            "history": [_history_item(session_id, row) for row in rows],
+            "next_cursor": next_cursor
+        }
+    except HTTPException:
+        raise
     except SQLAlchemyError as e:
         # DB 연결 실패, 쿼리 오류 등 SQLAlchemy 관련 오류가 발생한 경우
-        print(f"--- DB Error in /history/{session_id}: {e}")
+        logger.error("history.db_error", session_id=session_id, error=str(e))
         raise HTTPException(
             status_code=500,
             detail="Internal Server Error: DB operation failed"
         )
     except Exception as e:
         # 기타 알 수 없는 오류가 발생한 경우
-        print(f"--- Unknown Error in /history/{session_id}: {e}")
+        logger.exception("history.unknown_error", session_id=session_id)
         raise HTTPException(
             status_code=500,
             detail="Internal Server Error: Unknown error occurred"
         )
 
+@router.get("/history/{session_id}/stream")
+async def stream_chat_history(session_id: UUID, db: SessionDep):
+    """
+    전체 채팅 기록을 NDJSON(한 줄에 메시지 하나)으로 스트리밍합니다.
+    - 서버 측 커서로 HISTORY_STREAM_BATCH_SIZE 행씩 읽어 바로 전송 (전체 기록을 메모리에 올리지 않음)
+    """
+    try:
+        session = await crud.session.get_chat_session_by_id(db, session_id)
+    except SQLAlchemyError as e:
+        logger.error("history.db_error", session_id=session_id, error=str(e))
+        raise HTTPException(
+            status_code=500,
+            detail="Internal Server Error: DB operation failed"
+        )
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+
+    async def ndjson_lines():
+        # 응답 전송 중에도 유지되는 별도 DB 세션 사용
+        try:
+            async with get_async_context_db() as stream_db:
+                async for rows in crud.chat.stream_chats_by_session_id(
+                    stream_db, session_id, settings.HISTORY_STREAM_BATCH_SIZE
+                ):
+                    yield "".join(
+                        serialization.dumps(_history_item(session_id, row)) + "\n"
+                        for row in rows
+                    )
+        except SQLAlchemyError as e:
+            # 이미 200 응답이 시작되었으므로 로그만 남기고 스트림 종료
+            logger.error("history.stream_db_error", session_id=session_id, error=str(e))
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
 @router.post("/feedback")
 async def submit_feedback(req: FeedbackRequest, db: SessionDep):
     """
@@ -129,9 +224,8 @@ async def submit_feedback(req: FeedbackRequest, db: SessionDep):
         chatbot_chat = await crud.chat.update_chat_feedback(
             db, req.message_id, req.is_helpful
         )
-        print(f"Feedback received for {req.message_id}: {req.is_helpful}")
-        print(req)
-        print(chatbot_chat)
+        logger.info("feedback.received", message_id=req.message_id, is_helpful=req.is_helpful)
+        logger.debug("feedback.updated", message_id=chatbot_chat.chat_id, is_helpful=chatbot_chat.is_helpful)
 
         # 클라이언트에게 성공 응답 반환
         return {
@@ -140,7 +234,7 @@ async def submit_feedback(req: FeedbackRequest, db: SessionDep):
             "feedback_received": chatbot_chat.is_helpful
         }
     except SQLAlchemyError as e:
-        print(f"--- DB Error in /feedback: {e}")
+        logger.error("feedback.db_error", message_id=req.message_id, error=str(e))
         raise HTTPException(
             status_code=500,
             detail="Internal Server Error: DB operation failed"
@@ -1,8 +1,53 @@
 from fastapi import APIRouter
 
+from core.http import http_clients
+from core.db import pool_stats
+from core.chat_writer import chat_writer
+from core.view_counter import view_counter
+from core.qna_cache import qna_cache
+from core.persona_catalog import persona_catalog
+from core.llm_cache import llm_cache
+from core.llm import llm_singleflight
+from core.admission import llm_admission, mcp_admission
+from core.session_registry import session_registry
+from core.readiness import readiness_probe
+from core.serialization import FastJSONResponse
+from api.routes.ws import connection_manager
+
 
 router = APIRouter(prefix="/health", tags=['Health'])
 
 @router.get('/')
 def health_check():
-    return {'status': 'ok'}
\ No newline at end of file
+    return {'status': 'ok'}
+
+@router.get('/ready')
+def readiness_check():
+    """
+    외부 의존성 준비 상태 조회 (로드밸런서 헬스 체크용)
+    - 백그라운드 확인 결과만 반환하므로 의존성을 직접 호출하지 않음
+    - 핵심 의존성이 실패했거나 확인 결과가 오래되면 503
+    """
+    report = readiness_probe.report()
+    status_code = 200 if report["status"] == "ready" else 503
+    return FastJSONResponse(status_code=status_code, content=report)
+
+@router.get('/stats')
+def runtime_stats():
+    """ 커넥션 풀 등 런타임 컴포넌트 상태 조회 """
+    return {
+        'http_pools': http_clients.stats(),
+        'db_pools': pool_stats(),
+        'chat_writer': chat_writer.stats(),
+        'view_counter': view_counter.stats(),
+        'qna_cache': qna_cache.stats(),
+        'persona_catalog': persona_catalog.stats(),
+        'llm_cache': llm_cache.stats(),
+        'llm_coalescing': llm_singleflight.stats(),
+        'connections': connection_manager.stats(),
+        'session_registry': session_registry.stats(),
+        'admission': {
+            'llm': llm_admission.stats(),
+            'mcp': mcp_admission.stats()
+        }
+    }
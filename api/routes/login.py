@@ -1,16 +1,17 @@
 from fastapi import (
     APIRouter, HTTPException,
-    Path, Body, Depends
+    Path, Body, Depends, Header
 )
 from fastapi.responses import JSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 
 import httpx
+import time
 import asyncio
 
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
-from typing import Dict
+from typing import Dict, Optional
 
 from schemas.chat import (
     ChatSessionRequest, ChatSessionResponse,
@@ -24,18 +25,27 @@ import crud.persona
 import crud.session
 import crud.chat
 
+from core import serialization
 from core.config import settings
 from core.db import SessionDep, get_async_context_db
+from core.http import http_clients
+from core.admission import AdmissionRejected, mcp_admission
+from core.metrics import login_recommend_seconds, mcp_request_seconds
+from core.log import get_logger
+from core.persona_catalog import persona_catalog
+from core.chat_writer import chat_writer
 
 from api.routes.ws import connection_manager
 
 router = APIRouter(prefix="/login", tags=["Login"])
+logger = get_logger(__name__)
 
 @router.post("/")
 async def login(req: LoginRequest, db: SessionDep):
     """
         사용자 로그인 처리 엔드포인트
         바디에 포함된 세션 ID가 connection_manager에 존재하는지 확인
+        (다른 워커에 연결된 세션은 세션 레지스트리에서 조회)
         존재하면 해당 세션과 바디에 포함된 페르소나 ID를 매핑하여 업데이트
     """
     req_session_id = UUID(req.session_id)
@@ -44,103 +54,110 @@ async def login(req: LoginRequest, db: SessionDep):
     
     # 실제 서비스에서는 로그인 처리 로직 구현
     # connection_manager에 세션 ID가 존재하는지 확인
-    if req_session_id not in connection_manager.active_connections:
+    session = await connection_manager.get_session(req_session_id)
+    if session is None:
         # 존재하지 않는 세션ID로 요청한 경우
         raise HTTPException(status_code=404, detail="Session not found")
 
     try:
         # 세션과 페르소나 매핑 업데이트
-        print(f"Update persona_id to {req.persona_id} in session {req_session_id}")
-        connection_manager.update_persona_id(req_session_id, req.persona_id)
-        await crud.session.update_persona_in_session(
-            db,
-            req_session_id,
-            connection_manager.active_connections[req_session_id]["persona_id"]
-        )
+        logger.info("login.persona_updated", session_id=req_session_id, persona_id=req.persona_id)
+        await connection_manager.update_persona_id(req_session_id, req.persona_id)
+        await crud.session.update_persona_in_session(db, req_session_id, req.persona_id)
 
         try:
             # 로그인 조건은 MCP 소비 데이터 추천 요청이므로 바로 MCP 소비데이터 추천 함수 호출
-            print("Call MCP server directly for consumption recommendation after login.")
-            async with httpx.AsyncClient(timeout=settings.HTTPX_TIMEOUT) as client:
-                mcp_response = await client.post(
-                    f"{settings.MCP_SERVER_URL}/tools/consumption_recommend",
-                    json={
-                        "session_id": str(req_session_id),
-                        "persona_id": connection_manager.active_connections[req_session_id]["persona_id"]
-                    }
-                )
-                mcp_response.raise_for_status()
-                payload = mcp_response.json()
-                print(f"MCP response payload: {payload}")
-
-                timestamp = datetime.now(timezone.utc).isoformat()
-                res_payload = {
-                        'sender': 'bot',
-                        'timestamp': timestamp,
-                        'message_id': str(
-                            connection_manager.active_connections[req_session_id]["user_chat_id"]
-                        ),
-                        'login_required': False,
-                        'message': payload['answer'],
-                        'card_list': payload['card_list']
-                    }
-                print(f"---[/api/login/] Response payload to send: {res_payload}")
-
-                tool_metadata = {
-                    'card_list': res_payload['card_list'],
-                    'login_required': res_payload['login_required']
+            logger.info("login.recommend_requested", session_id=req_session_id)
+            recommend_start = time.perf_counter()
+            client = http_clients.get("mcp")
+            async with mcp_admission.slot():
+                with mcp_request_seconds.labels("consumption_recommend").time():
+                    mcp_response = await client.post(
+                        f"{settings.MCP_SERVER_URL}/tools/consumption_recommend",
+                        json={
+                            "session_id": str(req_session_id),
+                            "persona_id": req.persona_id
+                        }
+                    )
+            mcp_response.raise_for_status()
+            payload = serialization.loads(mcp_response.content)
+            logger.debug("mcp.response_payload", session_id=req_session_id, payload=payload)
+
+            timestamp = datetime.now(timezone.utc).isoformat()
+            res_payload = {
+                    'sender': 'bot',
+                    'timestamp': timestamp,
+                    'message_id': str(session["user_chat_id"]),
+                    'login_required': False,
+                    'message': payload['answer'],
+                    'card_list': payload['card_list']
                 }
-                try:
-                    # 챗봇 응답 전송 & 저장 병렬 처리
-                    async with get_async_context_db() as db:
-                        task_send_user = connection_manager.active_connections[req_session_id]["websocket"].send_json(res_payload)
-                        task_save_res = crud.chat.create_chatbot_chat(
-                            db, req_session_id, connection_manager.active_connections[req_session_id]["persona_id"],
-                            res_payload['message'], connection_manager.active_connections[req_session_id]["user_chat_id"],
-                            "consumption_recommend", tool_metadata
-                        )
-                        await asyncio.gather(task_send_user, task_save_res)
-                except Exception as e:
-                    print(f"Error during parallel send/save bot response: {e}")
-                print(f"Sent bot response to session_id {req_session_id}: {res_payload['message']}")
-                
+            logger.debug("login.response_payload", session_id=req_session_id, payload=res_payload)
+
+            tool_metadata = {
+                'card_list': res_payload['card_list'],
+                'login_required': res_payload['login_required']
+            }
+            try:
+                # 챗봇 응답 전송 & 저장 병렬 처리 (다른 워커 소유 세션이면 소유 워커가 전송)
+                task_send_user = connection_manager.send_json(req_session_id, res_payload)
+                task_save_res = chat_writer.save_chatbot_chat(
+                    req_session_id, req.persona_id,
+                    res_payload['message'], session["user_chat_id"],
+                    "consumption_recommend", tool_metadata
+                )
+                await asyncio.gather(task_send_user, task_save_res)
+            except Exception as e:
+                logger.error("login.send_failed", session_id=req_session_id, error=str(e))
+            login_recommend_seconds.observe(time.perf_counter() - recommend_start)
+            logger.info("login.response_sent", session_id=req_session_id, cards=len(res_payload['card_list'] or []))
+            
         except httpx.RequestError as e:
-            print(f"--- HTTPX Request Error to MCP Server: {e}")
+            logger.error("mcp.request_failed", session_id=req_session_id, error=str(e))
             raise HTTPException(
                 status_code=502,
                 detail="Bad Gateway: MCP server request failed"
             )
+        except AdmissionRejected as e:
+            # MCP 서버 동시 호출 한도 초과 시 대기하지 않고 바로 거절
+            logger.warning("mcp.rejected", session_id=req_session_id, reason=str(e))
+            raise HTTPException(
+                status_code=503,
+                detail="Service Unavailable: MCP server is busy, try again later",
+                headers={"Retry-After": "1"}
+            )
 
+    except HTTPException:
+        raise
     except SQLAlchemyError as e:
-        print(f"--- DB Error in /login: {e}")
+        logger.error("login.db_error", session_id=req_session_id, error=str(e))
         raise HTTPException(
             status_code=500,
             detail="Internal Server Error: DB operation failed"
         )
     except Exception as e:
-        print(f"--- Unknown Error in /login: {e}")
+        logger.exception("login.unknown_error", session_id=req_session_id)
         raise HTTPException(
             status_code=500,
             detail="Internal Server Error: Unknown error occurred"
         )
 
 @router.get("/personas", response_model=PersonaListResponse)
-async def get_personas(db: SessionDep):
-    """ 사용자 페르소나 목록을 조회합니다. """
+async def get_personas(if_none_match: Optional[str] = Header(default=None)):
+    """ 사용자 페르소나 목록을 조회합니다. (ETag 일치 시 304) """
     try:
-        # DB에서 페르소나 목록 조회
-        personas = await crud.persona.get_personas(db)
-        return {"personas": personas}
+        # 인메모리 카탈로그에서 미리 직렬화된 응답 반환 (DB 조회 없음)
+        return await persona_catalog.response(if_none_match)
     except SQLAlchemyError as e:
         # DB 연결 실패, 쿼리 오류 등 SQLAlchemy 관련 오류가 발생한 경우
-        print(f"--- DB Error in /personas: {e}")
+        logger.error("personas.db_error", error=str(e))
         raise HTTPException(
             status_code=500,
             detail="Internal Server Error: DB operation failed"
         )
     except Exception as e:
         # 기타 알 수 없는 오류가 발생한 경우
-        print(f"--- Unknown Error in /personas: {e}")
+        logger.exception("personas.unknown_error")
         raise HTTPException(
             status_code=500,
             detail="Internal Server Error: Unknown error occurred"
@@ -155,11 +172,12 @@ async def get_persona_id(req: PersonaRequest):
     
     # 실제 서비스에서는 로그인 처리 로직 구현
     # connection_manager에 세션 ID가 존재하는지 확인
-    if req_session_id not in connection_manager.active_connections:
+    session = await connection_manager.get_session(req_session_id)
+    if session is None:
         # 존재하지 않는 세션ID로 요청한 경우
         raise HTTPException(status_code=404, detail="Session not found")
 
     # 페르소나 ID 반환
     return {
-        "persona_id": connection_manager.active_connections[req_session_id]["persona_id"]
+        "persona_id": session["persona_id"]
     }
\ No newline at end of file
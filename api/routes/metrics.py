@@ -0,0 +1,93 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from core.admission import llm_admission, mcp_admission
+from core.chat_writer import chat_writer
+from core.db import pool_stats
+from core.llm_cache import llm_cache
+from core.metrics import metrics_registry
+from core.qna_cache import qna_cache
+from core.readiness import readiness_probe
+
+
+router = APIRouter(tags=['Metrics'])
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# ----- 기존 컴포넌트 카운터 노출 (수집 시점에만 읽으므로 요청 경로 비용 없음) -----
+def _qna_cache_hit_ratio():
+    ratios = {}
+    for kind, hits, misses in (
+        ("faq", qna_cache.faq_hits, qna_cache.faq_misses),
+        ("term", qna_cache.term_hits, qna_cache.term_misses),
+    ):
+        ratios[(kind,)] = hits / (hits + misses) if hits + misses else 0.0
+    return ratios
+
+metrics_registry.callback(
+    "qna_cache_lookups_total", "FAQ/term cache lookups (hit includes fuzzy_hit)", "counter",
+    lambda: {
+        ("faq", "hit"): qna_cache.faq_hits,
+        ("faq", "fuzzy_hit"): qna_cache.faq_fuzzy_hits,
+        ("faq", "miss"): qna_cache.faq_misses,
+        ("term", "hit"): qna_cache.term_hits,
+        ("term", "fuzzy_hit"): qna_cache.term_fuzzy_hits,
+        ("term", "miss"): qna_cache.term_misses,
+    },
+    ("kind", "result")
+)
+metrics_registry.callback(
+    "qna_cache_hit_ratio", "FAQ/term cache hit ratio since start", "gauge", _qna_cache_hit_ratio, ("kind",)
+)
+metrics_registry.callback(
+    "llm_cache_lookups_total", "LLM response cache lookups", "counter",
+    lambda: {("hit",): llm_cache.hits, ("miss",): llm_cache.misses},
+    ("result",)
+)
+metrics_registry.callback(
+    "upstream_queue_depth", "Calls waiting for an upstream admission slot", "gauge",
+    lambda: {(admission.name,): admission.stats()["queue_depth"] for admission in (llm_admission, mcp_admission)},
+    ("upstream",)
+)
+metrics_registry.callback(
+    "upstream_rejected_total", "Upstream calls rejected by admission control", "counter",
+    lambda: {
+        (admission.name, reason): getattr(admission, f"rejected_{reason}")
+        for admission in (llm_admission, mcp_admission)
+        for reason in ("queue_full", "timeout")
+    },
+    ("upstream", "reason")
+)
+metrics_registry.callback(
+    "chat_write_queue_depth", "Chat messages waiting for write-behind flush", "gauge",
+    lambda: chat_writer.stats()["pending"]
+)
+
+metrics_registry.callback(
+    "db_pool_in_use", "DB connections checked out from the pool", "gauge",
+    lambda: {(name,): stats["in_use"] for name, stats in pool_stats().items()},
+    ("engine",)
+)
+metrics_registry.callback(
+    "db_pool_overflow", "DB connections opened beyond pool_size", "gauge",
+    lambda: {(name,): stats["overflow"] for name, stats in pool_stats().items()},
+    ("engine",)
+)
+metrics_registry.callback(
+    "db_pool_size", "Configured DB pool size (excluding overflow)", "gauge",
+    lambda: {(name,): stats["pool_size"] for name, stats in pool_stats().items()},
+    ("engine",)
+)
+
+metrics_registry.callback(
+    "dependency_up", "Last readiness probe result per dependency (1 = up)", "gauge",
+    lambda: {(name,): up for name, up in readiness_probe.dependency_up().items()},
+    ("dependency",)
+)
+
+
+@router.get('/metrics', response_class=PlainTextResponse)
+def metrics():
+    """ Prometheus 텍스트 형식 메트릭 """
+    return PlainTextResponse(metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -2,59 +2,228 @@ from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException
 from sqlalchemy.exc import SQLAlchemyError
 
 from datetime import datetime, timezone
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, Callable, List, Optional, Tuple, Union
 from uuid import UUID, uuid4
 
 import json
+import time
 import httpx
 import asyncio
 
+from pydantic import ValidationError
+
 import crud.session
 import crud.persona
 import crud.qna
 import crud.chat
 
-from api.routes.qna import faq_cache, terms_cache
 
 from core.config import settings
 from core.db import get_async_context_db
+from core import llm, serialization
+from core.admission import AdmissionRejected
+from core.card_registry import CardRegistry
+from core.metrics import ws_active_connections, ws_compressed_frames_total, ws_messages_total
+from core.log import get_logger
+from core.chat_writer import chat_writer
+from core.view_counter import view_counter
+from core.qna_cache import qna_cache
+from core.session_registry import SessionRegistry, session_registry
+from schemas.ws import ClientMessage, ServerFrame, client_message_adapter
+
+
+class ConnectionState:
+    """
+    WebSocket 연결별 상태 (유휴 연결이 많아도 메모리 사용이 작도록 __slots__ 사용)
+    """
+    __slots__ = (
+        "websocket", "binary", "cards", "compress_threshold",
+        "persona_id", "user_chat_id", "connected_at", "last_activity", "message_count"
+    )
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        binary: bool = False,
+        cards: Optional[CardRegistry] = None,
+        compress_threshold: int = 0
+    ):
+        self.websocket = websocket
+        self.binary = binary                      # msgpack 서브프로토콜 연결 여부 (MessagePack 바이너리 프레임)
+        self.cards = cards                        # 카드 참조 전송 시 이 연결에 보낸 카드 목록
+        self.compress_threshold = compress_threshold # 이 크기 이상 프레임 압축 (0이면 비압축)
+        self.persona_id: Optional[int] = None     # 로그인 시 할당
+        self.user_chat_id: Optional[str] = None   # 로그인을 유발한 유저의 챗 ID
+        self.connected_at = time.time()
+        self.last_activity = self.connected_at
+        self.message_count = 0
+
+    def touch(self):
+        """ 메세지 수신 시 활동 시각/메세지 수 갱신 """
+        self.last_activity = time.time()
+        self.message_count += 1
 
+    async def send(self, payload: ServerFrame):
+        """
+        협상된 프레임 형식(JSON 텍스트 / MessagePack 바이너리)으로 전송
+        - 카드 참조 사용 시 이미 보낸 카드는 card_ref로 대체 (전송 순서대로 변환하므로 본문이 항상 먼저 전달됨)
+        - 압축 사용 시 큰 프레임은 deflate로 압축
+        """
+        if self.cards is not None and payload.get('card_list'):
+            payload = {**payload, 'card_list': self.cards.encode(payload['card_list'])}
+        if await serialization.send_frame(self.websocket, payload, self.binary, self.compress_threshold):
+            ws_compressed_frames_total.inc()
+
+    async def receive(self) -> Union[str, bytes]:
+        """ 텍스트/바이너리 프레임 수신 (연결 종료 시 WebSocketDisconnect) """
+        message = await self.websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+        if message.get("bytes") is not None:
+            return message["bytes"]
+        return message["text"]
+
+def select_subprotocol(requested: List[str]) -> Optional[str]:
+    """
+    클라이언트가 요청한 서브프로토콜 중 사용할 프로토콜 선택
+    - msgpack: msgpack 패키지 설치 & WS_MSGPACK_ENABLED인 경우 MessagePack 바이너리 프레임 사용
+    - 그 외: JSON 텍스트 프레임 ("json"을 요청했으면 그대로 응답)
+    """
+    if (
+        serialization.MSGPACK_SUBPROTOCOL in requested
+        and serialization.MSGPACK_AVAILABLE and settings.WS_MSGPACK_ENABLED
+    ):
+        return serialization.MSGPACK_SUBPROTOCOL
+    return "json" if "json" in requested else None
+
+def connection_options(websocket: WebSocket) -> Dict[str, Any]:
+    """
+    연결 URL 쿼리 파라미터로 요청한 전송 옵션 (기존 클라이언트는 옵션 없이 전체 card_list/비압축 프레임 수신)
+    - card_refs=true: 이미 보낸 카드는 참조만 전송
+    - compress=deflate: WS_COMPRESSION_THRESHOLD 이상 프레임 압축
+    """
+    params = websocket.query_params
+    cards = None
+    if settings.WS_CARD_REFS_ENABLED and params.get("card_refs", "").lower() in ("1", "true"):
+        cards = CardRegistry(settings.WS_CARD_REGISTRY_MAX)
+    compress_threshold = settings.WS_COMPRESSION_THRESHOLD if params.get("compress") == "deflate" else 0
+    return {"cards": cards, "compress_threshold": compress_threshold}
+
+def parse_client_message(data: Union[str, bytes], binary: bool) -> ClientMessage:
+    """
+    수신 프레임을 ClientMessage로 검증
+    - msgpack 연결의 바이너리 프레임: MessagePack
+    - 그 외 텍스트/바이너리 프레임: JSON
+    형식 오류 시 ValueError (ValidationError, json.JSONDecodeError 포함)
+    """
+    if binary and isinstance(data, bytes):
+        return client_message_adapter.validate_python(serialization.unpack(data))
+    return serialization.validate_json(client_message_adapter, data)
 
 class ConnectionManager:
     """
     WebSocket 연결 관리를 담당하는 클래스
+    - 이 워커에 연결된 세션은 active_connections에 보관
+    - 다른 워커(노드)에 연결된 세션은 세션 레지스트리를 통해 조회하고, 전송/갱신 명령을 소유 워커로 전달
     """
-    def __init__(self):
-        # 세션ID 와 사용자 페르소나 ID & 웹소켓 객체 매핑
-        self.active_connections: Dict[UUID, Dict[str, int | WebSocket]] = {}
+    def __init__(self, registry: SessionRegistry):
+        # 세션ID 와 연결 상태(웹소켓 객체, 페르소나 ID 등) 매핑
+        self.active_connections: Dict[UUID, ConnectionState] = {}
+        self.registry = registry
+        self.registry.bind(self._deliver)
 
-    async def connect(self, session_id: UUID, websocket: WebSocket):
+    async def connect(self, session_id: UUID, websocket: WebSocket) -> ConnectionState:
         """ 세션ID와 웹소켓 객체 매핑 & 페르소나 ID는 로그인 시 할당 """
-        await websocket.accept()
-        self.active_connections[session_id] = {
-            "websocket": websocket,
-            "persona_id": None,
-            "user_chat_id": None # 로그인을 유발한 유저의 챗 ID
-        }
+        subprotocol = select_subprotocol(websocket.scope.get("subprotocols", []))
+        await websocket.accept(subprotocol=subprotocol)
+        state = self.active_connections[session_id] = ConnectionState(
+            websocket, binary=subprotocol == serialization.MSGPACK_SUBPROTOCOL, **connection_options(websocket)
+        )
+        await self.registry.register(session_id)
+        return state
 
-    def disconnect(self, session_id: UUID):
+    async def disconnect(self, session_id: UUID):
         """ 채팅 세션 종료 시 세션 매핑 삭제 """
         if session_id in self.active_connections:
             del self.active_connections[session_id]
+            try:
+                await self.registry.unregister(session_id)
+            except Exception as e:
+                logger.warning("session.unregister_failed", session_id=session_id, error=str(e))
 
-    def update_persona_id(self, session_id: UUID, persona_id: int):
-        """ 로그인 시 세션의 페르소나 ID 업데이트 """
-        if session_id in self.active_connections:
-            self.active_connections[session_id]["persona_id"] = persona_id
+    async def get_session(self, session_id: UUID) -> Optional[Dict[str, Any]]:
+        """ 세션의 persona_id, user_chat_id 조회 (어느 워커에도 연결되지 않은 세션이면 None) """
+        state = self.active_connections.get(session_id)
+        if state is not None:
+            return {"persona_id": state.persona_id, "user_chat_id": state.user_chat_id}
+        return await self.registry.lookup(session_id)
+
+    async def update_persona_id(self, session_id: UUID, persona_id: int):
+        """ 로그인 시 세션의 페르소나 ID 업데이트 (다른 워커 소유 세션이면 소유 워커에 전달) """
+        await self.registry.update(session_id, persona_id=persona_id)
+        state = self.active_connections.get(session_id)
+        if state is not None:
+            state.persona_id = persona_id
+        else:
+            await self.registry.publish(session_id, {"type": "update_persona", "persona_id": persona_id})
+
+    async def set_user_chat_id(self, session_id: UUID, user_chat_id: str):
+        """ 로그인이 필요한 응답을 유발한 유저 챗 ID 기록 """
+        state = self.active_connections.get(session_id)
+        if state is not None:
+            state.user_chat_id = user_chat_id
+            await self.registry.update(session_id, user_chat_id=user_chat_id)
+
+    async def send_json(self, session_id: UUID, payload: ServerFrame) -> bool:
+        """ 세션 웹소켓으로 JSON 전송 (다른 워커 소유 세션이면 소유 워커에 전달) """
+        state = self.active_connections.get(session_id)
+        if state is not None:
+            await state.send(payload)
+            return True
+        return await self.registry.publish(session_id, {"type": "send_json", "payload": payload})
 
-    async def send_personal_message(self, message: str, session_id: UUID):
-        """ 특정 세션ID의 웹소켓으로 메시지 전송 """
-        websocket = self.active_connections.get(session_id).get("websocket")
-        if websocket:
-            await websocket.send_text(message)
+    async def _deliver(self, session_id: UUID, command: Dict[str, Any]) -> bool:
+        """ 다른 워커에서 전달된 명령 처리 """
+        state = self.active_connections.get(session_id)
+        if state is None:
+            return False
+        if command.get("type") == "send_json":
+            await state.send(command["payload"])
+        elif command.get("type") == "update_persona":
+            state.persona_id = command["persona_id"]
+        else:
+            logger.warning("session.unknown_command", session_id=session_id, command_type=command.get("type"))
+            return False
+        return True
 
-connection_manager = ConnectionManager()
+    def stats(self) -> Dict[str, Any]:
+        """ 이 워커에 연결된 세션 수 및 누적 메세지 수 """
+        return {
+            "connections": len(self.active_connections),
+            "messages": sum(state.message_count for state in self.active_connections.values())
+        }
+
+connection_manager = ConnectionManager(session_registry)
+ws_active_connections.set_function(lambda: len(connection_manager.active_connections))
 router = APIRouter(prefix="/chat", tags=["Chat"])
+logger = get_logger(__name__)
+
+# 메세지별 전송 큐 제어 신호
+_END = object()   # 해당 메세지의 프레임 전송 완료
+_FATAL = object() # 처리 중 알 수 없는 오류 발생 -> 연결 종료
+
+# LLM 서버 동시 호출 한도 초과 시 응답 메세지
+BUSY_MESSAGE = "현재 요청이 많아 답변을 드릴 수 없습니다. 잠시 후 다시 시도해주세요."
+
+
+class PendingMessage:
+    """ 세션 내 처리 대기/진행 중인 메세지 (수신 순서대로 응답 전송) """
+    __slots__ = ("outbox", "saved", "task")
+
+    def __init__(self):
+        self.outbox: asyncio.Queue = asyncio.Queue() # 전송할 프레임
+        self.saved = asyncio.Event() # 사용자 메세지 저장 완료 (저장 순서 보장용)
+        self.task: Optional[asyncio.Task] = None
 
 @router.websocket("/ws")
 async def websocket_chat(websocket: WebSocket):
@@ -62,164 +231,247 @@ async def websocket_chat(websocket: WebSocket):
         # 추후 로그인 시 페르소나 ID 업데이트
     session_id = uuid4()
     # WS 연결 수립
-    await connection_manager.connect(session_id, websocket)
-    await connection_manager.send_personal_message(
-        json.dumps({"session_id": str(session_id)}), session_id
-    )
+    state = await connection_manager.connect(session_id, websocket)
+    await state.send({"session_id": str(session_id)})
 
     # PG 저장 예외 처리
     try:
         async with get_async_context_db() as db:
             await crud.session.create_chat_session(db, session_id, None)
     except SQLAlchemyError as e:
-        print(f"--- DB Error in websocket /ws/{session_id}: {e}")
-        await connection_manager.active_connections[session_id]["websocket"].close(code=1011)
+        logger.error("ws.db_error", session_id=session_id, stage="create_session", error=str(e))
+        await websocket.close(code=1011)
+        await connection_manager.disconnect(session_id)
         return
     except Exception as e:
-        print(f"--- Unknown Error in websocket /ws/{session_id}: {e}")
-        await connection_manager.active_connections[session_id]["websocket"].close(code=1011)
+        logger.exception("ws.unknown_error", session_id=session_id)
+        await websocket.close(code=1011)
+        await connection_manager.disconnect(session_id)
         return
     
-    llm_endpoint = f"{settings.LLMSERVER_URL.rstrip('/')}/llm/mcp-router/dispatch"
-    print(f"WebSocket connection established for session_id: {session_id}")
+    logger.info("ws.connected", session_id=session_id)
 
     try:
-        async with httpx.AsyncClient(timeout=settings.HTTPX_TIMEOUT) as client:
-            while True:
-                try:
-                    # 세션의 페르소나 ID 조회
-                    persona_id = connection_manager.active_connections[session_id]["persona_id"]
-                    # 사용자가 전송한 데이터 변수화
-                    data = await connection_manager.active_connections[session_id]["websocket"].receive_text()
-                    
-                    # JSON 파싱 예외 처리
-                    try:
-                        req_payload = json.loads(data)
-                        if not isinstance(req_payload, dict):
-                            raise ValueError("Payload is not a JSON object")
-                    except (json.JSONDecodeError, ValueError) as e:
-                        print(f"Invalid JSON received from {session_id}: {e}")
-                        await connection_manager.active_connections[session_id]["websocket"].send_json(
-                            {"error": "Invalid JSON format"}
-                        )
-                        continue
-
-                    # 사용자 메세지 DB 저장
-                    try:
-                        async with get_async_context_db() as db:
-                            user_chat = await crud.chat.create_user_chat(
-                                db, req_payload['message_id'],
-                                session_id, persona_id, req_payload['message']
-                            )
-                    except SQLAlchemyError as e:
-                        print(f"--- DB Error saving user chat for session_id {session_id}: {e}")
-                        await connection_manager.active_connections[session_id]["websocket"].send_json(
-                            {"error": "Internal Server Error: DB operation failed"}
-                        )
-                        continue
-                    # 사용자에게 WS로 전송할 페이로드 준비
-                    timestamp = datetime.now(timezone.utc).isoformat()
-                    res_payload = {
-                        'sender': 'bot',
-                        'timestamp': timestamp,
-                        'message_id': str(user_chat.id),
-                        'login_required': False
-                    }
-                    print(f"Received message from session_id {session_id}: {req_payload['message']}")
-                    
-                    try:
-                        tool_metadata = {}
-                        # 캐싱된 QnA 질문인지 확인
-                        # faq 캐시 확인
-                        if req_payload['message'] in faq_cache:
-                            # 있는 경우 view 수 증가 및 바로 응답
-                            res_payload['message'] = faq_cache[req_payload['message']]['answer']
-                            await crud.qna.increment_faq_view_count(req_payload['message'])
-                            print(f"FAQ cache hit: {req_payload['message']} -> {res_payload['message']}")
-                        # term 캐시 확인
-                        elif req_payload['message'] in terms_cache:
-                            # 있는 경우 view 수 증가 및 바로 응답
-                            res_payload['message'] = terms_cache[req_payload['message']]['definition']
-                            await crud.qna.increment_term_view_count(req_payload['message'])
-                            print(f"Term cache hit: {req_payload['message']} -> {res_payload['message']}")
-                        # LLM 호출 및 응답 생성 (캐싱된 답변이 없는 경우)
-                        else:
-                            response = await client.post(
-                                llm_endpoint,
-                                json={
-                                    "query": req_payload['message'],
-                                    "session_id": str(session_id)
-                                }
-                            )
-                            response.raise_for_status()
-                            payload = response.json()
-                            print(f"LLM response payload for session_id {session_id}: {payload}")
-
-                            # 툴이 호출된 응답인 경우
-                            if "tool_response" in payload and payload["tool_response"]:
-                                print("Tool response detected in LLM reply.")
-                                res_payload['message'] = payload["tool_response"]["tool_response_content"]["answer"]
-                                # 로그인이 필요한 툴 호출인 경우
-                                if "login_required" in payload["tool_response"]["tool_response_content"]:
-                                    res_payload['login_required'] = payload["tool_response"]["tool_response_content"]["login_required"]
-                                    connection_manager.active_connections[session_id]["user_chat_id"] = res_payload['message_id']
-                                    tool_metadata['login_required'] = res_payload['login_required']
-                                    print(f"Login required for tool response: {res_payload['login_required']}")
-                                # 관련 FAQ가 있는 경우 FAQ 답변도 함께 전송
-                                if "relatedQuestions" in payload["tool_response"]["tool_response_content"]:
-                                    res_payload['related_questions'] = payload["tool_response"]["tool_response_content"]["relatedQuestions"]
-                                    tool_metadata['related_questions'] = res_payload['related_questions']
-                                    print(f"Related FAQ included in response: {res_payload['related_questions']}")
-                                # 카드 리스트가 있는 경우 함께 전송
-                                if 'card_list' in payload["tool_response"]["tool_response_content"]:
-                                    res_payload['card_list'] = payload["tool_response"]["tool_response_content"]['card_list']
-                                    tool_metadata['card_list'] = res_payload['card_list']
-                                    print(f"Card list included in response: {res_payload['card_list']}")
-                                # 호출된 툴 정보 파싱
-                                if 'tool_name' in payload["tool_response"]:
-                                    res_payload['tool_name'] = payload["tool_response"]['tool_name']
-                                    print(f"Tool name included in response: {res_payload['tool_name']}")
-                            # 챗봇 표준 응답인 경우
-                            else:
-                                print("Standard LLM response detected.")
-                                res_payload['message'] = payload["answer"]
-                            if not isinstance(res_payload['message'], str) or not res_payload['message']:
-                                raise ValueError("LLM 서버 응답 형식이 올바르지 않습니다.")
-                    except httpx.HTTPStatusError as exc:
-                        res_payload['message'] = f"LLM 서버 오류 (HTTP {exc.response.status_code})"
-                    except (httpx.RequestError, ValueError) as e:
-                        res_payload['message'] = f"LLM 서버 통신 오류: {e}"
-                    # 봇 응답 전송&저장 병렬 처리
-                    finally:
-                        print("Response Payload", res_payload)
-                        try:
-                            # 챗봇 응답 전송 & 저장 병렬 처리
-                            async with get_async_context_db() as db:
-                                task_send_user = connection_manager.active_connections[session_id]["websocket"].send_json(res_payload)
-                                task_save_res = crud.chat.create_chatbot_chat(
-                                    db, session_id, persona_id,
-                                    res_payload['message'], user_chat.id,
-                                    res_payload['tool_name'] if 'tool_name' in res_payload else None,
-                                    tool_metadata
-                                )
-                                await asyncio.gather(task_send_user, task_save_res)
-                        except Exception as e:
-                            print(f"Error during parallel send/save bot response: {e}")
-                        print(f"Sent bot response to session_id {session_id}: {res_payload['message']}")
-                # 루프 내부 개별 메세지 예외 처리
-                except Exception as e:
-                    print(f"--- Unknown Error in message handling loop for session_id {session_id}: {e}")
-                    try:
-                        await connection_manager.active_connections[session_id]["websocket"].send_json(
-                            {"error": "Internal Server Error: Unknown error occurred"}
-                        )
-                    except Exception:
-                        pass
-                    break
+        await _serve_messages(session_id, state)
+        # 메세지 처리 중 알 수 없는 오류(_FATAL)로 전송이 중단된 경우 연결 종료
+        await websocket.close(code=1011)
     except WebSocketDisconnect:
-        print(f"WebSocket disconnected for session_id: {session_id}")
+        logger.info("ws.disconnected", session_id=session_id)
+    except Exception as e:
+        logger.exception("ws.unknown_error", session_id=session_id)
+        try:
+            await websocket.close(code=1011)
+        except Exception:
+            pass
+    finally:
+        await connection_manager.disconnect(session_id)
+        logger.info("ws.closed", session_id=session_id, messages=state.message_count)
+
+async def _serve_messages(session_id: UUID, state: ConnectionState):
+    """
+    수신(reader)과 전송(sender)을 분리하여 메세지 처리
+      - reader: 메세지를 받는 즉시 처리 태스크를 만들고 다음 메세지 수신 (연결 종료 즉시 감지)
+      - 처리 태스크: 세션당 WS_SESSION_CONCURRENCY개까지 동시 처리
+      - sender: 처리 결과를 수신 순서대로 전송
+    연결 종료 시 WebSocketDisconnect, 메세지 처리 중 알 수 없는 오류 발생 시 그대로 반환하며
+    종료 전에 대기/진행 중인 메세지 처리를 모두 취소
+    """
+    pending: asyncio.Queue[PendingMessage] = asyncio.Queue(maxsize=settings.WS_SESSION_QUEUE_SIZE)
+    in_flight: set[PendingMessage] = set()
+    semaphore = asyncio.Semaphore(settings.WS_SESSION_CONCURRENCY)
+    reader = asyncio.create_task(_read_messages(session_id, state, pending, in_flight, semaphore))
+    sender = asyncio.create_task(_send_in_order(state, pending))
+
+    try:
+        done, _ = await asyncio.wait({reader, sender}, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            task.result() # 종료 원인 예외 전파
+    finally:
+        # 종료된 연결의 대기/진행 중인 메세지 처리 즉시 취소 (취소 완료 후 연결 정리)
+        tasks = [reader, sender, *(message.task for message in in_flight)]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+async def _read_messages(
+    session_id: UUID,
+    state: ConnectionState,
+    pending: asyncio.Queue,
+    in_flight: set,
+    semaphore: asyncio.Semaphore
+):
+    """ 메세지를 수신하여 처리 태스크 생성 (대기 큐가 가득 차면 수신 대기) """
+    previous: Optional[PendingMessage] = None
+    while True:
+        data = await state.receive()
+        state.touch()
+        ws_messages_total.inc()
+        message = PendingMessage()
+        await pending.put(message)
+        message.task = asyncio.create_task(
+            _process_message(session_id, state, data, message, previous, semaphore)
+        )
+        in_flight.add(message)
+        message.task.add_done_callback(lambda _, message=message: in_flight.discard(message))
+        previous = message
+
+async def _send_in_order(state: ConnectionState, pending: asyncio.Queue):
+    """ 메세지 수신 순서대로 각 메세지의 프레임을 전송 """
+    while True:
+        message = await pending.get()
+        while True:
+            frame = await message.outbox.get()
+            if frame is _END:
+                break
+            if frame is _FATAL:
+                return
+            await state.send(frame)
+
+async def _process_message(
+    session_id: UUID,
+    state: ConnectionState,
+    data: Union[str, bytes],
+    message: PendingMessage,
+    previous: Optional[PendingMessage],
+    semaphore: asyncio.Semaphore
+):
+    """ 메세지 하나를 처리하고 전송할 프레임을 outbox에 적재 """
+    emit = message.outbox.put_nowait
+    try:
+        async with semaphore:
+            await _handle_message(session_id, state, data, emit, message, previous)
+    # 개별 메세지 처리 중 알 수 없는 오류 발생 시 오류 전송 후 연결 종료
     except Exception as e:
-        print(f"--- Unknown Error in websocket /ws/{session_id}: {e}")
-        await connection_manager.active_connections[session_id]["websocket"].close(code=1011)
+        logger.exception("ws.message_failed", session_id=session_id)
+        emit({"error": "Internal Server Error: Unknown error occurred"})
+        emit(_FATAL)
     finally:
-        print(f"WebSocket connection closed for session_id: {session_id}")
\ No newline at end of file
+        message.saved.set()
+        emit(_END)
+
+async def _handle_message(
+    session_id: UUID,
+    state: ConnectionState,
+    data: Union[str, bytes],
+    emit: Callable[[Any], None],
+    message: PendingMessage,
+    previous: Optional[PendingMessage]
+):
+    # 동시 처리 중에도 사용자 메세지가 수신 순서대로 저장되도록 이전 메세지 저장 완료 대기
+    if previous is not None:
+        await previous.saved.wait()
+    # 세션의 페르소나 ID 조회
+    persona_id = state.persona_id
+    
+    # 메세지 형식 검증 (JSON/MessagePack 파싱 오류, 필수 필드 누락)
+    try:
+        req = parse_client_message(data, state.binary)
+    except ValidationError as e:
+        errors = e.errors(include_url=False, include_input=False)
+        logger.warning("ws.invalid_message", session_id=session_id, errors=errors)
+        if any(error["type"] in ("json_invalid", "model_type", "model_attributes_type") for error in errors):
+            emit({"error": "Invalid JSON format"})
+        else:
+            emit({"error": "Invalid message format"})
+        return
+    except json.JSONDecodeError as e:
+        logger.warning("ws.invalid_message", session_id=session_id, error=str(e))
+        emit({"error": "Invalid JSON format"})
+        return
+    except ValueError as e:
+        logger.warning("ws.invalid_message", session_id=session_id, error=str(e))
+        emit({"error": "Invalid message format"})
+        return
+
+    # 사용자 메세지 DB 저장 (write-behind 활성화 시 큐 적재만 수행)
+    try:
+        user_chat_id = await chat_writer.save_user_chat(
+            req.message_id,
+            session_id, persona_id, req.message
+        )
+    except crud.chat.DuplicateChatId as e:
+        logger.warning("ws.duplicate_message_id", session_id=session_id, error=str(e))
+        emit({"error": "Duplicate message_id"})
+        return
+    except SQLAlchemyError as e:
+        logger.error("ws.db_error", session_id=session_id, stage="save_user_chat", error=str(e))
+        emit({"error": "Internal Server Error: DB operation failed"})
+        return
+    finally:
+        message.saved.set()
+    # 사용자에게 WS로 전송할 페이로드 준비
+    timestamp = datetime.now(timezone.utc).isoformat()
+    res_payload = {
+        'sender': 'bot',
+        'timestamp': timestamp,
+        'message_id': user_chat_id,
+        'login_required': False
+    }
+    # 스트리밍을 요청한 클라이언트는 delta 프레임 이후 최종 프레임을 구분할 수 있도록 type 지정
+    stream_requested = req.stream and settings.LLM_STREAMING_ENABLED
+    if stream_requested:
+        res_payload['type'] = 'final'
+    logger.info("ws.message_received", session_id=session_id, message_id=user_chat_id, stream=stream_requested)
+    logger.debug("ws.message_body", message_id=user_chat_id, message=req.message)
+    
+    try:
+        tool_metadata = {}
+        # 캐싱된 QnA 질문인지 확인
+        # faq 캐시 확인
+        if (faq_item := qna_cache.get_faq(req.message)) is not None:
+            # 있는 경우 view 수 증가 및 바로 응답
+            res_payload['message'] = faq_item['answer']
+            view_counter.incr_faq(faq_item['question'])
+            logger.info("qna.cache_hit", session_id=session_id, kind="faq", key=faq_item['question'])
+        # term 캐시 확인
+        elif (term_item := qna_cache.get_term(req.message)) is not None:
+            # 있는 경우 view 수 증가 및 바로 응답
+            res_payload['message'] = term_item['definition']
+            view_counter.incr_term(term_item['term'])
+            logger.info("qna.cache_hit", session_id=session_id, kind="term", key=term_item['term'])
+        # LLM 호출 및 응답 생성 (캐싱된 답변이 없는 경우)
+        else:
+            if stream_requested:
+                async def send_delta(delta: str):
+                    emit({'type': 'delta', 'message_id': user_chat_id, 'delta': delta})
+                reply = await llm.dispatch_stream(
+                    req.message, session_id, persona_id, send_delta
+                )
+            else:
+                reply = await llm.dispatch(req.message, session_id, persona_id)
+            res_payload.update(reply)
+            # 로그인이 필요한 툴 호출인 경우 로그인 후 응답할 메세지 ID 기록
+            if 'login_required' in reply:
+                await connection_manager.set_user_chat_id(session_id, res_payload['message_id'])
+                tool_metadata['login_required'] = reply['login_required']
+                logger.info("llm.login_required", session_id=session_id, login_required=reply['login_required'])
+            # 관련 FAQ, 카드 리스트는 응답 메타데이터로 함께 저장
+            for field in ('related_questions', 'card_list'):
+                if field in reply:
+                    tool_metadata[field] = reply[field]
+            if 'tool_name' in reply:
+                logger.info("llm.tool_response", session_id=session_id, tool_name=reply['tool_name'])
+    except httpx.HTTPStatusError as exc:
+        res_payload['message'] = f"LLM 서버 오류 (HTTP {exc.response.status_code})"
+    except (httpx.RequestError, ValueError) as e:
+        res_payload['message'] = f"LLM 서버 통신 오류: {e}"
+    except AdmissionRejected as e:
+        # LLM 서버 동시 호출 한도 초과 시 대기하지 않고 바로 재시도 안내
+        logger.warning("llm.rejected", session_id=session_id, reason=str(e))
+        res_payload['message'] = BUSY_MESSAGE
+        res_payload['busy'] = True
+
+    # 봇 응답 전송&저장 병렬 처리
+    #   - 전송은 sender가 순서대로 수행하므로 전송 큐에 적재 후 바로 저장
+    logger.debug("ws.response_payload", session_id=session_id, payload=res_payload)
+    emit(res_payload)
+    try:
+        await chat_writer.save_chatbot_chat(
+            session_id, persona_id,
+            res_payload['message'], user_chat_id,
+            res_payload['tool_name'] if 'tool_name' in res_payload else None,
+            tool_metadata
+        )
+    except Exception as e:
+        logger.error("ws.db_error", session_id=session_id, stage="save_bot_chat", error=str(e))
+    logger.info("ws.response_sent", session_id=session_id, message_id=user_chat_id, tool_name=res_payload.get('tool_name'))
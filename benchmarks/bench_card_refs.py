@@ -0,0 +1,139 @@
+"""
+card_list 카드 참조 전송/큰 프레임 압축 효과 벤치마크
+
+- 한 세션에서 추천 응답 N턴을 재현 (턴마다 카탈로그에서 카드 K장을 뽑아 전송, 같은 카드가 반복 추천됨)
+- 전송 방식별로 프레임당 평균 바이트, 세션 전체 바이트, 프레임당 인코딩 시간(마이크로초)을 측정
+    - full: 기존 방식 (매번 카드 본문 전체)
+    - full+pmd: 기존 방식 + permessage-deflate (연결별 압축 컨텍스트 유지, 모든 프레임 압축)
+    - refs: 카드 참조 (?card_refs=true)
+    - refs+deflate: 카드 참조 + 임계값 이상 프레임만 압축 (?card_refs=true&compress=deflate)
+- permessage-deflate는 websockets 기본 설정(컨텍스트 유지)을 zlib으로 근사
+
+사용법 (프로젝트 루트에서 실행):
+    python -m benchmarks.bench_card_refs
+    python -m benchmarks.bench_card_refs --turns 50 --catalog 60 --cards 10 --threshold 1024 --json
+"""
+import argparse
+import json
+import random
+import time
+import zlib
+
+from typing import Any, Callable, Dict, List
+
+from core import serialization
+from core.card_registry import CardRegistry
+
+
+def make_catalog(n_cards: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "card_id": i,
+            "card_name": f"우리카드 {i}",
+            "card_image_url": f"https://example.com/cards/{i}.png",
+            "benefits": ["주유 할인 5%", "대중교통 10% 청구할인", "온라인 쇼핑 적립 2%", "커피 전문점 20% 할인"],
+            "annual_fee": 15000 + i * 1000,
+            "description": "생활 밀착형 혜택을 제공하는 카드입니다. " * 3
+        }
+        for i in range(n_cards)
+    ]
+
+
+def make_frames(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    rng = random.Random(args.seed)
+    # 인기 카드가 자주 추천되도록 앞쪽 카드에 가중치
+    catalog = make_catalog(args.catalog)
+    weights = [1 / (i + 1) for i in range(args.catalog)]
+    frames = []
+    for turn in range(args.turns):
+        picked = []
+        while len(picked) < min(args.cards, args.catalog):
+            card = rng.choices(catalog, weights)[0]
+            if card not in picked:
+                picked.append(card)
+        frames.append({
+            "sender": "bot",
+            "timestamp": "2025-01-01T00:00:00+00:00",
+            "message_id": f"message-{turn}",
+            "login_required": False,
+            "message": "고객님께 맞는 카드를 추천해드립니다.",
+            "tool_name": "card_recommend",
+            "card_list": picked
+        })
+    return frames
+
+
+def run_mode(frames: List[Dict[str, Any]], encode: Callable[[Dict[str, Any]], bytes], repeat: int) -> Dict[str, float]:
+    sizes: List[int] = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        sizes = [len(encode(frame)) for frame in frames]
+    elapsed = time.perf_counter() - start
+    return {
+        "bytes_per_frame": round(sum(sizes) / len(sizes)),
+        "session_bytes": sum(sizes),
+        "encode_us_per_frame": round(elapsed / (repeat * len(frames)) * 1e6, 1)
+    }
+
+
+def bench(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    frames = make_frames(args)
+
+    def full():
+        return serialization.dumps_bytes
+
+    def full_pmd():
+        compressor = zlib.compressobj(6, zlib.DEFLATED, -zlib.MAX_WBITS)
+        return lambda frame: compressor.compress(serialization.dumps_bytes(frame)) + compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def refs(threshold: int = 0):
+        registry = CardRegistry(args.registry_max)
+        def encode(frame):
+            data = serialization.dumps_bytes({**frame, "card_list": registry.encode(frame["card_list"])})
+            if threshold and len(data) >= threshold:
+                return serialization.deflate(data)
+            return data
+        return encode
+
+    # 연결별 상태(압축 컨텍스트, 카드 목록)가 있으므로 반복마다 새 인코더 생성
+    modes = {
+        "full": full,
+        "full+pmd": full_pmd,
+        "refs": refs,
+        "refs+deflate": lambda: refs(args.threshold)
+    }
+    results = {}
+    for name, factory in modes.items():
+        sizes_run = run_mode(frames, factory(), 1)
+        timed = [run_mode(frames, factory(), 1)["encode_us_per_frame"] for _ in range(args.repeat)]
+        sizes_run["encode_us_per_frame"] = round(sorted(timed)[len(timed) // 2], 1)
+        results[name] = sizes_run
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--turns", type=int, default=30, help="세션당 추천 응답 수")
+    parser.add_argument("--catalog", type=int, default=50, help="추천 대상 카드 수")
+    parser.add_argument("--cards", type=int, default=10, help="응답당 카드 수")
+    parser.add_argument("--threshold", type=int, default=4096, help="압축 임계값(bytes)")
+    parser.add_argument("--registry-max", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    results = bench(args)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'mode':>14} {'bytes/frame':>12} {'session bytes':>14} {'encode(us)':>11}")
+    for name, stats in results.items():
+        print(
+            f"{name:>14} {stats['bytes_per_frame']:>12} {stats['session_bytes']:>14} "
+            f"{stats['encode_us_per_frame']:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
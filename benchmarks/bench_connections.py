@@ -0,0 +1,108 @@
+"""
+WebSocket 연결 수별 ConnectionManager 메모리 사용량 및 조회 비용 벤치마크
+
+- ConnectionManager.connect로 N개의 유휴 연결을 생성하고, tracemalloc으로 연결당 할당 바이트를 측정
+  (연결 상태 객체 + 세션 UUID + active_connections/세션 레지스트리 항목 포함, 웹소켓 객체 제외)
+- 세션 ID로 연결 상태를 찾아 persona_id를 읽는 조회 비용 측정
+- 연결 상태 객체(ConnectionState) 크기와, 비교용으로 기존 dict 기반 연결 정보
+  (websocket, persona_id, user_chat_id)의 크기를 함께 측정
+
+사용법 (프로젝트 루트에서 실행):
+    python -m benchmarks.bench_connections
+    python -m benchmarks.bench_connections --connections 1000 10000 50000 --lookups 200000 --json
+"""
+import argparse
+import asyncio
+import gc
+import json
+import random
+import time
+import tracemalloc
+
+from uuid import uuid4
+
+from api.routes.ws import ConnectionManager, ConnectionState
+from core.session_registry import InMemorySessionRegistry
+
+
+class IdleWebSocket:
+    """ 연결만 유지하는 가짜 웹소켓 (측정 전에 미리 생성하여 측정값에서 제외) """
+    __slots__ = ()
+
+    async def accept(self):
+        pass
+
+
+def measure_bytes(build) -> int:
+    """ build() 실행 중 새로 할당되어 유지되는 바이트 수 """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def run_one(n: int, n_lookups: int, rng: random.Random) -> dict:
+    websockets = [IdleWebSocket() for _ in range(n)]
+    manager = ConnectionManager(InMemorySessionRegistry())
+
+    async def connect_all():
+        for websocket in websockets:
+            await manager.connect(uuid4(), websocket)
+
+    manager_bytes = measure_bytes(lambda: asyncio.run(connect_all()))
+
+    legacy_bytes = measure_bytes(lambda: [
+        {"websocket": websocket, "persona_id": None, "user_chat_id": None}
+        for websocket in websockets
+    ])
+    state_bytes = measure_bytes(lambda: [ConnectionState(websocket) for websocket in websockets])
+
+    # 조회 비용: 세션 ID로 상태를 찾아 persona_id 읽기 (요청 경로의 대표 패턴)
+    session_ids = list(manager.active_connections)
+    samples = [rng.choice(session_ids) for _ in range(n_lookups)]
+    connections = manager.active_connections
+    start = time.perf_counter()
+    for session_id in samples:
+        connections[session_id].persona_id
+    lookup_ns = (time.perf_counter() - start) * 1e9 / n_lookups
+
+    return {
+        "connections": n,
+        "bytes_per_connection": round(manager_bytes / n, 1),
+        "state_bytes": round(state_bytes / n, 1),
+        "legacy_dict_bytes": round(legacy_bytes / n, 1),
+        "lookup_ns": round(lookup_ns, 1)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--connections", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--lookups", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    results = [run_one(n, args.lookups, rng) for n in args.connections]
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    print(
+        f"{'conns':>8} {'bytes/conn':>11} {'state':>7} {'legacy dict':>12} {'lookup(ns)':>11}"
+    )
+    for r in results:
+        print(
+            f"{r['connections']:>8} {r['bytes_per_connection']:>11} "
+            f"{r['state_bytes']:>7} {r['legacy_dict_bytes']:>12} {r['lookup_ns']:>11}"
+        )
+
+
+if __name__ == "__main__":
+    main()
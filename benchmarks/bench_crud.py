@@ -0,0 +1,374 @@
+"""
+CRUD 계층 및 응답 페이로드 조립 마이크로벤치마크
+
+- 전용 Postgres DB(BENCH_DATABASE_URL 또는 --database-url)에 채팅 데이터를 규모별로 시딩한 뒤
+  crud 함수를 실제 ORM 경로 그대로 반복 호출하여 지연시간(p50/p95/p99/평균) 측정
+    - crud.session.create_chat_session
+    - crud.chat.create_user_chat / create_chatbot_chat
+    - crud.chat.fetch_chats_by_session_id / fetch_chat_page (limit 20)
+    - crud.chat.update_chat_feedback
+- 조회/갱신 쿼리는 EXPLAIN 결과(최상위 노드, 사용 인덱스)를 함께 기록하여 실행 계획 변화 감지
+- websocket_chat의 봇 응답 페이로드 조립(LLM 응답 파싱 -> 프레임 구성 -> 툴 메타데이터 추출 -> JSON 직렬화)은
+  DB 없이 카드 수별로 측정
+- 시딩은 규모 오름차순으로 부족한 행만 generate_series로 추가 (1k -> 100k -> 10M 순서로 재사용)
+- --output 지정 시 결과를 JSON 한 줄로 파일에 추가하여 커밋별 추이 비교
+
+주의: 시딩/쓰기를 수행하므로 운영 DB가 아닌 벤치마크 전용 DB를 지정
+
+사용법 (프로젝트 루트에서 실행):
+    BENCH_DATABASE_URL=postgresql+asyncpg://user:pw@localhost:5432/bench python -m benchmarks.bench_crud
+    python -m benchmarks.bench_crud --database-url postgresql+asyncpg://... --sizes 1000 100000 10000000 \\
+        --iterations 500 --output benchmarks/results/crud.jsonl
+    python -m benchmarks.bench_crud --payload-only --json
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+import subprocess
+import time
+
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession as SQLModelAsyncSession
+
+import crud.chat
+import crud.session
+
+from core import serialization
+from core.llm import parse_dispatch_payload
+from core.partitions import ensure_partitions
+
+
+# 시딩 SQL: 부족한 세션/채팅/챗봇 응답 행을 서버에서 생성 (사용자/봇 메세지가 번갈아 저장되는 실제 구조)
+SEED_SESSIONS_SQL = """
+INSERT INTO "ChatSession" (session_id, persona_id, created_at)
+SELECT md5('session' || i)::uuid, :persona_id, now() - interval '30 days'
+FROM generate_series(CAST(:start AS bigint), CAST(:stop AS bigint) - 1) AS i
+ON CONFLICT DO NOTHING
+"""
+SEED_CHATS_SQL = """
+INSERT INTO "Chat" (id, session_id, persona_id, is_user, content, created_at)
+SELECT
+    md5('chat' || i)::uuid,
+    md5('session' || (i / :rows_per_session))::uuid,
+    :persona_id,
+    i % 2 = 0,
+    '연회비 없는 카드 추천해줘 ' || i,
+    now() - interval '30 days' + (i % :rows_per_session) * interval '1 second'
+FROM generate_series(CAST(:start AS bigint), CAST(:stop AS bigint) - 1) AS i
+ON CONFLICT DO NOTHING
+"""
+# 외래키 값(챗봇/프롬프트 메세지 created_at)은 시딩된 Chat 행에서 조회 (배치 트랜잭션마다 now()가 다름)
+SEED_RESPONSES_SQL = """
+INSERT INTO "ChatbotResponse"
+    (chat_id, prompt_chat_id, prompt_chat_created_at, created_at, is_helpful, source_tool, response_payload)
+SELECT c.id, p.id, p.created_at, c.created_at, NULL, NULL, NULL
+FROM generate_series(CAST(:start AS bigint), CAST(:stop AS bigint) - 1) AS i
+JOIN "Chat" c ON c.id = md5('chat' || i)::uuid
+LEFT JOIN "Chat" p ON p.id = md5('chat' || (i - 1))::uuid
+WHERE i % 2 = 1
+ON CONFLICT DO NOTHING
+"""
+
+# crud.chat.session_window와 같은 조회 조건 (세션 생성 시각 이후 파티션만 조회)
+SESSION_WINDOW_SQL = (
+    "session_id = :session_id AND created_at >= "
+    "(SELECT created_at FROM \"ChatSession\" WHERE session_id = :session_id) - interval '10 minutes'"
+)
+
+
+def seeded_uuid(prefix: str, i: int) -> UUID:
+    """ 시딩 SQL의 md5(prefix || i)::uuid와 같은 값 """
+    return UUID(hashlib.md5(f"{prefix}{i}".encode()).hexdigest())
+
+
+def summarize(timings: List[float]) -> Dict[str, float]:
+    timings = sorted(timings)
+    n = len(timings)
+    return {
+        "iterations": n,
+        "mean_ms": round(sum(timings) / n * 1000, 3),
+        "p50_ms": round(timings[n // 2] * 1000, 3),
+        "p95_ms": round(timings[min(n - 1, int(n * 0.95))] * 1000, 3),
+        "p99_ms": round(timings[min(n - 1, int(n * 0.99))] * 1000, 3)
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def prepare_schema(engine: AsyncEngine, reset: bool) -> int:
+    """ 테이블 생성 및 벤치마크용 페르소나 확보 후 페르소나 ID 반환 """
+    async with engine.begin() as conn:
+        if reset:
+            await conn.run_sync(SQLModel.metadata.drop_all)
+        await conn.run_sync(SQLModel.metadata.create_all)
+        # 시딩 데이터는 30일 전 시각이므로 지난 달 파티션부터 생성
+        await ensure_partitions(conn, months_back=2)
+        await conn.execute(text(
+            """INSERT INTO "Persona" (name, description) VALUES ('bench', 'benchmark persona')
+            ON CONFLICT (name) DO NOTHING"""
+        ))
+        return (await conn.execute(text("""SELECT id FROM "Persona" WHERE name = 'bench'"""))).scalar_one()
+
+
+async def seeded_rows(engine: AsyncEngine, upper: int) -> int:
+    """
+    이미 시딩된 채팅 행 수 (upper 이하)
+    시딩은 번호 순서대로 배치 커밋되므로 PK 조회 이분 탐색으로 확인 (대용량 테이블 count 회피)
+    """
+    low, high = 0, upper
+    async with engine.connect() as conn:
+        while low < high:
+            mid = (low + high + 1) // 2
+            exists = (await conn.execute(
+                text('SELECT 1 FROM "Chat" WHERE id = :id'), {"id": seeded_uuid("chat", mid - 1)}
+            )).first()
+            if exists:
+                low = mid
+            else:
+                high = mid - 1
+    return low
+
+
+async def seed(engine: AsyncEngine, target_rows: int, rows_per_session: int, persona_id: int, batch: int):
+    """ 시딩된 채팅 행 수가 target_rows가 될 때까지 배치 단위로 추가 """
+    current = await seeded_rows(engine, target_rows)
+    if current == target_rows:
+        return
+    for start in range(current, target_rows, batch):
+        stop = min(start + batch, target_rows)
+        params = {"start": start, "stop": stop, "rows_per_session": rows_per_session, "persona_id": persona_id}
+        async with engine.begin() as conn:
+            await conn.execute(text(SEED_SESSIONS_SQL), {
+                "start": start // rows_per_session,
+                "stop": (stop - 1) // rows_per_session + 1,
+                "persona_id": persona_id
+            })
+            await conn.execute(text(SEED_CHATS_SQL), params)
+            await conn.execute(text(SEED_RESPONSES_SQL), params)
+    async with engine.begin() as conn:
+        for table in ("ChatSession", "Chat", "ChatbotResponse"):
+            await conn.execute(text(f'ANALYZE "{table}"'))
+
+
+async def explain(engine: AsyncEngine, sql: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """ 실행 계획 요약 (최상위 노드, 계획 내 모든 노드 종류/인덱스) """
+    async with engine.connect() as conn:
+        plan = (await conn.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"), params)).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    root = plan[0]["Plan"]
+    nodes, indexes, stack = [], [], [root]
+    while stack:
+        node = stack.pop()
+        nodes.append(node["Node Type"])
+        if "Index Name" in node:
+            indexes.append(node["Index Name"])
+        stack.extend(node.get("Plans", []))
+    return {"root": root["Node Type"], "nodes": nodes, "indexes": indexes, "total_cost": root["Total Cost"]}
+
+
+async def time_op(
+    engine: AsyncEngine,
+    op: Callable[[Any, int], Awaitable[Any]],
+    iterations: int,
+    warmup: int
+) -> Dict[str, float]:
+    """ 반복마다 새 세션으로 op 실행 (요청마다 세션을 여는 API 경로와 동일) """
+    timings = []
+    for i in range(warmup + iterations):
+        async with SQLModelAsyncSession(engine) as db:
+            start = time.perf_counter()
+            await op(db, i)
+            elapsed = time.perf_counter() - start
+        if i >= warmup:
+            timings.append(elapsed)
+    return summarize(timings)
+
+
+async def bench_size(engine: AsyncEngine, rows: int, args: argparse.Namespace, persona_id: int) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    n_sessions = max(1, rows // args.rows_per_session)
+    bench_session_id = uuid4()
+    prompt_ids: List[UUID] = []
+
+    async with SQLModelAsyncSession(engine) as db:
+        await crud.session.create_chat_session(db, bench_session_id, persona_id)
+
+    async def create_session(db, i):
+        await crud.session.create_chat_session(db, uuid4(), persona_id)
+
+    async def create_user_chat(db, i):
+        chat = await crud.chat.create_user_chat(db, uuid4(), bench_session_id, persona_id, f"bench {i}")
+        prompt_ids.append(chat.id)
+
+    async def create_chatbot_chat(db, i):
+        await crud.chat.create_chatbot_chat(
+            db, bench_session_id, persona_id, "bench answer",
+            prompt_ids[i % len(prompt_ids)], "card_recommend", {"card_list": [{"card_id": 1}]}
+        )
+
+    async def fetch_history(db, i):
+        await crud.chat.fetch_chats_by_session_id(db, seeded_uuid("session", rng.randrange(n_sessions)))
+
+    async def fetch_page(db, i):
+        await crud.chat.fetch_chat_page(db, seeded_uuid("session", rng.randrange(n_sessions)), limit=20)
+
+    async def update_feedback(db, i):
+        # 시딩된 사용자 메세지(짝수 번호) 중 하나에 대한 챗봇 응답 피드백
+        await crud.chat.update_chat_feedback(db, seeded_uuid("chat", rng.randrange(rows // 2) * 2), i % 2 == 0)
+
+    ops = {
+        "create_chat_session": create_session,
+        "create_user_chat": create_user_chat,
+        "create_chatbot_chat": create_chatbot_chat,
+        "fetch_chats_by_session_id": fetch_history,
+        "fetch_chat_page": fetch_page,
+        "update_chat_feedback": update_feedback
+    }
+    results = {}
+    for name, op in ops.items():
+        results[name] = await time_op(engine, op, args.iterations, args.warmup)
+
+    sample_session = seeded_uuid("session", n_sessions // 2)
+    plans = {
+        "fetch_chats_by_session_id": await explain(
+            engine,
+            f'SELECT * FROM "Chat" WHERE {SESSION_WINDOW_SQL} ORDER BY created_at',
+            {"session_id": sample_session}
+        ),
+        "fetch_chat_page": await explain(
+            engine,
+            'SELECT id, persona_id, is_user, content, created_at FROM "Chat" '
+            f'WHERE {SESSION_WINDOW_SQL} ORDER BY created_at, id LIMIT 21',
+            {"session_id": sample_session}
+        ),
+        "update_chat_feedback": await explain(
+            engine,
+            'SELECT * FROM "ChatbotResponse" WHERE prompt_chat_id = :prompt_chat_id',
+            {"prompt_chat_id": seeded_uuid("chat", 0)}
+        )
+    }
+    return {"rows": rows, "sessions": n_sessions, "ops": results, "plans": plans}
+
+
+def bench_payload(n_cards: int, iterations: int) -> Dict[str, float]:
+    """
+    websocket_chat의 봇 응답 조립 경로 재현
+    LLM 응답 파싱 -> 기본 프레임 구성 -> 툴 메타데이터 추출 -> 전송 프레임/메타데이터 JSON 직렬화
+    """
+    llm_payload = {"tool_response": {
+        "tool_name": "card_recommend",
+        "tool_response_content": {
+            "answer": "고객님께 맞는 카드를 추천해드립니다. " * 10,
+            "card_list": [
+                {"card_id": i, "card_name": f"카드 {i}", "benefits": ["주유 5%", "교통 10%", "쇼핑 2%"]}
+                for i in range(n_cards)
+            ]
+        }
+    }}
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        reply = parse_dispatch_payload(llm_payload)
+        res_payload = {
+            'sender': 'bot',
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'message_id': str(uuid4()),
+            'login_required': False
+        }
+        res_payload.update(reply)
+        tool_metadata = {field: reply[field] for field in ('related_questions', 'card_list') if field in reply}
+        # 전송 프레임 직렬화와 JSON 컬럼 저장 시 직렬화
+        serialization.dumps(res_payload)
+        json.dumps(tool_metadata)
+        timings.append(time.perf_counter() - start)
+    return summarize(timings)
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    result: Dict[str, Any] = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_revision": git_revision(),
+        "payload": {
+            str(n_cards): bench_payload(n_cards, args.payload_iterations) for n_cards in args.cards
+        }
+    }
+    if args.payload_only:
+        return result
+
+    database_url = args.database_url or os.environ.get("BENCH_DATABASE_URL")
+    if not database_url:
+        raise SystemExit("BENCH_DATABASE_URL 또는 --database-url로 벤치마크 전용 DB를 지정하세요.")
+    engine = create_async_engine(database_url)
+    try:
+        persona_id = await prepare_schema(engine, args.reset)
+        result["sizes"] = []
+        for rows in sorted(args.sizes):
+            seed_start = time.perf_counter()
+            await seed(engine, rows, args.rows_per_session, persona_id, args.seed_batch)
+            size_result = await bench_size(engine, rows, args, persona_id)
+            size_result["seed_s"] = round(time.perf_counter() - seed_start, 1)
+            result["sizes"].append(size_result)
+    finally:
+        await engine.dispose()
+    return result
+
+
+def print_table(result: Dict[str, Any]):
+    print(f"{'payload cards':>14} {'p50(us)':>9} {'p99(us)':>9}")
+    for n_cards, stats in result["payload"].items():
+        print(f"{n_cards:>14} {stats['p50_ms'] * 1000:>9.1f} {stats['p99_ms'] * 1000:>9.1f}")
+    for size in result.get("sizes", []):
+        print(f"\nrows={size['rows']} sessions={size['sessions']} (seed {size['seed_s']}s)")
+        print(f"{'op':>26} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9}")
+        for name, stats in size["ops"].items():
+            print(f"{name:>26} {stats['p50_ms']:>9} {stats['p95_ms']:>9} {stats['p99_ms']:>9}")
+        for name, plan in size["plans"].items():
+            print(f"  plan {name}: {plan['root']} {plan['nodes']} indexes={plan['indexes']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", help="벤치마크 전용 DB (기본: BENCH_DATABASE_URL)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000], help="시딩할 채팅 행 수")
+    parser.add_argument("--rows-per-session", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--seed-batch", type=int, default=1000000, help="시딩 트랜잭션당 행 수")
+    parser.add_argument("--reset", action="store_true", help="테이블을 삭제 후 다시 생성")
+    parser.add_argument("--cards", type=int, nargs="+", default=[0, 10, 100], help="페이로드 조립 측정 카드 수")
+    parser.add_argument("--payload-iterations", type=int, default=5000)
+    parser.add_argument("--payload-only", action="store_true", help="DB 없이 페이로드 조립만 측정")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    parser.add_argument("--output", help="결과를 JSON 한 줄로 추가할 파일 (커밋별 추이 비교용)")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as f:
+            f.write(json.dumps(result, ensure_ascii=False) + "\n")
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print_table(result)
+
+
+if __name__ == "__main__":
+    main()
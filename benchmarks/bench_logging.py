@@ -0,0 +1,104 @@
+"""
+메세지 처리 경로 로그 기록 비용 벤치마크 (print vs 큐 기반 구조화 로거)
+
+- 메세지 1건 처리 시 남기던 로그(수신/페이로드/전송)를 재현하여, 호출 스레드(이벤트 루프)가
+  로그 기록에 소비하는 시간을 메세지당 마이크로초로 측정
+- print: 기존 방식. 카드 리스트가 포함된 응답 페이로드 전체를 f-string으로 만들고 stdout에 기록
+- logger(info): 구조화 로거 기본 레벨. 페이로드 본문은 debug라 기록되지 않고 식별자만 큐에 적재
+- logger(debug): 페이로드 본문까지 큐에 적재 (JSON 직렬화/출력은 리스너 스레드에서 수행)
+- 출력 대상은 /dev/null (터미널 출력 비용 제외, 실제 운영에서는 더 큰 차이)
+
+사용법 (프로젝트 루트에서 실행):
+    python -m benchmarks.bench_logging
+    python -m benchmarks.bench_logging --messages 20000 --cards 50 --json
+"""
+import argparse
+import contextlib
+import json
+import os
+import time
+
+from uuid import uuid4
+
+from core.log import configure_logging, get_logger, shutdown_logging
+
+
+def make_payload(n_cards: int) -> dict:
+    """ 카드 추천 응답과 같은 크기의 봇 응답 페이로드 """
+    return {
+        "sender": "bot",
+        "message_id": str(uuid4()),
+        "message": "고객님의 소비 패턴에 맞는 카드를 추천해드립니다. " * 4,
+        "login_required": False,
+        "tool_name": "card_recommend",
+        "card_list": [
+            {
+                "card_id": i,
+                "card_name": f"테스트 카드 {i}",
+                "card_image_url": f"https://example.com/cards/{i}.png",
+                "benefits": ["주유 할인 5%", "대중교통 10% 청구할인", "온라인 쇼핑 적립 2%"] * 3,
+                "annual_fee": 15000 + i
+            }
+            for i in range(n_cards)
+        ]
+    }
+
+
+def run_print(n_messages: int, payload: dict, sink) -> float:
+    session_id = uuid4()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(sink):
+        for _ in range(n_messages):
+            print(f"Received message from session_id {session_id}: 카드 추천해줘")
+            print("Response Payload", payload)
+            print(f"Sent bot response to session_id {session_id}: {payload['message']}")
+    return time.perf_counter() - start
+
+
+def run_logger(n_messages: int, payload: dict, level: str, sink) -> float:
+    configure_logging(level, stream=sink)
+    logger = get_logger("bench")
+    session_id = uuid4()
+    start = time.perf_counter()
+    for _ in range(n_messages):
+        logger.info("ws.message_received", session_id=session_id, message_id=payload["message_id"])
+        logger.debug("ws.response_payload", session_id=session_id, payload=payload)
+        logger.info("ws.response_sent", session_id=session_id, message_id=payload["message_id"])
+    elapsed = time.perf_counter() - start
+    shutdown_logging() # 리스너가 큐를 비울 때까지 대기 (측정 시간에는 포함하지 않음)
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=10000)
+    parser.add_argument("--cards", type=int, default=20, help="응답 페이로드의 카드 수")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    payload = make_payload(args.cards)
+    results = []
+    with open(os.devnull, "w") as sink:
+        for name, run in (
+            ("print", lambda: run_print(args.messages, payload, sink)),
+            ("logger(info)", lambda: run_logger(args.messages, payload, "INFO", sink)),
+            ("logger(debug)", lambda: run_logger(args.messages, payload, "DEBUG", sink)),
+        ):
+            elapsed = run()
+            results.append({
+                "mode": name,
+                "messages": args.messages,
+                "us_per_message": round(elapsed * 1e6 / args.messages, 2)
+            })
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    print(f"{'mode':>14} {'messages':>9} {'us/message':>11}")
+    for r in results:
+        print(f"{r['mode']:>14} {r['messages']:>9} {r['us_per_message']:>11}")
+
+
+if __name__ == "__main__":
+    main()
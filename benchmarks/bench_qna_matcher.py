@@ -0,0 +1,102 @@
+"""
+FAQ/용어 매칭 인덱스(QnAMatcher) 코퍼스 크기별 매칭 지연시간 벤치마크
+
+사용법 (프로젝트 루트에서 실행):
+    python -m benchmarks.bench_qna_matcher
+    python -m benchmarks.bench_qna_matcher --sizes 1000 10000 --queries 2000 --json
+"""
+import argparse
+import json
+import random
+import statistics
+import time
+
+from core.qna_matcher import QnAMatcher
+
+SUBJECTS = ["신용카드", "체크카드", "연회비", "포인트", "캐시백", "해외 결제", "할부", "교통카드", "마일리지", "한도"]
+ACTIONS = ["신청", "해지", "변경", "조회", "적립", "사용", "납부", "발급", "재발급", "확인"]
+ENDINGS = ["방법이 궁금해요", "은 어떻게 하나요?", " 가능한가요?", " 조건 알려주세요", "할 때 수수료가 있나요?"]
+
+
+def build_corpus(size: int, rng: random.Random) -> dict:
+    corpus = {}
+    while len(corpus) < size:
+        question = (
+            f"{rng.choice(SUBJECTS)} {rng.choice(ACTIONS)}{rng.choice(ENDINGS)} "
+            f"#{rng.randrange(size * 10)}"
+        )
+        corpus[question] = {"question": question, "answer": "..."}
+    return corpus
+
+
+def perturb(question: str, rng: random.Random) -> str:
+    """ 띄어쓰기 제거 + 한 글자 삭제로 유사 질문 생성 """
+    text = question.replace(" ", "")
+    i = rng.randrange(len(text))
+    return text[:i] + text[i + 1:]
+
+
+def time_queries(matcher: QnAMatcher, queries: list) -> dict:
+    timings = []
+    hits = 0
+    for query in queries:
+        start = time.perf_counter()
+        matched = matcher.match(query)
+        timings.append((time.perf_counter() - start) * 1e6)
+        hits += matched is not None
+    timings.sort()
+    return {
+        "mean_us": round(statistics.fmean(timings), 2),
+        "p50_us": round(timings[len(timings) // 2], 2),
+        "p99_us": round(timings[int(len(timings) * 0.99) - 1], 2),
+        "hit_rate": round(hits / len(queries), 3)
+    }
+
+
+def run(sizes: list, n_queries: int, threshold: float, seed: int) -> list:
+    rng = random.Random(seed)
+    results = []
+    for size in sizes:
+        corpus = build_corpus(size, rng)
+        start = time.perf_counter()
+        matcher = QnAMatcher(corpus, threshold=threshold)
+        build_ms = (time.perf_counter() - start) * 1e3
+
+        keys = list(corpus)
+        samples = [rng.choice(keys) for _ in range(n_queries)]
+        results.append({
+            "corpus_size": size,
+            "build_ms": round(build_ms, 1),
+            "normalized_exact": time_queries(matcher, [k.replace(" ", "") + "?" for k in samples]),
+            "fuzzy": time_queries(matcher, [perturb(k, rng) for k in samples]),
+            "miss": time_queries(matcher, [f"오늘 날씨 어때요 {i}" for i in range(n_queries)])
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000, 50000])
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--threshold", type=float, default=0.85)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    results = run(args.sizes, args.queries, args.threshold, args.seed)
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return
+
+    print(f"{'corpus':>8} {'build(ms)':>10} | {'kind':<16} {'mean(us)':>9} {'p50(us)':>9} {'p99(us)':>9} {'hit':>6}")
+    for row in results:
+        for kind in ("normalized_exact", "fuzzy", "miss"):
+            r = row[kind]
+            print(
+                f"{row['corpus_size']:>8} {row['build_ms']:>10} | {kind:<16} "
+                f"{r['mean_us']:>9} {r['p50_us']:>9} {r['p99_us']:>9} {r['hit_rate']:>6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+JSON 직렬화 비용 벤치마크 (변경 전 stdlib 경로 vs serializer)
+
+- 메세지 1턴에서 JSON을 다루는 지점을 card_list 크기별로 재현하여 호출당 마이크로초로 측정
+    - ws_parse: 클라이언트 메세지 파싱 (json.loads vs serializer.loads)
+    - llm_decode: LLM 응답 본문 파싱 (httpx Response.json() vs serializer.loads(response.content))
+    - ws_send: 봇 응답 프레임 직렬화 (Starlette send_json과 같은 json.dumps vs serializer.dumps)
+    - rest_render: REST 응답 본문 생성 (JSONResponse.render vs FastJSONResponse.render)
+- before는 항상 기존 stdlib 경로, after는 serializer 백엔드별(stdlib/orjson, 설치된 경우만)로 측정
+
+사용법 (프로젝트 루트에서 실행):
+    python -m benchmarks.bench_serialization
+    python -m benchmarks.bench_serialization --cards 0 10 100 500 --iterations 5000 --json
+"""
+import argparse
+import json
+import time
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List
+from uuid import uuid4
+
+import httpx
+
+from fastapi.responses import JSONResponse
+
+from core import serialization
+from core.serialization import ORJSON_AVAILABLE, create_serializer
+
+
+def make_reply(n_cards: int) -> Dict[str, Any]:
+    """ 카드 추천 툴 응답과 같은 구조의 봇 응답 프레임 """
+    return {
+        "sender": "bot",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "message_id": str(uuid4()),
+        "login_required": False,
+        "message": "고객님의 소비 패턴에 맞는 카드를 추천해드립니다. " * 5,
+        "tool_name": "card_recommend",
+        "card_list": [
+            {
+                "card_id": i,
+                "card_name": f"우리카드 {i}",
+                "card_image_url": f"https://example.com/cards/{i}.png",
+                "benefits": ["주유 할인 5%", "대중교통 10% 청구할인", "온라인 쇼핑 적립 2%"],
+                "annual_fee": 15000 + i
+            }
+            for i in range(n_cards)
+        ]
+    }
+
+
+def per_call_us(fn: Callable[[], Any], iterations: int) -> float:
+    for _ in range(min(100, iterations)):
+        fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def bench_cards(n_cards: int, iterations: int, backends: List[str]) -> Dict[str, Dict[str, float]]:
+    reply = make_reply(n_cards)
+    client_message = json.dumps({"message_id": str(uuid4()), "message": "연회비 없는 카드 알려줘"}, ensure_ascii=False)
+    llm_body = json.dumps(
+        {"tool_response": {"tool_name": "card_recommend", "tool_response_content": {
+            "answer": reply["message"], "card_list": reply["card_list"]
+        }}},
+        ensure_ascii=False
+    ).encode("utf-8")
+    llm_response = httpx.Response(200, content=llm_body, headers={"content-type": "application/json"})
+    rest_response = JSONResponse(content=None)
+
+    results = {"before": {
+        "ws_parse": per_call_us(lambda: json.loads(client_message), iterations),
+        "llm_decode": per_call_us(llm_response.json, iterations),
+        "ws_send": per_call_us(
+            lambda: json.dumps(reply, separators=(",", ":"), ensure_ascii=False), iterations
+        ),
+        "rest_render": per_call_us(lambda: rest_response.render(reply), iterations)
+    }}
+    for backend in backends:
+        serializer = create_serializer(backend)
+        serialization.serializer = serializer # FastJSONResponse가 사용하는 모듈 serializer 교체
+        fast_response = serialization.FastJSONResponse(content=None)
+        results[f"after({serializer.name})"] = {
+            "ws_parse": per_call_us(lambda: serializer.loads(client_message), iterations),
+            "llm_decode": per_call_us(lambda: serializer.loads(llm_response.content), iterations),
+            "ws_send": per_call_us(lambda: serializer.dumps(reply), iterations),
+            "rest_render": per_call_us(lambda: fast_response.render(reply), iterations)
+        }
+    for stats in results.values():
+        stats["total"] = sum(stats.values())
+        for name in stats:
+            stats[name] = round(stats[name], 2)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cards", type=int, nargs="+", default=[0, 10, 100, 500], help="card_list 카드 수")
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    args = parser.parse_args()
+
+    backends = ["stdlib"] + (["orjson"] if ORJSON_AVAILABLE else [])
+    default_serializer = serialization.serializer
+    try:
+        results = {str(n): bench_cards(n, args.iterations, backends) for n in args.cards}
+    finally:
+        serialization.serializer = default_serializer
+
+    if args.json:
+        print(json.dumps({"orjson_available": ORJSON_AVAILABLE, "results_us": results}, indent=2))
+        return
+    print(f"{'cards':>6} {'path':>14} {'ws_parse':>9} {'llm_decode':>11} {'ws_send':>9} {'rest_render':>12} {'total(us)':>10}")
+    for n_cards, by_path in results.items():
+        for path, stats in by_path.items():
+            print(
+                f"{n_cards:>6} {path:>14} {stats['ws_parse']:>9} {stats['llm_decode']:>11} "
+                f"{stats['ws_send']:>9} {stats['rest_render']:>12} {stats['total']:>10}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+CHAR(36) 키와 네이티브 uuid 키 비교 벤치마크
+
+- 전용 Postgres DB에 같은 구조(PK + (session_id, created_at) 인덱스)의 두 테이블을 만들고 같은 행을 시딩
+    - bench_keys_char: id/session_id CHAR(36) (전환 전 스키마)
+    - bench_keys_uuid: id/session_id uuid (현재 스키마)
+- 키 타입별로 측정
+    - 테이블/PK 인덱스/세션 인덱스 크기 (VACUUM ANALYZE 후 pg_relation_size)
+    - 단건 INSERT, 배치 INSERT(--batch행), PK 단건 조회, 세션 범위 조회(세션당 --rows-per-session행) 지연시간
+- 벤치마크 테이블만 생성/삭제하며 애플리케이션 테이블은 건드리지 않음
+
+사용법 (프로젝트 루트에서 실행):
+    BENCH_DATABASE_URL=postgresql+asyncpg://user:pw@localhost:5432/bench python -m benchmarks.bench_uuid_keys
+    python -m benchmarks.bench_uuid_keys --database-url postgresql+asyncpg://... --rows 1000000 --json \\
+        --output benchmarks/results/uuid_keys.jsonl
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List
+from uuid import UUID, uuid4
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from benchmarks.bench_crud import git_revision, seeded_uuid, summarize
+
+
+KEY_TYPES = {"char": "CHAR(36)", "uuid": "uuid"}
+
+CREATE_SQL = (
+    'CREATE TABLE "bench_keys_{name}" ('
+    " id {type} PRIMARY KEY,"
+    " session_id {type} NOT NULL,"
+    " content TEXT NOT NULL,"
+    " created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now())",
+    'CREATE INDEX "bench_keys_{name}_session" ON "bench_keys_{name}" (session_id, created_at)',
+)
+# 시딩 값은 bench_crud와 같은 md5 기반 uuid (CHAR(36) 테이블은 문자열 표현)
+SEED_SQL = """
+INSERT INTO "bench_keys_{name}" (id, session_id, content, created_at)
+SELECT
+    md5('chat' || i)::uuid{cast},
+    md5('session' || (i / :rows_per_session))::uuid{cast},
+    '연회비 없는 카드 추천해줘 ' || i,
+    now() - interval '30 days' + (i % :rows_per_session) * interval '1 second'
+FROM generate_series(0, CAST(:rows AS bigint) - 1) AS i
+"""
+SIZE_SQL = """
+SELECT
+    pg_relation_size(to_regclass(:table)) AS table_bytes,
+    pg_relation_size(to_regclass(:pkey)) AS pkey_bytes,
+    pg_relation_size(to_regclass(:session_index)) AS session_index_bytes
+"""
+
+
+def key_value(name: str, value: UUID) -> Any:
+    """ 키 타입별 바인딩 값 (CHAR(36)은 애플리케이션이 저장하던 문자열) """
+    return str(value) if name == "char" else value
+
+
+async def prepare(engine: AsyncEngine, rows: int, rows_per_session: int):
+    """ 두 테이블을 다시 만들고 같은 행으로 시딩 """
+    for name, key_type in KEY_TYPES.items():
+        async with engine.begin() as conn:
+            await conn.execute(text(f'DROP TABLE IF EXISTS "bench_keys_{name}"'))
+            for statement in CREATE_SQL:
+                await conn.execute(text(statement.format(name=name, type=key_type)))
+            await conn.execute(
+                text(SEED_SQL.format(name=name, cast="::text" if name == "char" else "")),
+                {"rows": rows, "rows_per_session": rows_per_session}
+            )
+    # VACUUM은 트랜잭션 밖에서 실행
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for name in KEY_TYPES:
+            await conn.execute(text(f'VACUUM ANALYZE "bench_keys_{name}"'))
+
+
+async def relation_sizes(engine: AsyncEngine, name: str) -> Dict[str, int]:
+    async with engine.connect() as conn:
+        row = (await conn.execute(text(SIZE_SQL), {
+            "table": f'"bench_keys_{name}"',
+            "pkey": f'"bench_keys_{name}_pkey"',
+            "session_index": f'"bench_keys_{name}_session"'
+        })).one()
+    return dict(row._mapping)
+
+
+async def time_statement(
+    engine: AsyncEngine, sql: str, make_params, iterations: int, warmup: int
+) -> Dict[str, float]:
+    """ 같은 연결에서 문장 하나를 반복 실행(자동 커밋)하여 지연시간 측정 """
+    timings: List[float] = []
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        statement = text(sql)
+        for i in range(warmup + iterations):
+            params = make_params(i)
+            start = time.perf_counter()
+            await conn.execute(statement, params)
+            if i >= warmup:
+                timings.append(time.perf_counter() - start)
+    return summarize(timings)
+
+
+async def bench_key_type(engine: AsyncEngine, name: str, args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    rng = random.Random(args.seed)
+    n_sessions = max(1, args.rows // args.rows_per_session)
+    table = f'"bench_keys_{name}"'
+    insert_sql = f"INSERT INTO {table} (id, session_id, content) VALUES (:id, :session_id, :content)"
+
+    def single_row(i):
+        return {"id": key_value(name, uuid4()), "session_id": key_value(name, uuid4()), "content": f"bench {i}"}
+
+    def batch_rows(i):
+        session_id = key_value(name, uuid4())
+        return [
+            {"id": key_value(name, uuid4()), "session_id": session_id, "content": f"bench {i}-{j}"}
+            for j in range(args.batch)
+        ]
+
+    def by_id(i):
+        return {"id": key_value(name, seeded_uuid("chat", rng.randrange(args.rows)))}
+
+    def by_session(i):
+        return {"session_id": key_value(name, seeded_uuid("session", rng.randrange(n_sessions)))}
+
+    ops = {
+        "insert_single": await time_statement(engine, insert_sql, single_row, args.iterations, args.warmup),
+        "insert_batch": await time_statement(
+            engine, insert_sql, batch_rows, max(1, args.iterations // 10), max(1, args.warmup // 10)
+        ),
+        "select_by_id": await time_statement(
+            engine, f"SELECT * FROM {table} WHERE id = :id", by_id, args.iterations, args.warmup
+        ),
+        "select_session_range": await time_statement(
+            engine, f"SELECT * FROM {table} WHERE session_id = :session_id ORDER BY created_at",
+            by_session, args.iterations, args.warmup
+        )
+    }
+    return ops
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    database_url = args.database_url or os.environ.get("BENCH_DATABASE_URL")
+    if not database_url:
+        raise SystemExit("BENCH_DATABASE_URL 또는 --database-url로 벤치마크 전용 DB를 지정하세요.")
+    engine = create_async_engine(database_url)
+    try:
+        await prepare(engine, args.rows, args.rows_per_session)
+        # 쓰기 측정 전에 크기를 먼저 기록 (시딩 행만 비교)
+        sizes = {name: await relation_sizes(engine, name) for name in KEY_TYPES}
+        results = {}
+        for name in KEY_TYPES:
+            results[name] = {"sizes": sizes[name], "ops": await bench_key_type(engine, name, args)}
+        if not args.keep:
+            async with engine.begin() as conn:
+                for name in KEY_TYPES:
+                    await conn.execute(text(f'DROP TABLE IF EXISTS "bench_keys_{name}"'))
+    finally:
+        await engine.dispose()
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_revision": git_revision(),
+        "rows": args.rows,
+        "key_types": results
+    }
+
+
+def print_table(result: Dict[str, Any]):
+    print(f"rows={result['rows']}")
+    print(f"{'key':>5} {'table(MB)':>10} {'pkey(MB)':>9} {'session idx(MB)':>16}")
+    for name, stats in result["key_types"].items():
+        sizes = stats["sizes"]
+        print(
+            f"{name:>5} {sizes['table_bytes'] / 2 ** 20:>10.1f} {sizes['pkey_bytes'] / 2 ** 20:>9.1f} "
+            f"{sizes['session_index_bytes'] / 2 ** 20:>16.1f}"
+        )
+    print(f"\n{'key':>5} {'op':>21} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9}")
+    for name, stats in result["key_types"].items():
+        for op, timing in stats["ops"].items():
+            print(f"{name:>5} {op:>21} {timing['p50_ms']:>9} {timing['p95_ms']:>9} {timing['p99_ms']:>9}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", help="벤치마크 전용 DB (기본: BENCH_DATABASE_URL)")
+    parser.add_argument("--rows", type=int, default=100000, help="키 타입별 시딩 행 수")
+    parser.add_argument("--rows-per-session", type=int, default=50)
+    parser.add_argument("--batch", type=int, default=100, help="배치 INSERT 행 수")
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--keep", action="store_true", help="측정 후 벤치마크 테이블을 남김")
+    parser.add_argument("--json", action="store_true", help="JSON 형식으로 출력")
+    parser.add_argument("--output", help="결과를 JSON 한 줄로 추가할 파일 (커밋별 추이 비교용)")
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as f:
+            f.write(json.dumps(result, ensure_ascii=False) + "\n")
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print_table(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,277 @@
+"""
+WebSocket 채팅 End-to-End 부하 테스트
+
+- 로컬 LLM/MCP 스텁 서버를 띄우고, 스텁을 바라보는 백엔드 앱(uvicorn main:app)을 하위 프로세스로 실행
+- 가상 사용자 N명이 동시에 아래 흐름을 반복
+    1. /api/chat/ws 연결 후 session_id 수신
+    2. 카드 추천 질문 -> 로그인 필요 응답 -> /api/login/ 호출 -> 추천 카드 응답 수신
+    3. 일반 질문 M회 (응답 수신 후 다음 질문 전송)
+- 처리량(messages/s), 턴 지연시간 p50/p95/p99, 로그인 지연시간, 앱 프로세스 최대 RSS를 JSON으로 출력
+  (릴리스 간 비교를 위해 git 커밋, 실행 설정을 함께 기록)
+
+사전 준비:
+    - 채팅 DB(DATABASE_URL)/FAQ DB(FAQ_DATABASE_URL)는 실제 Postgres 필요 (.env 또는 환경변수)
+    - LLMSERVER_URL/MCP_SERVER_URL은 스텁 주소로 자동 지정
+
+사용법 (프로젝트 루트에서 실행):
+    python -m benchmarks.loadtest.run --clients 100 --turns 20
+    python -m benchmarks.loadtest.run --clients 500 --turns 10 --latency 0.5 --cards 100 --output result.json
+    python -m benchmarks.loadtest.run --app-url http://127.0.0.1:8001 --app-pid 12345  # 이미 실행 중인 앱 대상
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from uuid import uuid4
+
+import httpx
+import uvicorn
+import websockets
+
+from benchmarks.loadtest.stubs import add_stub_arguments, create_stub_app, stub_config_from_args
+
+
+def percentile(sorted_values: List[float], pct: float) -> Optional[float]:
+    """ nearest-rank 백분위수 """
+    if not sorted_values:
+        return None
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize_ms(values: List[float]) -> Dict[str, Optional[float]]:
+    values = sorted(values)
+    result = {"count": len(values)}
+    for name, pct in (("p50", 50), ("p95", 95), ("p99", 99), ("max", 100)):
+        value = percentile(values, pct)
+        result[name] = round(value * 1000, 2) if value is not None else None
+    return result
+
+
+def peak_rss_mb(pid: Optional[int]) -> Optional[float]:
+    """ 프로세스 최대 RSS (Linux /proc VmHWM, 확인 불가 시 None) """
+    if pid is None:
+        return None
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+class Recorder:
+    """ 가상 사용자들의 측정값 누적 """
+    def __init__(self):
+        self.turns: List[float] = []
+        self.logins: List[float] = []
+        self.connects: List[float] = []
+        self.errors: Dict[str, int] = {}
+        self.busy = 0
+
+    def error(self, kind: str):
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+
+
+async def receive_bot_frame(ws, message_id: Optional[str] = None) -> dict:
+    """ 봇 응답 프레임 수신 (스트리밍 delta 프레임은 건너뜀) """
+    while True:
+        frame = json.loads(await ws.recv())
+        if "error" in frame:
+            raise RuntimeError(frame["error"])
+        if frame.get("type") == "delta":
+            continue
+        if frame.get("sender") == "bot" and (message_id is None or frame.get("message_id") == message_id):
+            return frame
+
+
+async def chat_turn(ws, text: str, recorder: Recorder) -> dict:
+    message_id = str(uuid4())
+    start = time.perf_counter()
+    await ws.send(json.dumps({"message_id": message_id, "message": text}))
+    frame = await receive_bot_frame(ws, message_id)
+    recorder.turns.append(time.perf_counter() - start)
+    if frame.get("busy"):
+        recorder.busy += 1
+    return frame
+
+
+async def virtual_user(
+    index: int,
+    args: argparse.Namespace,
+    ws_url: str,
+    http: httpx.AsyncClient,
+    recorder: Recorder
+):
+    try:
+        start = time.perf_counter()
+        async with websockets.connect(ws_url, max_size=None, open_timeout=args.timeout) as ws:
+            session_id = json.loads(await ws.recv())["session_id"]
+            recorder.connects.append(time.perf_counter() - start)
+
+            if args.login:
+                # 로그인 필요 응답 -> /api/login/ -> 추천 카드 프레임 수신
+                await asyncio.wait_for(chat_turn(ws, "내 소비 패턴에 맞는 카드 추천해줘", recorder), args.timeout)
+                login_start = time.perf_counter()
+                response = await http.post(
+                    "/api/login/", json={"session_id": session_id, "persona_id": args.persona_id}
+                )
+                if response.status_code == 200:
+                    await asyncio.wait_for(receive_bot_frame(ws), args.timeout)
+                    recorder.logins.append(time.perf_counter() - login_start)
+                else:
+                    recorder.error(f"login_http_{response.status_code}")
+
+            for turn in range(args.turns):
+                # 질문마다 내용을 달리해 LLM 응답 캐시 히트를 피함 (--cacheable 지정 시 같은 질문 반복)
+                text = "연회비 없는 카드 알려줘" if args.cacheable else f"연회비 없는 카드 알려줘 ({index}-{turn})"
+                await asyncio.wait_for(chat_turn(ws, text, recorder), args.timeout)
+                if args.think_time:
+                    await asyncio.sleep(args.think_time)
+    except asyncio.TimeoutError:
+        recorder.error("timeout")
+    except websockets.ConnectionClosed:
+        recorder.error("connection_closed")
+    except (OSError, websockets.InvalidHandshake, httpx.HTTPError):
+        recorder.error("connect")
+    except RuntimeError:
+        recorder.error("server_error")
+
+
+async def wait_until_ready(base_url: str, timeout: float):
+    """ /api/health/ready가 200을 반환할 때까지 대기 """
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/api/health/ready")).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.5)
+    raise RuntimeError(f"App at {base_url} is not ready after {timeout}s")
+
+
+def start_app(args: argparse.Namespace, stub_url: str) -> subprocess.Popen:
+    """ 스텁을 바라보는 백엔드 앱 실행 (DB 등 나머지 설정은 현재 환경변수/.env 사용) """
+    env = dict(os.environ, LLMSERVER_URL=stub_url, MCP_SERVER_URL=stub_url, LOG_LEVEL=args.app_log_level)
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(args.app_port)],
+        env=env,
+        stdout=subprocess.DEVNULL if args.app_log_level != "DEBUG" else None
+    )
+
+
+async def run(args: argparse.Namespace) -> dict:
+    stub_config = stub_config_from_args(args)
+    stub_server = uvicorn.Server(uvicorn.Config(
+        create_stub_app(stub_config), host="127.0.0.1", port=args.stub_port, log_level="warning"
+    ))
+    stub_task = asyncio.create_task(stub_server.serve())
+    app_process = None
+    try:
+        while not stub_server.started:
+            await asyncio.sleep(0.05)
+
+        if args.app_url:
+            base_url, app_pid = args.app_url.rstrip("/"), args.app_pid
+        else:
+            app_process = start_app(args, f"http://127.0.0.1:{args.stub_port}")
+            base_url, app_pid = f"http://127.0.0.1:{args.app_port}", app_process.pid
+        await wait_until_ready(base_url, args.startup_timeout)
+
+        ws_url = base_url.replace("http", "ws", 1) + "/api/chat/ws"
+        recorder = Recorder()
+        limits = httpx.Limits(max_connections=args.clients, max_keepalive_connections=args.clients)
+        async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as http:
+            # 연결이 한꺼번에 몰리지 않도록 ramp_up 동안 나누어 시작
+            async def delayed_user(index: int):
+                await asyncio.sleep(args.ramp_up * index / args.clients)
+                await virtual_user(index, args, ws_url, http, recorder)
+
+            start = time.perf_counter()
+            await asyncio.gather(*(delayed_user(i) for i in range(args.clients)))
+            duration = time.perf_counter() - start
+
+        return {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_revision": git_revision(),
+            "python": platform.python_version(),
+            "config": {
+                "clients": args.clients,
+                "turns": args.turns,
+                "login": args.login,
+                "cacheable": args.cacheable,
+                "think_time": args.think_time,
+                "ramp_up": args.ramp_up,
+                "stub": vars(stub_config)
+            },
+            "results": {
+                "duration_s": round(duration, 3),
+                "messages": len(recorder.turns),
+                "messages_per_sec": round(len(recorder.turns) / duration, 2) if duration else None,
+                "turn_latency_ms": summarize_ms(recorder.turns),
+                "login_latency_ms": summarize_ms(recorder.logins),
+                "connect_latency_ms": summarize_ms(recorder.connects),
+                "busy_responses": recorder.busy,
+                "errors": recorder.errors,
+                "stub_requests": dict(stub_server.config.app.state.stats),
+                "peak_rss_mb": peak_rss_mb(app_pid)
+            }
+        }
+    finally:
+        if app_process is not None:
+            app_process.terminate()
+            app_process.wait(timeout=30)
+        stub_server.should_exit = True
+        await stub_task
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=50, help="동시 WebSocket 가상 사용자 수")
+    parser.add_argument("--turns", type=int, default=10, help="가상 사용자당 일반 질문 수")
+    parser.add_argument("--no-login", dest="login", action="store_false", help="로그인 단계 생략")
+    parser.add_argument("--persona-id", type=int, default=1)
+    parser.add_argument("--cacheable", action="store_true", help="같은 질문 반복 (LLM 응답 캐시 경로 측정)")
+    parser.add_argument("--think-time", type=float, default=0.0, help="질문 사이 대기(초)")
+    parser.add_argument("--ramp-up", type=float, default=1.0, help="모든 사용자가 연결을 시작하는 데 걸리는 시간(초)")
+    parser.add_argument("--timeout", type=float, default=60.0, help="응답 대기 제한 시간(초)")
+    parser.add_argument("--stub-port", type=int, default=9100)
+    parser.add_argument("--app-port", type=int, default=8101)
+    parser.add_argument("--app-url", help="이미 실행 중인 앱 주소 (지정 시 앱을 실행하지 않음, 스텁을 바라보도록 설정 필요)")
+    parser.add_argument("--app-pid", type=int, help="--app-url 앱의 PID (최대 RSS 측정용)")
+    parser.add_argument("--app-log-level", default="WARNING", help="앱 LOG_LEVEL")
+    parser.add_argument("--startup-timeout", type=float, default=60.0)
+    parser.add_argument("--output", help="결과 JSON 저장 경로 (미지정 시 stdout)")
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    result = asyncio.run(run(args))
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
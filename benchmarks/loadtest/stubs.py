@@ -0,0 +1,127 @@
+"""
+부하 테스트용 LLM 서버(MCP 라우터)/MCP 서버 스텁
+
+- LLM: POST /llm/mcp-router/dispatch
+    - "추천" 포함 질문: 로그인이 필요한 카드 추천 툴 응답 (login_required)
+    - 그 외: tool_ratio 비율로 card_list 포함 툴 응답, 나머지는 표준 응답
+- MCP: POST /tools/consumption_recommend -> card_list 포함 추천 응답
+- 응답마다 latency(평균) ± jitter 만큼 지연, error_rate 비율로 500 반환
+- card_list 카드 수/답변 길이로 페이로드 크기 조절
+
+단독 실행 (프로젝트 루트에서 실행):
+    python -m benchmarks.loadtest.stubs --port 9100 --latency 0.2 --cards 50
+"""
+import argparse
+import asyncio
+import random
+
+from dataclasses import dataclass
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+@dataclass
+class StubConfig:
+    latency: float = 0.1 # 평균 응답 지연(초)
+    jitter: float = 0.05 # 지연 편차(초, 균등분포)
+    error_rate: float = 0.0 # 500 응답 비율
+    cards: int = 10 # card_list 카드 수
+    answer_chars: int = 300 # 답변 길이(글자 수)
+    tool_ratio: float = 0.3 # 일반 질문 중 card_list 포함 툴 응답 비율
+
+
+def make_card_list(n_cards: int) -> list:
+    return [
+        {
+            "card_id": i,
+            "card_name": f"부하테스트 카드 {i}",
+            "card_image_url": f"https://example.com/cards/{i}.png",
+            "benefits": ["주유 할인 5%", "대중교통 10% 청구할인", "온라인 쇼핑 적립 2%"],
+            "annual_fee": 15000 + i
+        }
+        for i in range(n_cards)
+    ]
+
+
+def create_stub_app(config: StubConfig) -> FastAPI:
+    """ 설정값에 따라 응답하는 LLM/MCP 스텁 앱 (두 서버 경로를 한 앱에서 제공) """
+    app = FastAPI()
+    answer = ("부하 테스트 응답입니다. " * (config.answer_chars // 12 + 1))[:config.answer_chars]
+    card_list = make_card_list(config.cards)
+    stats = app.state.stats = {"dispatch": 0, "recommend": 0, "errors": 0}
+
+    async def delay_or_fail():
+        await asyncio.sleep(max(0.0, config.latency + random.uniform(-config.jitter, config.jitter)))
+        if random.random() < config.error_rate:
+            stats["errors"] += 1
+            return JSONResponse(status_code=500, content={"detail": "stub error"})
+        return None
+
+    @app.post("/llm/mcp-router/dispatch")
+    async def dispatch(request: Request):
+        stats["dispatch"] += 1
+        body = await request.json()
+        if (error := await delay_or_fail()) is not None:
+            return error
+        if "추천" in body.get("query", ""):
+            return {"tool_response": {
+                "tool_name": "consumption_recommend",
+                "tool_response_content": {"answer": "로그인 후 추천해드릴게요.", "login_required": True}
+            }}
+        if random.random() < config.tool_ratio:
+            return {"tool_response": {
+                "tool_name": "card_recommend",
+                "tool_response_content": {"answer": answer, "card_list": card_list}
+            }}
+        return {"answer": answer}
+
+    @app.post("/tools/consumption_recommend")
+    async def consumption_recommend():
+        stats["recommend"] += 1
+        if (error := await delay_or_fail()) is not None:
+            return error
+        return {"answer": answer, "card_list": card_list}
+
+    @app.get("/")
+    async def root():
+        return {"status": "ok"}
+
+    return app
+
+
+def add_stub_arguments(parser: argparse.ArgumentParser):
+    defaults = StubConfig()
+    parser.add_argument("--latency", type=float, default=defaults.latency, help="스텁 평균 응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=defaults.jitter, help="스텁 응답 지연 편차(초)")
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate, help="스텁 500 응답 비율")
+    parser.add_argument("--cards", type=int, default=defaults.cards, help="card_list 카드 수")
+    parser.add_argument("--answer-chars", type=int, default=defaults.answer_chars, help="답변 길이")
+    parser.add_argument("--tool-ratio", type=float, default=defaults.tool_ratio, help="card_list 포함 응답 비율")
+
+
+def stub_config_from_args(args: argparse.Namespace) -> StubConfig:
+    return StubConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+        cards=args.cards,
+        answer_chars=args.answer_chars,
+        tool_ratio=args.tool_ratio
+    )
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    add_stub_arguments(parser)
+    args = parser.parse_args()
+
+    uvicorn.run(create_stub_app(stub_config_from_args(args)), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
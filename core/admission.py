@@ -0,0 +1,111 @@
+import asyncio
+import time
+
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict
+
+from core.config import settings
+
+
+class AdmissionRejected(Exception):
+    """ 대기열이 가득 찼거나 최대 대기 시간을 넘겨 요청이 거절된 경우 """
+
+
+class AdmissionController:
+    """
+    업스트림 호출 동시성 제한기 (노드 단위)
+    - 동시에 max_concurrency개까지만 업스트림 호출
+    - 초과 요청은 최대 max_queue개까지 대기, 그 이상은 즉시 거절
+    - max_wait초 안에 차례가 오지 않으면 거절
+    """
+    def __init__(self, name: str, max_concurrency: int, max_queue: int, max_wait: float):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.max_wait = max_wait
+        self.active = 0
+        # 슬롯 대기자 (FIFO, 슬롯 반환 시 앞에서부터 넘겨줌)
+        self._waiters: Deque[asyncio.Future] = deque()
+        # 모니터링용 카운터
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """ 호출 슬롯 확보 (거절 시 AdmissionRejected) """
+        await self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self):
+        if self.active < self.max_concurrency and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            self.rejected_queue_full += 1
+            raise AdmissionRejected(f"{self.name} queue is full")
+
+        start = time.monotonic()
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        timer = loop.call_later(self.max_wait, self._expire, waiter)
+        try:
+            await waiter
+        except BaseException:
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                # 슬롯을 넘겨받은 직후 취소된 경우 다음 대기자에게 반환
+                self._release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+        finally:
+            timer.cancel()
+
+        # 슬롯은 반환한 쪽에서 넘겨받았으므로 active는 그대로 유지
+        waited = time.monotonic() - start
+        self.wait_seconds_total += waited
+        self.wait_seconds_max = max(self.wait_seconds_max, waited)
+        self.admitted += 1
+
+    def _expire(self, waiter: asyncio.Future):
+        """ 최대 대기 시간 초과 시 대기자 거절 """
+        if not waiter.done():
+            self.rejected_timeout += 1
+            waiter.set_exception(AdmissionRejected(f"{self.name} queue wait timed out"))
+
+    def _release(self):
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def stats(self) -> Dict[str, Any]:
+        """ 동시 호출/대기열 현황 """
+        return {
+            "active": self.active,
+            "queue_depth": len(self._waiters),
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "wait_seconds_avg": round(self.wait_seconds_total / self.admitted, 4) if self.admitted else 0.0,
+            "wait_seconds_max": round(self.wait_seconds_max, 4)
+        }
+
+llm_admission = AdmissionController(
+    "llm", settings.LLM_MAX_CONCURRENCY, settings.LLM_MAX_QUEUE, settings.LLM_MAX_QUEUE_WAIT
+)
+mcp_admission = AdmissionController(
+    "mcp", settings.MCP_MAX_CONCURRENCY, settings.MCP_MAX_QUEUE, settings.MCP_MAX_QUEUE_WAIT
+)
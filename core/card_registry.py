@@ -0,0 +1,49 @@
+import hashlib
+
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+from core import serialization
+from core.metrics import ws_card_entries_total
+
+
+def card_key(card: Dict[str, Any]) -> str:
+    """ 카드 본문 기준 고정 키 (같은 내용이면 세션/워커와 무관하게 같은 키) """
+    return hashlib.blake2b(serialization.dumps_bytes(card), digest_size=8).hexdigest()
+
+
+class CardRegistry:
+    """
+    WebSocket 연결별 전송 카드 목록
+    - 세션에서 처음 전송하는 카드는 본문 전체에 card_key를 붙여 전송: {..., "card_key": "<key>"}
+    - 이미 전송한 카드는 참조만 전송: {"card_ref": "<key>"}
+    - 연결당 max_entries개까지만 기억 (오래 쓰이지 않은 키부터 제거, 제거된 카드는 다시 본문 전송)
+    프레임 전송 직전에 변환하므로 클라이언트는 항상 참조보다 본문을 먼저 받음
+    """
+    __slots__ = ("max_entries", "_sent")
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._sent: "OrderedDict[str, None]" = OrderedDict()
+
+    def encode(self, card_list: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """ card_list를 본문/참조 항목 목록으로 변환 """
+        encoded = []
+        refs = 0
+        for card in card_list:
+            key = card_key(card)
+            if key in self._sent:
+                self._sent.move_to_end(key)
+                encoded.append({"card_ref": key})
+                refs += 1
+                continue
+            self._sent[key] = None
+            if len(self._sent) > self.max_entries:
+                self._sent.popitem(last=False)
+            encoded.append({**card, "card_key": key})
+        ws_card_entries_total.labels("ref").inc(refs)
+        ws_card_entries_total.labels("full").inc(len(encoded) - refs)
+        return encoded
+
+    def __len__(self) -> int:
+        return len(self._sent)
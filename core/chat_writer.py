@@ -0,0 +1,207 @@
+import asyncio
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID, uuid4
+
+import crud.chat
+
+from core.config import settings
+from core.db import get_async_context_db
+from core.log import get_logger
+
+logger = get_logger(__name__)
+
+
+# (Chat 행, ChatbotResponse 행 또는 None)
+PendingRow = Tuple[Dict[str, Any], Optional[Dict[str, Any]]]
+
+_STOP = object() # 종료 신호
+
+
+def as_uuid(value: Optional[UUID | str]) -> Optional[UUID]:
+    """
+    메세지 ID를 uuid 컬럼에 저장할 UUID로 변환 (세션 레지스트리 등에는 문자열로 보관됨)
+    None은 그대로 반환 (로그인 전 메세지가 없는 세션의 프롬프트 ID는 NULL로 저장)
+    """
+    if value is None or isinstance(value, UUID):
+        return value
+    return UUID(value)
+
+
+class ChatWriteBehind:
+    """
+    채팅 메세지 저장을 담당하는 클래스
+    - 비활성화(기본값): 메세지마다 crud.chat 함수로 즉시 커밋
+    - 활성화(CHAT_WRITE_BEHIND): 큐에 적재 후 백그라운드 태스크가 배치 INSERT
+      (사용자 응답은 커밋을 기다리지 않음)
+    """
+    def __init__(self):
+        self.enabled = settings.CHAT_WRITE_BEHIND
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # 모니터링용 카운터
+        self.enqueued = 0
+        self.written = 0
+        self.failed = 0
+        self.batches = 0
+
+    async def start(self):
+        """ write-behind 활성화 시 배치 저장 태스크 시작 """
+        if not self.enabled or self._task is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=settings.CHAT_WRITE_QUEUE_SIZE)
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        """ 큐에 남은 메세지를 모두 저장한 뒤 태스크 종료 """
+        if self._task is None:
+            return
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+
+    async def save_user_chat(
+        self,
+        client_message_id: UUID | str,
+        session_id: UUID,
+        persona_id: Optional[int],
+        content: str
+    ) -> str:
+        """ 사용자 메세지 저장 후 메세지 ID 반환 """
+        client_message_id = as_uuid(client_message_id)
+        if self._task is None:
+            async with get_async_context_db() as db:
+                user_chat = await crud.chat.create_user_chat(
+                    db, client_message_id, session_id, persona_id, content
+                )
+            return str(user_chat.id)
+
+        chat_row = self._chat_row(client_message_id, session_id, persona_id, True, content)
+        await self._enqueue((chat_row, None))
+        return str(chat_row["id"])
+
+    async def save_chatbot_chat(
+        self,
+        session_id: UUID,
+        persona_id: Optional[int],
+        content: str,
+        prompt_chat_id: Optional[UUID | str],
+        tool_name: Optional[str],
+        tool_metadata: Optional[dict]
+    ) -> str:
+        """ 챗봇 응답(Chat + ChatbotResponse) 저장 후 메세지 ID 반환 """
+        prompt_chat_id = as_uuid(prompt_chat_id)
+        if self._task is None:
+            async with get_async_context_db() as db:
+                bot_chat = await crud.chat.create_chatbot_chat(
+                    db, session_id, persona_id, content,
+                    prompt_chat_id, tool_name, tool_metadata
+                )
+            return str(bot_chat.id)
+
+        chat_row = self._chat_row(uuid4(), session_id, persona_id, False, content)
+        response_row = {
+            "chat_id": chat_row["id"],
+            # prompt_chat_id/prompt_chat_created_at은 RESPONSE_INSERT에서 prompt_id, session_id로 채움
+            "prompt_id": prompt_chat_id,
+            "session_id": session_id,
+            "is_helpful": None,
+            "source_tool": tool_name,
+            "response_payload": tool_metadata,
+            "created_at": chat_row["created_at"] # 챗봇 메세지와 같은 월 파티션에 저장
+        }
+        await self._enqueue((chat_row, response_row))
+        return str(chat_row["id"])
+
+    def stats(self) -> Dict[str, int | bool]:
+        """ 큐 적재/저장 현황 """
+        return {
+            "enabled": self._task is not None,
+            "pending": self._queue.qsize() if self._queue else 0,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "failed": self.failed,
+            "batches": self.batches
+        }
+
+    @staticmethod
+    def _chat_row(
+        chat_id: UUID,
+        session_id: UUID,
+        persona_id: Optional[int],
+        is_user: bool,
+        content: str
+    ) -> Dict[str, Any]:
+        # 배치 단위로 server_default(now())가 같은 값이 되지 않도록 적재 시각을 직접 기록
+        return {
+            "id": chat_id,
+            "session_id": session_id,
+            "persona_id": persona_id,
+            "is_user": is_user,
+            "content": content,
+            "created_at": datetime.now(timezone.utc)
+        }
+
+    async def _enqueue(self, row: PendingRow):
+        # 큐가 가득 찬 경우 대기 (DB 지연 시 자연스러운 backpressure)
+        await self._queue.put(row)
+        self.enqueued += 1
+
+    async def _run(self):
+        """ 큐에서 메세지를 모아 최대 CHAT_WRITE_BATCH_SIZE 단위로 저장 """
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                break
+            batch: List[PendingRow] = [item]
+
+            # 배치가 덜 찼으면 FLUSH_INTERVAL 동안 추가 메세지를 기다림
+            stopping = self._drain(batch)
+            if not stopping and len(batch) < settings.CHAT_WRITE_BATCH_SIZE:
+                await asyncio.sleep(settings.CHAT_WRITE_FLUSH_INTERVAL)
+                stopping = self._drain(batch)
+
+            await self._flush(batch)
+
+    def _drain(self, batch: List[PendingRow]) -> bool:
+        """ 큐에 쌓인 메세지를 배치에 추가하고 종료 신호 수신 여부 반환 """
+        while len(batch) < settings.CHAT_WRITE_BATCH_SIZE:
+            try:
+                item = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return False
+            if item is _STOP:
+                return True
+            batch.append(item)
+        return False
+
+    async def _flush(self, batch: List[PendingRow]):
+        chat_rows = [chat_row for chat_row, _ in batch]
+        response_rows = [res_row for _, res_row in batch if res_row is not None]
+        try:
+            async with get_async_context_db() as db:
+                duplicates = await crud.chat.bulk_create_chats(db, chat_rows, response_rows)
+            if duplicates:
+                # 이미 저장된 ID의 사용자 메세지 (클라이언트 message_id 재사용)
+                logger.warning("chat_writer.duplicate_chat_ids", chat_ids=[str(chat_id) for chat_id in duplicates])
+            self.written += len(batch)
+            self.batches += 1
+            return
+        except Exception as e:
+            logger.error("chat_writer.batch_failed", rows=len(batch), error=str(e))
+
+        # 배치 실패 시 문제 행만 제외하도록 메세지 단위로 재시도
+        for chat_row, res_row in batch:
+            try:
+                async with get_async_context_db() as db:
+                    await crud.chat.bulk_create_chats(
+                        db, [chat_row], [res_row] if res_row else []
+                    )
+                self.written += 1
+            except Exception as e:
+                self.failed += 1
+                logger.error("chat_writer.row_failed", chat_id=chat_row['id'], error=str(e))
+
+chat_writer = ChatWriteBehind()
@@ -1,5 +1,7 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from typing import Dict, List, Optional
+
 class Settings(BaseSettings):
     # 시스템 환경변수 적용
     FRONTEND_HOST: str
@@ -10,6 +12,115 @@ class Settings(BaseSettings):
     ENVIRONMENT: str = "development"
     MCP_SERVER_URL: str
 
+    # 로그 레벨 (DEBUG 설정 시 LLM/MCP 응답 페이로드 등 본문까지 기록)
+    LOG_LEVEL: str = "INFO"
+    # 이벤트별 로그 샘플링 비율 (JSON 객체, 예: {"ws.message_received": 0.1})
+    LOG_SAMPLE_RATES: Dict[str, float] = {}
+
+    # JSON 직렬화 (WebSocket 프레임, LLM/MCP 응답 파싱, REST 응답) - auto | orjson | stdlib
+    JSON_BACKEND: str = "auto" # auto: orjson 패키지가 설치된 경우 orjson 사용
+
+    # HTTP 클라이언트 커넥션 풀 설정 (LLM/MCP 서버 공용)
+    HTTPX_MAX_CONNECTIONS: int = 100
+    HTTPX_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    HTTPX_KEEPALIVE_EXPIRY: float = 30.0
+    HTTPX_HTTP2: bool = False # h2 패키지가 설치된 경우에만 적용
+
+    # 업스트림별 타임아웃 (read 미지정 시 HTTPX_TIMEOUT 사용)
+    LLM_CONNECT_TIMEOUT: float = 5.0
+    LLM_READ_TIMEOUT: Optional[float] = None
+    LLM_POOL_TIMEOUT: float = 10.0
+    MCP_CONNECT_TIMEOUT: float = 5.0
+    MCP_READ_TIMEOUT: Optional[float] = None
+    MCP_POOL_TIMEOUT: float = 10.0
+
+    # DB 커넥션 풀 (채팅 DB / FAQ DB 엔진별 크기, 나머지는 공용)
+    #   - 기본값은 SQLAlchemy 기본값과 동일 (pool_size 5, max_overflow 10, pool_timeout 30, pool_recycle -1)
+    #   - WebSocket 메세지 1건당 최대 3회 체크아웃하므로 동시 소켓 수에 맞춰 조정
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    FAQ_DB_POOL_SIZE: int = 5
+    FAQ_DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0 # 풀이 가득 찼을 때 커넥션 반납 대기 최대 시간(초)
+    DB_POOL_RECYCLE: int = -1 # 커넥션 최대 사용 시간(초, 방화벽/LB 유휴 연결 끊김 시 설정 / -1이면 비활성화)
+    DB_POOL_PRE_PING: bool = False # 체크아웃마다 연결 확인 쿼리 실행 (왕복 1회 추가)
+    # asyncpg prepared statement 캐시 크기 (pgbouncer transaction 모드 사용 시 0)
+    DB_STATEMENT_CACHE_SIZE: int = 100
+
+    # 준비 상태 확인 (/api/health/ready, 백그라운드 주기 확인 결과만 반환)
+    READINESS_PROBE_INTERVAL: float = 5.0
+    READINESS_PROBE_TIMEOUT: float = 2.0
+    READINESS_STALE_AFTER: float = 30.0 # 마지막 확인 결과가 이보다 오래되면 준비되지 않음으로 판단
+    READINESS_CRITICAL: List[str] = ["chat_db", "llm"] # 실패 시 503을 반환하는 핵심 의존성
+
+    # 업스트림 동시 호출 제한 (노드 단위, 초과분은 대기열에서 최대 대기 시간까지 대기 후 거절)
+    LLM_MAX_CONCURRENCY: int = 32
+    LLM_MAX_QUEUE: int = 128
+    LLM_MAX_QUEUE_WAIT: float = 10.0
+    MCP_MAX_CONCURRENCY: int = 32
+    MCP_MAX_QUEUE: int = 128
+    MCP_MAX_QUEUE_WAIT: float = 10.0
+
+    # 채팅 메세지 write-behind 저장 (활성화 시 큐에 모아 배치 INSERT)
+    CHAT_WRITE_BEHIND: bool = False
+    CHAT_WRITE_BATCH_SIZE: int = 500
+    CHAT_WRITE_FLUSH_INTERVAL: float = 0.05
+    CHAT_WRITE_QUEUE_SIZE: int = 10000
+
+    # FAQ/용어 조회수 집계 후 일괄 반영 주기(초)
+    VIEW_COUNT_FLUSH_INTERVAL: float = 5.0
+
+    # FAQ/용어 답변 캐시 (TTL마다 FAQ DB에서 재적재)
+    QNA_CACHE_TTL: float = 300.0
+    QNA_CACHE_MAX_ENTRIES: int = 1000
+    # FAQ/용어 유사 질문 매칭 (1.0이면 정규화 후 완전 일치만 허용)
+    QNA_MATCH_THRESHOLD: float = 0.85
+    QNA_MATCH_NGRAM: int = 2
+
+    # 페르소나 카탈로그 (TTL마다 DB에서 재적재, 목록 응답 Cache-Control max-age)
+    PERSONA_CATALOG_TTL: float = 300.0
+    PERSONA_CATALOG_MAX_AGE: int = 60
+
+    # 채팅 기록 조회 (페이지당 최대 행 수, NDJSON 스트리밍 시 커서에서 한 번에 읽는 행 수)
+    HISTORY_PAGE_MAX_LIMIT: int = 200
+    HISTORY_STREAM_BATCH_SIZE: int = 500
+
+    # Chat/ChatbotResponse 월별 파티션 (서버 시작 시, 이후 주기마다 없는 파티션 생성)
+    CHAT_PARTITION_PREMAKE_MONTHS: int = 3 # 이번 달 이후 미리 만들어 둘 파티션 수
+    CHAT_PARTITION_CHECK_INTERVAL: float = 21600.0
+    # 파티션 보관 (python -m core.partitions archive, 기간이 지난 월 파티션을 gzip CSV로 보관 후 삭제)
+    CHAT_RETENTION_MONTHS: int = 12 # 이번 달 이전 보관 개월 수 (0이면 보관하지 않음)
+    CHAT_ARCHIVE_DIR: str = "archive"
+    CHAT_ARCHIVE_COMPRESSLEVEL: int = 6
+    # 메세지 없는 세션 정리 (python -m core.partitions purge-sessions)
+    EMPTY_SESSION_RETENTION_DAYS: float = 7.0
+    EMPTY_SESSION_PURGE_BATCH_SIZE: int = 1000
+
+    # 비개인화 LLM 응답 캐시 (login_required/card_list 포함 응답은 제외)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_TTL: float = 300.0
+    LLM_CACHE_MAX_ENTRIES: int = 5000
+    LLM_CACHE_EXCLUDED_TOOLS: List[str] = [] # 캐싱하지 않을 툴 이름 (JSON 배열)
+    # 동일 질문 동시 디스패치 병합 (single-flight)
+    LLM_COALESCE_ENABLED: bool = True
+    # 클라이언트가 stream을 요청한 메세지에 대해 LLM 스트리밍 응답 중계
+    LLM_STREAMING_ENABLED: bool = True
+
+    # WebSocket 세션 소유 워커 레지스트리 (memory: 단일 프로세스, postgres: 워커/노드 간 공유)
+    SESSION_REGISTRY_BACKEND: str = "memory"
+    SESSION_REGISTRY_HEARTBEAT_INTERVAL: float = 10.0 # 3회 누락 시 워커와 소유 세션 무효화
+
+    # WebSocket 세션별 메세지 파이프라이닝 (응답은 수신 순서대로 전송)
+    WS_SESSION_CONCURRENCY: int = 2 # 세션당 동시 처리 메세지 수
+    WS_SESSION_QUEUE_SIZE: int = 8  # 세션당 처리 대기 메세지 수 (초과 시 수신 대기)
+    WS_MSGPACK_ENABLED: bool = True # msgpack 서브프로토콜 협상 허용 (msgpack 패키지가 설치된 경우에만 적용)
+    # card_list 카드 참조 전송 (?card_refs=true로 연결한 클라이언트만, 이미 보낸 카드는 card_ref만 전송)
+    WS_CARD_REFS_ENABLED: bool = True
+    WS_CARD_REGISTRY_MAX: int = 256 # 연결당 기억하는 카드 수
+    # 큰 프레임 압축 (?compress=deflate로 연결한 클라이언트만, 이 크기(bytes) 이상 프레임을 raw deflate로 전송 / 0이면 비활성화)
+    WS_COMPRESSION_THRESHOLD: int = 4096
+    WS_COMPRESSION_LEVEL: int = 6
+
     # .env 환경변수 파일 로드
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,16 +1,87 @@
 from contextlib import asynccontextmanager
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlmodel.ext.asyncio.session import AsyncSession as SQLModelAsyncSession
 
-from typing import Annotated, AsyncGenerator
+import time
+
+from typing import Annotated, AsyncGenerator, Dict
 
 from core.config import settings
+from core.metrics import db_pool_checkout_seconds, db_pool_timeouts_total
 from models import Persona # 테이블 생성을 위해 임포트
 
 
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    커넥션 체크아웃 대기시간/타임아웃을 메트릭으로 기록하는 커넥션 풀
+    - 엔진별 이름/설정된 max_overflow는 서브클래스 속성으로 지정 (dispose 후 풀 재생성 시에도 유지)
+    """
+    engine_name = ""
+    configured_max_overflow = 0
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except sa_exc.TimeoutError:
+            # pool_size + max_overflow를 모두 사용 중이고 pool_timeout 동안 반납되지 않음
+            db_pool_timeouts_total.labels(self.engine_name).inc()
+            raise
+        db_pool_checkout_seconds.labels(self.engine_name).observe(time.perf_counter() - start)
+        return connection
+
+
+# 이름별 엔진 (풀 현황 조회용)
+engines: Dict[str, AsyncEngine] = {}
+
+def create_pooled_engine(name: str, database_url: str, pool_size: int, max_overflow: int) -> AsyncEngine:
+    """
+    풀 설정(DB_POOL_*)과 체크아웃 계측이 적용된 비동기 엔진 생성
+    - asyncpg 사용 시 prepared statement 캐시 크기(DB_STATEMENT_CACHE_SIZE) 적용
+    """
+    url = make_url(database_url)
+    if url.get_driver_name() == "asyncpg":
+        url = url.update_query_dict(
+            {"prepared_statement_cache_size": str(settings.DB_STATEMENT_CACHE_SIZE)}
+        )
+    pool_class = type(
+        f"{name.title()}InstrumentedPool", (InstrumentedPool,),
+        {"engine_name": name, "configured_max_overflow": max_overflow}
+    )
+    engines[name] = create_async_engine(
+        url,
+        poolclass=pool_class,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING
+    )
+    return engines[name]
+
+def pool_stats() -> Dict[str, Dict[str, int]]:
+    """ 엔진별 커넥션 풀 점유 현황 """
+    result = {}
+    for name, async_engine in engines.items():
+        pool = async_engine.pool
+        result[name] = {
+            "pool_size": pool.size(),
+            "in_use": pool.checkedout(),
+            "idle": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "max_overflow": pool.configured_max_overflow
+        }
+    return result
+
+
 # 비동기 DB 엔진 생성
-engine = create_async_engine(settings.DATABASE_URL)
+engine = create_pooled_engine(
+    "chat", settings.DATABASE_URL, settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW
+)
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """ 비동기 DB 세션 생성 및 반환 """
@@ -24,4 +95,4 @@ async def get_async_context_db() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 # 타입힌팅을 통한 DB 세션 의존성 주입
-SessionDep = Annotated[AsyncSession, Depends(get_db)]
\ No newline at end of file
+SessionDep = Annotated[AsyncSession, Depends(get_db)]
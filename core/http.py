@@ -0,0 +1,155 @@
+import httpx
+
+from typing import Dict, Optional
+
+from core.config import settings
+from core.log import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import h2  # noqa: F401  HTTP/2 지원 여부 확인용
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class _CountingStream(httpx.AsyncByteStream):
+    """ 응답 본문을 끝까지 읽거나 닫을 때 진행 중 요청 수를 감소시키는 스트림 래퍼 """
+    def __init__(self, stream: httpx.AsyncByteStream, on_close):
+        self._stream = stream
+        self._on_close = on_close
+        self._closed = False
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self):
+        if not self._closed:
+            self._closed = True
+            self._on_close()
+        await self._stream.aclose()
+
+
+class CountingTransport(httpx.AsyncBaseTransport):
+    """
+    요청 시작부터 응답 본문 종료(스트리밍 응답 포함)까지를 진행 중 요청으로 세는 트랜스포트 래퍼
+    - httpx/httpcore 내부 커넥션 풀 상태를 읽지 않고 이 래퍼를 지나는 요청만 집계
+    """
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+        self.in_flight = 0
+        self.requests = 0
+        self.errors = 0
+
+    def _release(self):
+        self.in_flight -= 1
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.requests += 1
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            self.in_flight -= 1
+            self.errors += 1
+            raise
+        response.stream = _CountingStream(response.stream, self._release)
+        return response
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+
+class HTTPClientRegistry:
+    """
+    업스트림(LLM 서버, MCP 서버)별 공유 httpx.AsyncClient를 관리하는 클래스
+    - lifespan 시작 시 start(), 종료 시 close() 호출
+    - 요청마다 클라이언트를 새로 만들지 않고 커넥션 풀(keep-alive)을 재사용
+    """
+    def __init__(self):
+        self._clients: Dict[str, httpx.AsyncClient] = {}
+        self._transports: Dict[str, CountingTransport] = {}
+        self._http2: Dict[str, bool] = {}
+
+    def _build_client(
+        self,
+        name: str,
+        connect_timeout: float,
+        read_timeout: Optional[float],
+        pool_timeout: float
+    ) -> httpx.AsyncClient:
+        """ 업스트림 전용 커넥션 풀과 타임아웃을 가진 클라이언트 생성 """
+        http2 = settings.HTTPX_HTTP2 and HTTP2_AVAILABLE
+        if settings.HTTPX_HTTP2 and not HTTP2_AVAILABLE:
+            logger.warning("http.http2_unavailable", client=name, detail="h2 패키지가 없어 HTTP/1.1로 동작합니다")
+
+        limits = httpx.Limits(
+            max_connections=settings.HTTPX_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTPX_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTPX_KEEPALIVE_EXPIRY
+        )
+        timeout = httpx.Timeout(
+            settings.HTTPX_TIMEOUT, # write 타임아웃 기본값
+            connect=connect_timeout,
+            read=read_timeout if read_timeout is not None else settings.HTTPX_TIMEOUT,
+            pool=pool_timeout
+        )
+        transport = CountingTransport(httpx.AsyncHTTPTransport(limits=limits, http2=http2))
+        self._transports[name] = transport
+        self._http2[name] = http2
+
+        return httpx.AsyncClient(transport=transport, timeout=timeout)
+
+    async def start(self):
+        """ LLM/MCP 업스트림 클라이언트 생성 """
+        self._clients["llm"] = self._build_client(
+            "llm",
+            settings.LLM_CONNECT_TIMEOUT,
+            settings.LLM_READ_TIMEOUT,
+            settings.LLM_POOL_TIMEOUT
+        )
+        self._clients["mcp"] = self._build_client(
+            "mcp",
+            settings.MCP_CONNECT_TIMEOUT,
+            settings.MCP_READ_TIMEOUT,
+            settings.MCP_POOL_TIMEOUT
+        )
+
+    async def close(self):
+        """ 모든 클라이언트의 커넥션 풀 종료 """
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients.clear()
+        self._transports.clear()
+        self._http2.clear()
+
+    def get(self, name: str) -> httpx.AsyncClient:
+        """ 업스트림 이름(llm, mcp)에 해당하는 공유 클라이언트 반환 """
+        client = self._clients.get(name)
+        if client is None:
+            raise RuntimeError(f"HTTP client '{name}' is not started")
+        return client
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        업스트림별 진행 중 요청 수와 커넥션 풀 설정값
+        - queued_requests: HTTP/1.1은 커넥션당 요청 1개이므로 max_connections를 넘는 진행 중 요청은 풀 대기
+          (HTTP/2는 한 커넥션에서 여러 요청을 다중화하므로 0으로 보고)
+        """
+        result = {}
+        for name, transport in self._transports.items():
+            queued = 0 if self._http2[name] else max(0, transport.in_flight - settings.HTTPX_MAX_CONNECTIONS)
+            result[name] = {
+                "in_flight": transport.in_flight,
+                "queued_requests": queued,
+                "requests": transport.requests,
+                "errors": transport.errors,
+                "http2": self._http2[name],
+                "max_connections": settings.HTTPX_MAX_CONNECTIONS,
+                "max_keepalive_connections": settings.HTTPX_MAX_KEEPALIVE_CONNECTIONS
+            }
+        return result
+
+http_clients = HTTPClientRegistry()
@@ -0,0 +1,249 @@
+import logging
+import time
+
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Union
+from uuid import UUID
+
+import httpx
+
+from pydantic import ValidationError
+
+from core import serialization
+from core.admission import llm_admission
+from core.config import settings
+from core.http import http_clients
+from core.llm_cache import CacheKey, llm_cache
+from core.log import get_logger
+from core.metrics import llm_dispatch_errors_total, llm_dispatch_seconds
+from core.singleflight import SingleFlight
+from schemas.llm import DispatchResponse, dispatch_response_adapter
+
+logger = get_logger(__name__)
+
+
+LLM_DISPATCH_PATH = "/llm/mcp-router/dispatch"
+
+# 스트리밍 요청 시 허용하는 응답 형식 (LLM 서버가 스트리밍을 지원하지 않으면 JSON으로 응답)
+STREAM_ACCEPT = "application/x-ndjson, text/event-stream;q=0.9, application/json;q=0.5"
+
+# 동일 질문 동시 디스패치 병합용 (키: LLM 응답 캐시 키)
+llm_singleflight = SingleFlight()
+
+
+def get_dispatch_endpoint() -> str:
+    """ LLM 서버 MCP 라우터 디스패치 URL """
+    return f"{settings.LLMSERVER_URL.rstrip('/')}{LLM_DISPATCH_PATH}"
+
+
+def parse_dispatch_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """ 파싱된 LLM 서버 응답(dict)에서 사용자에게 전달할 필드를 추출합니다. """
+    try:
+        response = dispatch_response_adapter.validate_python(payload)
+    except ValidationError as e:
+        raise ValueError(f"LLM 서버 응답 형식이 올바르지 않습니다: {e.errors(include_url=False)}")
+    return build_reply(response)
+
+
+def parse_dispatch_body(body: Union[str, bytes]) -> Dict[str, Any]:
+    """ LLM 서버 응답 본문(bytes)을 바로 스키마 검증하여 사용자에게 전달할 필드를 추출합니다. """
+    try:
+        response = serialization.validate_json(dispatch_response_adapter, body)
+    except ValidationError as e:
+        raise ValueError(f"LLM 서버 응답 형식이 올바르지 않습니다: {e.errors(include_url=False)}")
+    return build_reply(response)
+
+
+def build_reply(response: DispatchResponse) -> Dict[str, Any]:
+    """
+    검증된 LLM 서버 응답에서 사용자에게 전달할 필드를 추출합니다.
+    - 툴 응답: message, login_required, related_questions, card_list, tool_name (응답에 있는 필드만)
+    - 표준 응답: message
+    """
+    reply = {}
+    # 툴이 호출된 응답인 경우
+    if response.tool_response is not None:
+        tool_response = response.tool_response
+        content = tool_response.tool_response_content
+        reply['message'] = content.answer
+        fields_set = content.model_fields_set
+        # 로그인이 필요한 툴 호출인 경우
+        if 'login_required' in fields_set:
+            reply['login_required'] = content.login_required
+        # 관련 FAQ가 있는 경우 FAQ 답변도 함께 전송
+        if 'relatedQuestions' in fields_set:
+            reply['related_questions'] = content.relatedQuestions
+        # 카드 리스트가 있는 경우 함께 전송
+        if 'card_list' in fields_set:
+            reply['card_list'] = content.card_list
+        # 호출된 툴 정보 파싱
+        if 'tool_name' in tool_response.model_fields_set:
+            reply['tool_name'] = tool_response.tool_name
+    # 챗봇 표준 응답인 경우
+    else:
+        reply['message'] = response.answer
+
+    if not isinstance(reply['message'], str) or not reply['message']:
+        raise ValueError("LLM 서버 응답 형식이 올바르지 않습니다.")
+    return reply
+
+
+async def dispatch(query: str, session_id: UUID, persona_id: Optional[int]) -> Dict[str, Any]:
+    """
+    사용자 질문을 LLM 서버 MCP 라우터로 전달하고 파싱된 응답을 반환합니다.
+    - 비개인화 응답은 LLM 응답 캐시에서 먼저 조회
+    - 같은 질문이 동시에 들어오면 업스트림 호출 하나의 결과를 공유
+      (반환값은 호출자별 복사본이므로 message_id 등은 각자 추가)
+    - 공유 대상은 캐싱 가능한 응답뿐이며, 먼저 호출한 세션의 응답이 개인화 응답
+      (login_required, card_list, 제외 툴)이면 합류한 세션은 직접 업스트림을 호출
+    """
+    cache_key = llm_cache.make_key(query, persona_id)
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        logger.info("llm.cache_hit", session_id=session_id)
+        return cached
+
+    if not settings.LLM_COALESCE_ENABLED or not cache_key[0]:
+        return await _dispatch_upstream(query, session_id, cache_key)
+
+    reply = await llm_singleflight.do(
+        cache_key,
+        lambda: _dispatch_upstream(query, session_id, cache_key),
+        shareable=llm_cache.is_cacheable
+    )
+    return dict(reply)
+
+
+async def _dispatch_upstream(query: str, session_id: UUID, cache_key: CacheKey) -> Dict[str, Any]:
+    """ LLM 서버 호출 후 응답 파싱 및 캐시 저장 (동시 호출 제한 초과 시 AdmissionRejected) """
+    reply = await _call_upstream(lambda: _post_dispatch(query, session_id))
+    llm_cache.put(cache_key, reply)
+    return reply
+
+
+async def _post_dispatch(query: str, session_id: UUID) -> Dict[str, Any]:
+    response = await http_clients.get("llm").post(
+        get_dispatch_endpoint(),
+        json={
+            "query": query,
+            "session_id": str(session_id)
+        }
+    )
+    response.raise_for_status()
+    if logger.is_enabled(logging.DEBUG):
+        logger.debug("llm.response_payload", session_id=session_id, payload=serialization.loads(response.content))
+    return parse_dispatch_body(response.content)
+
+
+async def _call_upstream(call: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+    """ 동시 호출 제한 슬롯 안에서 LLM 서버 호출, 툴별 지연시간/오류 수 기록 """
+    async with llm_admission.slot():
+        start = time.perf_counter()
+        try:
+            reply = await call()
+        except Exception as e:
+            llm_dispatch_errors_total.labels(type(e).__name__).inc()
+            raise
+        llm_dispatch_seconds.labels(reply.get("tool_name", "none")).observe(time.perf_counter() - start)
+    return reply
+
+
+async def dispatch_stream(
+    query: str,
+    session_id: UUID,
+    persona_id: Optional[int],
+    on_delta: Callable[[str], Awaitable[None]]
+) -> Dict[str, Any]:
+    """
+    LLM 서버에 스트리밍 응답을 요청하고, 수신한 텍스트 조각마다 on_delta를 호출합니다.
+    - NDJSON / SSE 응답: {"delta": "..."} 조각을 전달하고, 마지막 전체 페이로드(answer/tool_response)로 응답 구성
+    - JSON 응답 (스트리밍 미지원 서버): 기존 디스패치와 동일하게 처리
+    반환값은 dispatch()와 같은 형식이며 message에는 조립된 전체 텍스트가 들어갑니다.
+    동시 호출 제한 초과 시 AdmissionRejected가 발생합니다.
+    """
+    cache_key = llm_cache.make_key(query, persona_id)
+    cached = llm_cache.get(cache_key)
+    if cached is not None:
+        logger.info("llm.cache_hit", session_id=session_id)
+        return cached
+
+    reply = await _call_upstream(lambda: _stream_dispatch(query, session_id, on_delta))
+    llm_cache.put(cache_key, reply)
+    return reply
+
+
+async def _stream_dispatch(
+    query: str,
+    session_id: UUID,
+    on_delta: Callable[[str], Awaitable[None]]
+) -> Dict[str, Any]:
+    async with http_clients.get("llm").stream(
+        "POST",
+        get_dispatch_endpoint(),
+        json={
+            "query": query,
+            "session_id": str(session_id),
+            "stream": True
+        },
+        headers={"Accept": STREAM_ACCEPT}
+    ) as response:
+        response.raise_for_status()
+        content_type = response.headers.get("content-type", "").split(";")[0].strip()
+
+        if content_type == "text/event-stream":
+            chunks = _iter_sse(response)
+        elif content_type in ("application/x-ndjson", "application/jsonl", "application/ndjson"):
+            chunks = _iter_ndjson(response)
+        else:
+            body = await response.aread()
+            if logger.is_enabled(logging.DEBUG):
+                logger.debug("llm.response_payload", session_id=session_id, payload=serialization.loads(body))
+            return parse_dispatch_body(body)
+
+        deltas: List[str] = []
+        final_payload: Optional[Dict[str, Any]] = None
+        async for chunk in chunks:
+            if not isinstance(chunk, dict):
+                continue
+            if isinstance(chunk.get("delta"), str):
+                deltas.append(chunk["delta"])
+                await on_delta(chunk["delta"])
+            elif "answer" in chunk or "tool_response" in chunk:
+                final_payload = chunk
+
+    streamed_text = "".join(deltas)
+    logger.info("llm.stream_completed", session_id=session_id, chunks=len(deltas))
+    logger.debug("llm.response_payload", session_id=session_id, payload=final_payload)
+    if final_payload is None:
+        final_payload = {"answer": streamed_text}
+    elif not final_payload.get("tool_response") and not final_payload.get("answer"):
+        # 최종 페이로드에 답변이 없으면 스트리밍된 텍스트로 채움
+        final_payload = {**final_payload, "answer": streamed_text}
+
+    return parse_dispatch_payload(final_payload)
+
+
+async def _iter_ndjson(response: httpx.Response) -> AsyncIterator[Any]:
+    """ 줄 단위 JSON 스트림 파싱 """
+    async for line in response.aiter_lines():
+        line = line.strip()
+        if line:
+            yield serialization.loads(line)
+
+
+async def _iter_sse(response: httpx.Response) -> AsyncIterator[Any]:
+    """ Server-Sent Events 스트림의 data 필드를 JSON으로 파싱 """
+    data_lines: List[str] = []
+    async for line in response.aiter_lines():
+        if line.startswith("data:"):
+            data_lines.append(line[5:].lstrip())
+            continue
+        if line.strip() or not data_lines:
+            continue # event/id/주석 라인 무시
+        # 빈 줄에서 이벤트 종료
+        data = "\n".join(data_lines)
+        data_lines = []
+        if data == "[DONE]":
+            return
+        yield serialization.loads(data)
+    if data_lines and (data := "\n".join(data_lines)) != "[DONE]":
+        yield serialization.loads(data)
@@ -0,0 +1,91 @@
+import time
+
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from core.config import settings
+from core.qna_matcher import normalize_text
+
+
+# 세션마다 달라지는 응답 필드 (포함 시 캐싱하지 않음)
+SESSION_SPECIFIC_FIELDS = ("login_required", "card_list")
+
+# (정규화된 질문, persona_id)
+CacheKey = Tuple[str, Optional[int]]
+
+
+class LLMResponseCache:
+    """
+    비개인화 LLM 디스패치 응답 캐시
+    - 키: (정규화된 질문, persona_id)
+    - login_required/card_list가 포함된 응답, 제외 툴(LLM_CACHE_EXCLUDED_TOOLS) 응답은 저장하지 않음
+    - LLM_CACHE_TTL 경과 시 만료, LLM_CACHE_MAX_ENTRIES 초과 시 LRU 제거
+    """
+    def __init__(self):
+        self.enabled = settings.LLM_CACHE_ENABLED
+        self.ttl = settings.LLM_CACHE_TTL
+        self.max_entries = settings.LLM_CACHE_MAX_ENTRIES
+        self.excluded_tools = frozenset(settings.LLM_CACHE_EXCLUDED_TOOLS)
+        self._data: OrderedDict[CacheKey, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        # 모니터링용 카운터
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.skips = 0
+
+    @staticmethod
+    def make_key(query: str, persona_id: Optional[int]) -> CacheKey:
+        """ 캐시 키 생성 (공백·문장부호 차이는 같은 질문으로 취급) """
+        return normalize_text(query), persona_id
+
+    def get(self, key: CacheKey) -> Optional[Dict[str, Any]]:
+        """ 만료되지 않은 응답의 복사본 반환 """
+        if not self.enabled:
+            return None
+        entry = self._data.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return dict(entry[1])
+
+    def is_cacheable(self, reply: Dict[str, Any]) -> bool:
+        """ 세션 전용 데이터가 없고 제외 툴이 아닌 응답인지 확인 """
+        if any(field in reply for field in SESSION_SPECIFIC_FIELDS):
+            return False
+        return reply.get("tool_name") not in self.excluded_tools
+
+    def put(self, key: CacheKey, reply: Dict[str, Any]) -> bool:
+        """ 캐싱 가능한 응답이면 저장 후 True 반환 """
+        if not self.enabled or not key[0]:
+            return False
+        if not self.is_cacheable(reply):
+            self.skips += 1
+            return False
+        self._data[key] = (time.monotonic() + self.ttl, dict(reply))
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+        self.stores += 1
+        return True
+
+    def clear(self):
+        self._data.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """ 캐시 크기 및 히트율 """
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._data),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "skips": self.skips,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+llm_cache = LLMResponseCache()
@@ -0,0 +1,137 @@
+import atexit
+import json
+import logging
+import queue
+import random
+import sys
+
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional, TextIO
+
+from core.config import settings
+
+
+# 애플리케이션 로거 최상위 이름 (uvicorn 등 외부 로거와 분리)
+ROOT_LOGGER_NAME = "chatbot"
+
+
+class JsonLineFormatter(logging.Formatter):
+    """ 한 줄에 하나의 JSON 객체로 로그 출력 (ts, level, logger, event + 구조화 필드) """
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname.lower(),
+            "logger": record.name,
+            "event": record.getMessage()
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """ 레코드를 그대로 큐에 적재 (JSON 직렬화/출력은 리스너 스레드에서 수행) """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class StructuredLogger:
+    """
+    이벤트 이름 + 키워드 필드 형태의 구조화 로거
+    - 호출 스레드(이벤트 루프)에서는 레벨/샘플링 확인 후 큐 적재만 수행
+    - LOG_SAMPLE_RATES에 등록된 이벤트는 지정 비율만 기록
+    - 필드 값은 리스너 스레드에서 직렬화되므로 기록 후 변경하지 않는 값을 전달
+    """
+    __slots__ = ("_logger",)
+
+    def __init__(self, logger: logging.Logger):
+        self._logger = logger
+
+    def is_enabled(self, level: int) -> bool:
+        return self._logger.isEnabledFor(level)
+
+    def _log(self, level: int, event: str, fields: Dict[str, Any], exc_info: bool = False):
+        if not self._logger.isEnabledFor(level):
+            return
+        rate = _sample_rates.get(event)
+        if rate is not None and random.random() >= rate:
+            return
+        # Logger.log()의 호출 위치 탐색(스택 순회)을 생략하고 레코드를 직접 생성
+        record = self._logger.makeRecord(
+            self._logger.name, level, "", 0, event, (),
+            sys.exc_info() if exc_info else None,
+            extra={"fields": fields}
+        )
+        self._logger.handle(record)
+
+    def debug(self, event: str, **fields: Any):
+        self._log(logging.DEBUG, event, fields)
+
+    def info(self, event: str, **fields: Any):
+        self._log(logging.INFO, event, fields)
+
+    def warning(self, event: str, **fields: Any):
+        self._log(logging.WARNING, event, fields)
+
+    def error(self, event: str, **fields: Any):
+        self._log(logging.ERROR, event, fields)
+
+    def exception(self, event: str, **fields: Any):
+        """ except 블록에서 호출 시 traceback 포함 """
+        self._log(logging.ERROR, event, fields, exc_info=True)
+
+
+_sample_rates: Dict[str, float] = {}
+_listener: Optional[QueueListener] = None
+
+
+def configure_logging(
+    level: str = "INFO",
+    sample_rates: Optional[Dict[str, float]] = None,
+    stream: Optional[TextIO] = None
+) -> QueueListener:
+    """
+    큐 기반 JSON 로깅 설정 (재호출 시 기존 리스너를 멈추고 다시 설정)
+    - 이벤트 루프: QueueHandler로 적재만 수행
+    - 출력 스레드 1개: QueueListener가 JSON 직렬화 후 stream(기본 stdout)에 기록
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+
+    _sample_rates.clear()
+    _sample_rates.update(sample_rates or {})
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JsonLineFormatter())
+
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    root.handlers.clear()
+    root.addHandler(_DeferredQueueHandler(log_queue))
+    root.setLevel(level.upper())
+    root.propagate = False
+
+    _listener = QueueListener(log_queue, output)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging():
+    """ 큐에 남은 로그 출력 후 리스너 종료 """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logger(name: str) -> StructuredLogger:
+    """ 모듈별 구조화 로거 (예: get_logger(__name__)) """
+    return StructuredLogger(logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}"))
+
+configure_logging(settings.LOG_LEVEL, settings.LOG_SAMPLE_RATES)
+atexit.register(shutdown_logging)
@@ -0,0 +1,298 @@
+import math
+import time
+
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from core.log import get_logger
+
+logger = get_logger(__name__)
+
+# 업스트림(LLM/MCP) 응답 지연시간 버킷(초)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0, 300.0)
+# DB 커밋 지연시간 버킷(초)
+DB_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[Any]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class _Timer:
+    """ with 블록 실행 시간을 histogram에 기록 (async 함수 안에서도 사용 가능) """
+    __slots__ = ("_histogram", "_start")
+
+    def __init__(self, histogram: "_HistogramChild"):
+        self._histogram = histogram
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._start)
+
+
+class _Metric:
+    """ 레이블 조합별 child를 보관하는 메트릭 공통 클래스 """
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        if not self.labelnames:
+            self._default = self.labels()
+
+    def labels(self, *values: Any):
+        """ 레이블 값에 해당하는 child 반환 (처음 사용 시 생성) """
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name}: expected labels {self.labelnames}, got {key}")
+            child = self._children[key] = self._new_child()
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def samples(self) -> Iterable[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self.samples())
+        return "\n".join(lines)
+
+
+class _ValueChild:
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0):
+        self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+
+class Counter(_Metric):
+    """ 누적 카운터 (예: 수신 메세지 수 -> rate()로 초당 처리량 계산) """
+    type_name = "counter"
+
+    def _new_child(self):
+        return _ValueChild()
+
+    def inc(self, amount: float = 1.0):
+        self._default.value += amount
+
+    def samples(self) -> Iterable[str]:
+        for key, child in self._children.items():
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(child.value)}"
+
+
+class Gauge(Counter):
+    """ 현재 값 게이지 (set_function 지정 시 수집 시점에 함수 값 사용) """
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._function: Optional[Callable[[], float]] = None
+
+    def set(self, value: float):
+        self._default.value = value
+
+    def dec(self, amount: float = 1.0):
+        self._default.value -= amount
+
+    def set_function(self, function: Callable[[], float]):
+        self._function = function
+
+    def samples(self) -> Iterable[str]:
+        if self._function is not None:
+            self._default.value = self._function()
+        return super().samples()
+
+
+class _HistogramChild:
+    __slots__ = ("upper_bounds", "counts", "sum")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1) # 마지막 칸은 +Inf
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.upper_bounds, value)] += 1
+        self.sum += value
+
+    def time(self) -> _Timer:
+        return _Timer(self)
+
+
+class Histogram(_Metric):
+    """ 지연시간 분포 히스토그램 (버킷별 개수만 누적하므로 기록 비용이 일정) """
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        self.upper_bounds = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.upper_bounds)
+
+    def observe(self, value: float):
+        self._default.observe(value)
+
+    def time(self) -> _Timer:
+        return _Timer(self._default)
+
+    def samples(self) -> Iterable[str]:
+        names = self.labelnames + ("le",)
+        for key, child in self._children.items():
+            cumulative = 0
+            for upper_bound, count in zip(self.upper_bounds + (math.inf,), child.counts):
+                cumulative += count
+                labels = _format_labels(names, key + (_format_value(upper_bound),))
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(child.sum)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class CallbackMetric(_Metric):
+    """
+    수집 시점에 함수를 호출해 값을 읽는 메트릭 (기존 컴포넌트 카운터 노출용, 요청 경로 비용 없음)
+    - 레이블이 없으면 숫자, 있으면 {레이블 값 튜플: 숫자} 반환
+    """
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        type_name: str,
+        function: Callable[[], Any],
+        labelnames: Sequence[str] = ()
+    ):
+        self.type_name = type_name
+        self._function = function
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return None
+
+    def samples(self) -> Iterable[str]:
+        values = self._function()
+        if not self.labelnames:
+            values = {(): values}
+        for key, value in values.items():
+            yield f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+
+
+class MetricsRegistry:
+    """ 메트릭 등록 및 Prometheus 텍스트 형식 출력 """
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Duplicated metric name: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        type_name: str,
+        function: Callable[[], Any],
+        labelnames: Sequence[str] = ()
+    ) -> CallbackMetric:
+        return self.register(CallbackMetric(name, documentation, type_name, function, labelnames))
+
+    def render(self) -> str:
+        blocks: List[str] = []
+        for metric in self._metrics.values():
+            try:
+                blocks.append(metric.render())
+            except Exception as e:
+                logger.warning("metrics.collect_failed", metric=metric.name, error=str(e))
+        return "\n".join(blocks) + "\n"
+
+metrics_registry = MetricsRegistry()
+
+# ----- 채팅 파이프라인 메트릭 -----
+ws_active_connections = metrics_registry.gauge(
+    "ws_active_connections", "Number of WebSocket connections held by this worker"
+)
+ws_messages_total = metrics_registry.counter(
+    "ws_messages_total", "WebSocket chat messages received"
+)
+ws_card_entries_total = metrics_registry.counter(
+    "ws_card_entries_total", "card_list entries sent as full bodies or references", ("kind",)
+)
+ws_compressed_frames_total = metrics_registry.counter(
+    "ws_compressed_frames_total", "WebSocket frames deflated because they exceeded the compression threshold"
+)
+llm_dispatch_seconds = metrics_registry.histogram(
+    "llm_dispatch_duration_seconds", "LLM server dispatch latency", ("tool_name",)
+)
+llm_dispatch_errors_total = metrics_registry.counter(
+    "llm_dispatch_errors_total", "Failed LLM server dispatches", ("reason",)
+)
+mcp_request_seconds = metrics_registry.histogram(
+    "mcp_request_duration_seconds", "MCP server tool call latency", ("tool_name",)
+)
+db_commit_seconds = metrics_registry.histogram(
+    "db_commit_duration_seconds", "Chat DB commit latency", ("function",), DB_BUCKETS
+)
+login_recommend_seconds = metrics_registry.histogram(
+    "login_recommend_duration_seconds", "Login recommendation latency (MCP call to bot frame sent)"
+)
+db_pool_checkout_seconds = metrics_registry.histogram(
+    "db_pool_checkout_wait_seconds", "Time waiting for a pooled DB connection", ("engine",), DB_BUCKETS
+)
+db_pool_timeouts_total = metrics_registry.counter(
+    "db_pool_timeouts_total", "DB connection checkouts that timed out (pool exhausted)", ("engine",)
+)
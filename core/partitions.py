@@ -0,0 +1,465 @@
+"""
+Chat/ChatbotResponse 월별 RANGE 파티션 관리
+
+- ensure: 이번 달부터 CHAT_PARTITION_PREMAKE_MONTHS개월 뒤까지 파티션을 미리 생성
+  (서버 시작 시, 이후 CHAT_PARTITION_CHECK_INTERVAL마다 partition_maintainer가 실행)
+- archive: CHAT_RETENTION_MONTHS가 지난 월 파티션을 분리(DETACH)한 뒤
+  gzip CSV 파일(+ 매니페스트 JSON)로 CHAT_ARCHIVE_DIR에 보관하고 삭제
+    - 오래된 데이터 삭제가 DELETE가 아닌 파티션 단위 DROP이므로 VACUUM 부담이 없음
+    - 복원: gunzip -c Chat_p202401.csv.gz | psql -c '\\copy "Chat" FROM STDIN WITH (FORMAT csv, HEADER)'
+      (ChatbotResponse는 외래키 때문에 같은 달 Chat을 먼저 복원한 뒤 복원)
+- purge-sessions: EMPTY_SESSION_RETENTION_DAYS가 지나도록 메세지가 없는 ChatSession 삭제 (배치 단위 짧은 트랜잭션)
+  (보관된 달에 생성된 세션은 보관 파일 복원을 위해 남겨 둠)
+- maintain: ensure -> archive -> purge-sessions 순서로 실행 (cron 등 주기 작업용)
+- 기존 비파티션 테이블은 core.uuid_migration으로 서비스 중에 전환 (새 파티션 테이블 + 트리거 동기화 + 배치 복사 + 짧은 이름 교체)
+  (전환 전에도 현재 모델이 동작하도록 서버 시작 시 ensure_response_columns로 ChatbotResponse 컬럼만 추가)
+
+Chat.id 유일성
+- 파티션 테이블의 PK/UNIQUE 제약에는 파티션 키가 포함되어야 하므로 PK는 (id, created_at)이고 id만의 전역 UNIQUE 제약은 없음
+- 월 파티션마다 id UNIQUE 인덱스를 만들어 같은 달 안의 중복은 DB가 막고,
+  다른 달과의 중복은 저장 전 조회(crud.chat)로 막음 (동시에 두 달에 걸쳐 저장되는 같은 ID는 막지 못함)
+
+사용법 (프로젝트 루트에서 실행):
+    python -m core.partitions status
+    python -m core.partitions maintain
+    python -m core.partitions archive --retention-months 6 --dry-run
+"""
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+import re
+
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import asyncpg
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from core.config import settings
+from core.db import engine
+from core.log import get_logger
+from crud.chat import SESSION_CLOCK_SKEW
+
+logger = get_logger(__name__)
+
+
+# 월별 파티션 테이블 (같은 달 파티션을 함께 생성/보관)
+PARTITIONED_TABLES = ("Chat", "ChatbotResponse")
+
+# 여러 워커가 동시에 파티션을 만들지 않도록 잡는 advisory lock 키
+PARTITION_LOCK_KEY = 0x43686174
+
+# 월 파티션마다 UNIQUE 인덱스를 만드는 컬럼 (부모 테이블에는 파티션 키 없는 UNIQUE 제약을 만들 수 없음)
+PARTITION_UNIQUE_COLUMNS = {"Chat": "id"}
+
+# 파티션 전환 전(비파티션) ChatbotResponse에 없는, 현재 모델이 저장하는 컬럼
+RESPONSE_COLUMNS = ("created_at", "prompt_chat_created_at")
+
+
+def month_start(value: date | datetime) -> date:
+    """ 해당 월의 1일 """
+    return date(value.year, value.month, 1)
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+def partition_name(table: str, month: date) -> str:
+    """ 월 파티션 이름 (예: Chat_p202501) """
+    return f"{table}_p{month:%Y%m}"
+
+def partition_month(table: str, name: str) -> Optional[date]:
+    """ 파티션 이름에서 월 추출 (이 모듈의 이름 규칙이 아니면 None) """
+    matched = re.fullmatch(rf"{re.escape(table)}_p(\d{{4}})(\d{{2}})", name)
+    if matched is None:
+        return None
+    return date(int(matched.group(1)), int(matched.group(2)), 1)
+
+def months_to_create(today: date, months_ahead: int, months_back: int = 0) -> List[date]:
+    """ 이번 달 기준 months_back개월 전부터 months_ahead개월 뒤까지 """
+    current = month_start(today)
+    return [add_months(current, offset) for offset in range(-months_back, months_ahead + 1)]
+
+def expired_months(months: List[date], today: date, retention_months: int) -> List[date]:
+    """ 이번 달 이전 retention_months개월보다 오래된 월 (retention_months가 0 이하면 없음) """
+    if retention_months <= 0:
+        return []
+    cutoff = add_months(month_start(today), -retention_months)
+    return sorted(month for month in months if month < cutoff)
+
+def create_partition_sql(table: str, month: date) -> str:
+    """ 월 파티션 생성 DDL (경계는 UTC 기준, 인덱스/PK는 부모 테이블에서 자동 생성) """
+    return (
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(table, month)}" PARTITION OF "{table}" '
+        f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{add_months(month, 1).isoformat()} 00:00:00+00')"
+    )
+
+
+def unique_index_sql(table: str, month: date, column: str) -> str:
+    """ 월 파티션의 UNIQUE 인덱스 DDL (예: Chat_p202501_id_key) """
+    name = partition_name(table, month)
+    return f'CREATE UNIQUE INDEX IF NOT EXISTS "{name}_{column}_key" ON "{name}" ({column})'
+
+
+async def is_partitioned(conn: AsyncConnection, table: str) -> bool:
+    relkind = (await conn.execute(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"), {"table": f'"{table}"'}
+    )).scalar()
+    return relkind == "p"
+
+async def list_partitions(conn: AsyncConnection, table: str) -> Dict[str, bool]:
+    """
+    이름 규칙에 맞는 월 파티션 테이블 {이름: 부모 테이블 연결 여부}
+    (중단된 보관 작업이 남긴 분리된 파티션도 포함)
+    """
+    rows = await conn.execute(
+        text(
+            "SELECT c.relname, EXISTS (SELECT 1 FROM pg_inherits i WHERE i.inhrelid = c.oid) AS attached "
+            "FROM pg_class c JOIN pg_namespace n ON n.oid = c.relnamespace "
+            "WHERE n.nspname = current_schema() AND c.relkind = 'r' AND starts_with(c.relname, :prefix)"
+        ),
+        {"prefix": f"{table}_p"}
+    )
+    return {row.relname: row.attached for row in rows if partition_month(table, row.relname) is not None}
+
+
+async def ensure_partitions(
+    conn: AsyncConnection,
+    today: Optional[date] = None,
+    months_ahead: Optional[int] = None,
+    months_back: int = 0
+) -> List[str]:
+    """
+    필요한 월 파티션 중 없는 것만 생성하고 생성한 이름 반환
+    - 파티션 생성은 부모 테이블을 잠그므로 이미 있는 파티션은 DDL을 실행하지 않음
+    - 새 파티션에는 PARTITION_UNIQUE_COLUMNS UNIQUE 인덱스도 생성 (빈 테이블이므로 즉시 생성됨)
+    - 비파티션 테이블(전환 전)은 경고만 남기고 건너뜀
+    """
+    today = today or datetime.now(timezone.utc).date()
+    months_ahead = settings.CHAT_PARTITION_PREMAKE_MONTHS if months_ahead is None else months_ahead
+    await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": PARTITION_LOCK_KEY})
+
+    created = []
+    for table in PARTITIONED_TABLES:
+        if not await is_partitioned(conn, table):
+            logger.warning("partitions.not_partitioned", table=table, hint="python -m core.uuid_migration run")
+            continue
+        existing = await list_partitions(conn, table)
+        for month in months_to_create(today, months_ahead, months_back):
+            name = partition_name(table, month)
+            if name not in existing:
+                await conn.execute(text(create_partition_sql(table, month)))
+                if table in PARTITION_UNIQUE_COLUMNS:
+                    await conn.execute(text(unique_index_sql(table, month, PARTITION_UNIQUE_COLUMNS[table])))
+                created.append(name)
+    if created:
+        logger.info("partitions.created", partitions=created)
+    return created
+
+
+def _asyncpg_dsn(database_url: str) -> str:
+    return make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+
+def month_bounds(month: date) -> Tuple[datetime, datetime]:
+    """ 월 파티션 범위 [이번 달 1일, 다음 달 1일) (UTC) """
+    start = datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+    end = add_months(month, 1)
+    return start, datetime(end.year, end.month, 1, tzinfo=timezone.utc)
+
+async def release_prompt_references(conn: asyncpg.Connection, month: date) -> int:
+    """
+    보관할 Chat 월 파티션의 메세지를 프롬프트로 참조하는 챗봇 응답(다음 달로 넘어간 응답)의 프롬프트 참조 해제
+    (참조하는 행이 남아 있으면 외래키 때문에 Chat 파티션을 분리할 수 없음, 같은 달 챗봇 응답은 먼저 보관됨)
+    """
+    start, end = month_bounds(month)
+    status = await conn.execute(
+        'UPDATE "ChatbotResponse" SET prompt_chat_id = NULL, prompt_chat_created_at = NULL '
+        "WHERE prompt_chat_created_at >= $1 AND prompt_chat_created_at < $2",
+        start, end
+    )
+    return int(status.split()[-1])
+
+async def archive_partition(
+    conn: asyncpg.Connection, table: str, month: date, archive_dir: Path, attached: bool = True
+) -> Dict[str, Any]:
+    """
+    월 파티션 하나를 분리 -> gzip CSV로 내보내기 -> 매니페스트 기록 -> 삭제
+    - Chat 파티션은 분리 전에 다음 달 챗봇 응답의 프롬프트 참조를 해제 (같은 달 챗봇 응답은 먼저 보관되어 있어야 함)
+    - 분리는 DETACH PARTITION CONCURRENTLY (PG14+, 부모 테이블 INSERT/조회를 막지 않음)
+    - 내보낸 행 수가 테이블 행 수와 다르면 삭제하지 않고 예외 발생
+    - 중간에 중단되어도 분리된 파티션이 남으므로 다음 실행에서 이어서 처리
+    """
+    name = partition_name(table, month)
+    released = 0
+    if attached:
+        if table == "Chat":
+            released = await release_prompt_references(conn, month)
+        # 이전 실행의 CONCURRENTLY 분리가 중단된 경우 FINALIZE로 마무리 (inhdetachpending은 PG14+ 컬럼)
+        pending = await conn.fetchval(
+            "SELECT coalesce((to_jsonb(i) ->> 'inhdetachpending')::boolean, false) "
+            "FROM pg_inherits i WHERE i.inhrelid = to_regclass($1)",
+            f'"{name}"'
+        )
+        mode = "FINALIZE" if pending else "CONCURRENTLY"
+        await conn.execute(f'ALTER TABLE "{table}" DETACH PARTITION "{name}" {mode}')
+
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    path = archive_dir / f"{name}.csv.gz"
+    partial = path.with_name(path.name + ".partial")
+    rows = await conn.fetchval(f'SELECT count(*) FROM "{name}"')
+    digest = hashlib.sha256()
+
+    with gzip.open(partial, "wb", compresslevel=settings.CHAT_ARCHIVE_COMPRESSLEVEL) as f:
+        async def write(chunk: bytes):
+            digest.update(chunk)
+            f.write(chunk)
+        status = await conn.copy_from_table(name, output=write, format="csv", header=True)
+    copied = int(status.split()[-1])
+    if copied != rows:
+        raise RuntimeError(f"{name}: exported {copied} rows, expected {rows}")
+    os.replace(partial, path)
+
+    manifest = {
+        "table": table,
+        "partition": name,
+        "range_from": month.isoformat(),
+        "range_to": add_months(month, 1).isoformat(),
+        "rows": rows,
+        "released_prompt_references": released,
+        "file": path.name,
+        "bytes": path.stat().st_size,
+        "csv_sha256": digest.hexdigest(),
+        "archived_at": datetime.now(timezone.utc).isoformat()
+    }
+    path.with_name(f"{name}.json").write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    await conn.execute(f'DROP TABLE "{name}"')
+    logger.info("partitions.archived", partition=name, rows=rows, bytes=manifest["bytes"])
+    return manifest
+
+async def archive_expired(
+    database_url: str,
+    archive_dir: Path,
+    retention_months: int,
+    today: Optional[date] = None,
+    dry_run: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    보관 기간이 지난 월 파티션(분리 후 남은 파티션 포함)을 오래된 달부터 모두 보관 처리
+    같은 달은 참조하는 쪽(ChatbotResponse)을 먼저 보관해야 Chat 파티션 분리 시 외래키 위반이 없음
+    """
+    today = today or datetime.now(timezone.utc).date()
+    archived = []
+    partitions = {}
+    async with engine.connect() as sa_conn:
+        for table in PARTITIONED_TABLES:
+            existing = await list_partitions(sa_conn, table)
+            partitions[table] = {partition_month(table, name): attached for name, attached in existing.items()}
+    expired = sorted(set().union(*(
+        expired_months(list(months), today, retention_months) for months in partitions.values()
+    )))
+
+    # DETACH CONCURRENTLY는 트랜잭션 블록 밖에서만 실행 가능하므로 풀과 별도의 autocommit 연결 사용
+    conn = await asyncpg.connect(_asyncpg_dsn(database_url))
+    try:
+        for month in expired:
+            for table in reversed(PARTITIONED_TABLES):
+                if month not in partitions[table]:
+                    continue
+                if dry_run:
+                    archived.append({"table": table, "partition": partition_name(table, month), "dry_run": True})
+                    continue
+                archived.append(await archive_partition(conn, table, month, archive_dir, partitions[table][month]))
+    finally:
+        await conn.close()
+    return archived
+
+
+def purge_horizon(attached_months: List[date]) -> Optional[datetime]:
+    """
+    빈 세션 정리 대상 세션 생성 시각 하한 (연결된 Chat 파티션이 없으면 None)
+    세션 메세지는 세션 생성 시각 - SESSION_CLOCK_SKEW 이후에 저장되므로,
+    가장 오래된 연결된 Chat 파티션 시작 + SESSION_CLOCK_SKEW 이후 세션만 메세지가 모두 테이블에 남아 있음
+    """
+    if not attached_months:
+        return None
+    return month_bounds(min(attached_months))[0] + SESSION_CLOCK_SKEW
+
+async def purge_empty_sessions(older_than: timedelta, batch_size: int) -> int:
+    """
+    생성 후 older_than이 지나도록 메세지가 없는 ChatSession 삭제 후 삭제 수 반환
+    - 배치마다 별도 트랜잭션으로 커밋 (긴 트랜잭션/대량 dead tuple 방지)
+    - 메세지 저장 중인 세션(FK 확인으로 행 잠금)은 SKIP LOCKED로 건너뜀
+    - Chat 조회는 세션 생성 시각 이후 파티션으로 한정
+    - 메세지가 보관(archive)되었을 수 있는 purge_horizon 이전 세션은 삭제하지 않음
+      (보관 파일 복원 시 Chat.session_id 외래키 보장)
+    """
+    horizon = None
+    async with engine.connect() as conn:
+        if await is_partitioned(conn, "Chat"):
+            existing = await list_partitions(conn, "Chat")
+            horizon = purge_horizon([partition_month("Chat", name) for name, attached in existing.items() if attached])
+            if horizon is None:
+                logger.warning("partitions.purge_skipped", reason="연결된 Chat 파티션이 없습니다")
+                return 0
+
+    statement = text(
+        'DELETE FROM "ChatSession" WHERE session_id IN ('
+        ' SELECT s.session_id FROM "ChatSession" s'
+        ' WHERE s.created_at < now() - make_interval(secs => :older_than)'
+        ' AND (CAST(:horizon AS timestamptz) IS NULL OR s.created_at >= CAST(:horizon AS timestamptz))'
+        ' AND NOT EXISTS ('
+        '  SELECT 1 FROM "Chat" c'
+        '  WHERE c.session_id = s.session_id AND c.created_at >= s.created_at - make_interval(secs => :skew))'
+        ' ORDER BY s.created_at LIMIT :batch_size FOR UPDATE SKIP LOCKED)'
+    )
+    params = {
+        "older_than": older_than.total_seconds(),
+        "skew": SESSION_CLOCK_SKEW.total_seconds(),
+        "horizon": horizon,
+        "batch_size": batch_size
+    }
+    purged = 0
+    while True:
+        async with engine.begin() as conn:
+            deleted = (await conn.execute(statement, params)).rowcount
+        purged += deleted
+        if deleted < batch_size:
+            break
+    logger.info("partitions.sessions_purged", sessions=purged)
+    return purged
+
+
+async def ensure_response_columns(conn: AsyncConnection, lock_timeout: float = 5.0) -> List[str]:
+    """
+    파티션 전환 전(비파티션) ChatbotResponse에 RESPONSE_COLUMNS가 없으면 추가하고 추가한 컬럼 반환
+    - 현재 모델은 챗봇/프롬프트 메세지의 created_at을 함께 저장하므로 전환 전 DB에서도 INSERT가 가능하도록 함
+    - NULL 허용/기본값 없는 컬럼 추가는 메타데이터만 변경 (잠금은 lock_timeout 안에서 잠시만 유지)
+    - 기존 행의 값은 비워 두고 전환(core.uuid_migration) 시 Chat에서 채움
+    """
+    existing = set((await conn.execute(text(
+        "SELECT column_name FROM information_schema.columns "
+        "WHERE table_schema = current_schema() AND table_name = 'ChatbotResponse'"
+    ))).scalars().all())
+    missing = [column for column in RESPONSE_COLUMNS if column not in existing]
+    if not missing:
+        return []
+    await conn.execute(text(f"SET LOCAL lock_timeout = '{int(lock_timeout * 1000)}ms'"))
+    await conn.execute(text(
+        'ALTER TABLE "ChatbotResponse" '
+        + ", ".join(f"ADD COLUMN IF NOT EXISTS {column} TIMESTAMP WITH TIME ZONE" for column in missing)
+    ))
+    logger.info("partitions.response_columns_added", columns=missing)
+    return missing
+
+
+async def partition_status() -> Dict[str, List[Dict[str, Any]]]:
+    """ 테이블별 월 파티션 목록 (연결 여부, 예상 행 수, 크기) """
+    status = {}
+    async with engine.connect() as conn:
+        for table in PARTITIONED_TABLES:
+            existing = await list_partitions(conn, table)
+            rows = await conn.execute(
+                text(
+                    "SELECT c.relname, c.reltuples::bigint AS estimated_rows, "
+                    "pg_total_relation_size(c.oid) AS bytes FROM pg_class c "
+                    "WHERE c.relnamespace = current_schema()::regnamespace AND c.relname = ANY(:names)"
+                ),
+                {"names": list(existing)}
+            )
+            status[table] = sorted(
+                ({"partition": row.relname, "attached": existing[row.relname],
+                  "estimated_rows": max(row.estimated_rows, 0), "bytes": row.bytes} for row in rows),
+                key=lambda item: item["partition"]
+            )
+    return status
+
+
+class PartitionMaintainer:
+    """
+    서버 실행 중 다음 달 파티션을 미리 만들어 두는 클래스
+    - start: 파티션 확인/생성 후 CHAT_PARTITION_CHECK_INTERVAL마다 반복
+    - 보관/세션 정리는 파일 저장과 대량 조회가 필요하므로 서버가 아닌 CLI(maintain)로 실행
+    """
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self.last_checked: Optional[datetime] = None
+
+    async def start(self):
+        if self._task is not None:
+            return
+        # 첫 INSERT 전에 이번 달 파티션이 있어야 하므로 시작 시에는 실패를 그대로 전달
+        await self.ensure()
+        self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def ensure(self) -> List[str]:
+        async with engine.begin() as conn:
+            created = await ensure_partitions(conn)
+        self.last_checked = datetime.now(timezone.utc)
+        return created
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(settings.CHAT_PARTITION_CHECK_INTERVAL)
+            try:
+                await self.ensure()
+            except Exception as e:
+                logger.error("partitions.ensure_failed", error=str(e))
+
+partition_maintainer = PartitionMaintainer()
+
+
+async def run_command(args: argparse.Namespace) -> Any:
+    if args.command == "status":
+        return await partition_status()
+
+    result: Dict[str, Any] = {}
+    if args.command in ("ensure", "maintain"):
+        async with engine.begin() as conn:
+            result["created"] = await ensure_partitions(conn, months_ahead=args.months_ahead)
+    if args.command in ("archive", "maintain"):
+        result["archived"] = await archive_expired(
+            settings.DATABASE_URL, Path(args.archive_dir), args.retention_months, dry_run=args.dry_run
+        )
+    if args.command in ("purge-sessions", "maintain") and not args.dry_run:
+        result["purged_sessions"] = await purge_empty_sessions(
+            timedelta(days=args.session_retention_days), settings.EMPTY_SESSION_PURGE_BATCH_SIZE
+        )
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=["status", "ensure", "archive", "purge-sessions", "maintain"])
+    parser.add_argument("--months-ahead", type=int, default=settings.CHAT_PARTITION_PREMAKE_MONTHS)
+    parser.add_argument("--retention-months", type=int, default=settings.CHAT_RETENTION_MONTHS)
+    parser.add_argument("--archive-dir", default=settings.CHAT_ARCHIVE_DIR)
+    parser.add_argument("--session-retention-days", type=float, default=settings.EMPTY_SESSION_RETENTION_DAYS)
+    parser.add_argument("--dry-run", action="store_true", help="보관 대상만 출력 (분리/삭제하지 않음)")
+    args = parser.parse_args()
+
+    async def run():
+        try:
+            return await run_command(args)
+        finally:
+            await engine.dispose()
+    print(json.dumps(asyncio.run(run()), indent=2, default=str, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+import asyncio
+import hashlib
+
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from fastapi import Response
+
+import crud.persona
+
+from core.config import settings
+from core.db import get_async_context_db
+from core.log import get_logger
+from schemas.persona import PersonaListResponse, PersonaRead
+
+logger = get_logger(__name__)
+
+# 페르소나 목록 조회 함수 (기본: Persona 테이블 전체 조회)
+PersonaLoader = Callable[[], Awaitable[List[Any]]]
+
+
+async def _load_personas() -> List[Any]:
+    async with get_async_context_db() as db:
+        return await crud.persona.get_personas(db)
+
+
+class PersonaCatalog:
+    """
+    페르소나 목록 인메모리 카탈로그
+    - lifespan에서 시딩 직후 적재, PERSONA_CATALOG_TTL마다 백그라운드에서 재적재
+    - 목록 응답 본문(JSON bytes)과 ETag를 적재 시점에 미리 만들어 두고 그대로 반환
+    - 앱에는 페르소나 쓰기 경로가 없으므로(시딩은 적재 전에 실행) DB에서 직접 변경한 페르소나는
+      최대 PERSONA_CATALOG_TTL 후 반영되고, 그 전까지는 이전 본문/ETag(304)로 응답
+    """
+    def __init__(self, loader: PersonaLoader = _load_personas):
+        self._loader = loader
+        self._personas: Dict[int, PersonaRead] = {}
+        self._body = b""
+        self._etag = ""
+        self._loaded = False
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        # 모니터링용 카운터
+        self.refreshes = 0
+        self.responses = 0
+        self.not_modified = 0
+
+    async def start(self):
+        """ 카탈로그 초기 적재 후 주기적 갱신 태스크 시작 """
+        try:
+            await self.refresh()
+        except Exception as e:
+            # DB 장애로 서버 기동이 막히지 않도록 첫 조회 시 다시 적재
+            logger.warning("persona_catalog.preload_failed", error=str(e))
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        """ 주기적 갱신 태스크 종료 """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def refresh(self):
+        """ DB에서 페르소나 목록을 읽어 응답 본문/ETag를 만든 뒤 통째로 교체 """
+        async with self._lock:
+            await self._reload()
+
+    async def get(self, persona_id: int) -> Optional[PersonaRead]:
+        """ ID에 해당하는 페르소나 조회 (없으면 None) """
+        await self._ensure_loaded()
+        return self._personas.get(persona_id)
+
+    async def response(self, if_none_match: Optional[str] = None) -> Response:
+        """
+        페르소나 목록 응답
+        - If-None-Match가 현재 ETag와 같으면 본문 없이 304 반환
+        """
+        await self._ensure_loaded()
+        headers = {
+            "ETag": self._etag,
+            "Cache-Control": f"public, max-age={settings.PERSONA_CATALOG_MAX_AGE}"
+        }
+        if if_none_match and self._matches(if_none_match):
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        self.responses += 1
+        return Response(content=self._body, media_type="application/json", headers=headers)
+
+    def stats(self) -> Dict[str, Any]:
+        """ 카탈로그 크기 및 응답 현황 """
+        return {
+            "personas": len(self._personas),
+            "loaded": self._loaded,
+            "etag": self._etag,
+            "refreshes": self.refreshes,
+            "responses": self.responses,
+            "not_modified": self.not_modified
+        }
+
+    def _matches(self, if_none_match: str) -> bool:
+        # 여러 ETag 나열, 약한 비교(W/ 접두사), "*" 허용
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag == "*" or tag.removeprefix("W/") == self._etag:
+                return True
+        return False
+
+    async def _ensure_loaded(self):
+        if self._loaded:
+            return
+        async with self._lock:
+            # 동시에 들어온 요청은 먼저 들어온 요청의 적재 결과를 사용
+            if not self._loaded:
+                await self._reload()
+
+    async def _reload(self):
+        rows = await self._loader()
+        personas = [PersonaRead.model_validate(row, from_attributes=True) for row in rows]
+        body = PersonaListResponse(personas=personas).model_dump_json().encode()
+        # 참조 교체만으로 반영 (응답 중인 요청은 이전 본문을 그대로 사용)
+        self._personas = {persona.id: persona for persona in personas}
+        self._body = body
+        self._etag = f'"{hashlib.sha1(body).hexdigest()[:16]}"'
+        self._loaded = True
+        self.refreshes += 1
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(settings.PERSONA_CATALOG_TTL)
+            try:
+                await self.refresh()
+            except Exception as e:
+                # 갱신 실패 시 기존 카탈로그 유지
+                logger.warning("persona_catalog.refresh_failed", error=str(e))
+
+persona_catalog = PersonaCatalog()
@@ -0,0 +1,176 @@
+import asyncio
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+import crud.qna
+
+from core.config import settings
+from core.log import get_logger
+from core.qna_matcher import QnAMatcher
+
+logger = get_logger(__name__)
+
+
+class LRUCache:
+    """
+    최대 크기를 넘으면 가장 오래 사용되지 않은 항목부터 제거하는 캐시
+    """
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._data: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        item = self._data.get(key)
+        if item is not None:
+            self._data.move_to_end(key)
+        return item
+
+    def put(self, key: str, item: Dict[str, Any]):
+        self._data[key] = item
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class QnACache:
+    """
+    FAQ/용어 답변 캐시
+    - lifespan에서 FAQ DB의 조회수 상위 항목으로 미리 채움
+    - QNA_CACHE_TTL마다 백그라운드에서 새 캐시를 만들어 통째로 교체
+    - QNA_CACHE_MAX_ENTRIES를 넘으면 LRU 순으로 제거
+    - 완전 일치 실패 시 정규화/유사도 매칭 인덱스(QnAMatcher)로 재조회
+      (매칭 인덱스는 캐시 크기와 무관하게 FAQ/용어 전체와 이후 API로 추가된 항목을 색인)
+    """
+    def __init__(self):
+        self._faqs = LRUCache(settings.QNA_CACHE_MAX_ENTRIES)
+        self._terms = LRUCache(settings.QNA_CACHE_MAX_ENTRIES)
+        self._faq_matcher: QnAMatcher = QnAMatcher({})
+        self._term_matcher: QnAMatcher = QnAMatcher({})
+        self._task: Optional[asyncio.Task] = None
+        # 모니터링용 카운터
+        self.faq_hits = 0
+        self.faq_misses = 0
+        self.term_hits = 0
+        self.term_misses = 0
+        self.faq_fuzzy_hits = 0
+        self.term_fuzzy_hits = 0
+        self.refreshes = 0
+
+    async def start(self):
+        """ 캐시 초기 적재 후 주기적 갱신 태스크 시작 """
+        try:
+            await self.refresh()
+        except Exception as e:
+            # FAQ DB 장애로 서버 기동이 막히지 않도록 빈 캐시로 시작
+            logger.warning("qna_cache.preload_failed", error=str(e))
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        """ 주기적 갱신 태스크 종료 """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def refresh(self):
+        """ FAQ DB에서 새 캐시를 만든 뒤 기존 캐시와 교체 """
+        max_entries = settings.QNA_CACHE_MAX_ENTRIES
+        # 매칭 인덱스용 전체 항목 (조회수 순)
+        faqs = await crud.qna.get_faqs_with_high_views(top_k=None)
+        terms = await crud.qna.get_terms_with_high_views(top_k=None)
+
+        new_faqs = LRUCache(max_entries)
+        new_terms = LRUCache(max_entries)
+        # 조회수 상위 항목만 캐시에 적재 (조회수 높은 항목이 가장 나중에 제거되도록 역순으로 적재)
+        self._fill(new_faqs, reversed(faqs[:max_entries]), "question")
+        self._fill(new_terms, reversed(terms[:max_entries]), "term")
+
+        faq_matcher = QnAMatcher(
+            {row["question"]: dict(row) for row in faqs},
+            threshold=settings.QNA_MATCH_THRESHOLD,
+            ngram=settings.QNA_MATCH_NGRAM
+        )
+        term_matcher = QnAMatcher(
+            {row["term"]: dict(row) for row in terms},
+            threshold=settings.QNA_MATCH_THRESHOLD,
+            ngram=settings.QNA_MATCH_NGRAM
+        )
+
+        # 참조 교체만으로 반영 (조회 중인 요청은 이전 캐시를 그대로 사용)
+        self._faqs, self._terms = new_faqs, new_terms
+        self._faq_matcher, self._term_matcher = faq_matcher, term_matcher
+        self.refreshes += 1
+
+    def get_faq(self, question: str) -> Optional[Dict[str, Any]]:
+        """ FAQ 질문에 해당하는 캐시 항목 조회 """
+        item = self._faqs.get(question)
+        if item is None and (matched := self._faq_matcher.match(question)):
+            item = matched[1]
+            self.faq_fuzzy_hits += 1
+        if item is None:
+            self.faq_misses += 1
+        else:
+            self.faq_hits += 1
+        return item
+
+    def get_term(self, term: str) -> Optional[Dict[str, Any]]:
+        """ 용어에 해당하는 캐시 항목 조회 """
+        item = self._terms.get(term)
+        if item is None and (matched := self._term_matcher.match(term)):
+            item = matched[1]
+            self.term_fuzzy_hits += 1
+        if item is None:
+            self.term_misses += 1
+        else:
+            self.term_hits += 1
+        return item
+
+    def put_faqs(self, items: Iterable[Mapping[str, Any]]):
+        """ API로 조회된 FAQ 항목을 캐시와 매칭 인덱스에 추가 """
+        self._fill(self._faqs, items, "question", self._faq_matcher)
+
+    def put_terms(self, items: Iterable[Mapping[str, Any]]):
+        """ API로 조회된 용어 항목을 캐시와 매칭 인덱스에 추가 """
+        self._fill(self._terms, items, "term", self._term_matcher)
+
+    def stats(self) -> Dict[str, int]:
+        """ 캐시 크기 및 히트/미스 현황 """
+        return {
+            "faq_entries": len(self._faqs),
+            "term_entries": len(self._terms),
+            "faq_hits": self.faq_hits,
+            "faq_misses": self.faq_misses,
+            "term_hits": self.term_hits,
+            "term_misses": self.term_misses,
+            "faq_fuzzy_hits": self.faq_fuzzy_hits,
+            "term_fuzzy_hits": self.term_fuzzy_hits,
+            "refreshes": self.refreshes
+        }
+
+    @staticmethod
+    def _fill(
+        cache: LRUCache, items: Iterable[Mapping[str, Any]], key: str, matcher: Optional[QnAMatcher] = None
+    ):
+        for item in items:
+            cache.put(item[key], dict(item))
+            if matcher is not None:
+                matcher.add(item[key], dict(item))
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(settings.QNA_CACHE_TTL)
+            try:
+                await self.refresh()
+            except Exception as e:
+                # 갱신 실패 시 기존 캐시 유지
+                logger.warning("qna_cache.refresh_failed", error=str(e))
+
+qna_cache = QnACache()
@@ -0,0 +1,110 @@
+import math
+import re
+import unicodedata
+
+from collections import defaultdict
+from typing import Dict, FrozenSet, Generic, List, Mapping, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# 공백·문장부호·기호 제거용 (한글/영문/숫자만 남김)
+_NON_WORD_RE = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def normalize_text(text: str) -> str:
+    """
+    질문 비교용 정규화
+    - NFKC 정규화 (전각/반각, 호환 문자, 한글 자모 조합 통일)
+    - 대소문자 통일
+    - 공백·문장부호 제거 ("카드 추천?" == "카드추천")
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return _NON_WORD_RE.sub("", text)
+
+
+def char_ngrams(text: str, n: int) -> FrozenSet[str]:
+    """ 정규화된 문자열의 문자 n-gram 집합 (n보다 짧으면 문자열 전체) """
+    if len(text) <= n:
+        return frozenset((text,)) if text else frozenset()
+    return frozenset(text[i:i + n] for i in range(len(text) - n + 1))
+
+
+class QnAMatcher(Generic[T]):
+    """
+    FAQ 질문/용어 매칭 인덱스
+    1. 정규화 문자열 완전 일치
+    2. 문자 n-gram 역색인 기반 Dice 유사도가 threshold 이상인 항목 중 최고점
+       (희소한 n-gram 일부만으로 후보를 뽑는 prefix filtering 적용)
+    캐시 갱신 시 새로 생성하며, 이후 추가된 항목은 add()로 색인
+    """
+    def __init__(self, entries: Mapping[str, T], threshold: float = 0.85, ngram: int = 2):
+        self.threshold = threshold
+        self.ngram = ngram
+
+        self._items: List[T] = []
+        self._keys: List[str] = []
+        self._grams: List[FrozenSet[str]] = []
+        self._exact: Dict[str, int] = {}
+        self._postings: Dict[str, List[int]] = defaultdict(list)
+
+        for key, item in entries.items():
+            self.add(key, item)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, key: str, item: T) -> bool:
+        """ 항목 색인 (정규화 결과가 비었거나 이미 색인된 질문이면 False) """
+        normalized = normalize_text(key)
+        if not normalized or normalized in self._exact:
+            return False
+        doc_id = len(self._items)
+        grams = char_ngrams(normalized, self.ngram)
+        self._items.append(item)
+        self._keys.append(key)
+        self._grams.append(grams)
+        self._exact[normalized] = doc_id
+        for gram in grams:
+            self._postings[gram].append(doc_id)
+        return True
+
+    def match(self, text: str) -> Optional[Tuple[str, T, float]]:
+        """ (원본 키, 항목, 유사도) 반환, 기준 미달 시 None """
+        normalized = normalize_text(text)
+        if not normalized:
+            return None
+
+        doc_id = self._exact.get(normalized)
+        if doc_id is not None:
+            return self._keys[doc_id], self._items[doc_id], 1.0
+        if self.threshold >= 1.0:
+            return None
+
+        query_grams = char_ngrams(normalized, self.ngram)
+        query_count = len(query_grams)
+        # Dice 유사도가 threshold 이상이 될 수 있는 문서 n-gram 개수 범위
+        min_count = query_count * self.threshold / (2 - self.threshold)
+        max_count = query_count * (2 - self.threshold) / self.threshold
+
+        # 최소 크기 문서 기준 필요한 공통 n-gram 수 -> 희소한 순으로 (전체 - 필요 + 1)개만 조회해도 후보 누락 없음
+        required = math.ceil(self.threshold * (query_count + min_count) / 2 - 1e-9)
+        prefix = sorted(query_grams, key=lambda gram: len(self._postings.get(gram, ())))
+        prefix = prefix[:max(query_count - required + 1, 1)]
+
+        candidates = set()
+        for gram in prefix:
+            candidates.update(self._postings.get(gram, ()))
+
+        best_id, best_score = -1, 0.0
+        for doc_id in candidates:
+            doc_grams = self._grams[doc_id]
+            doc_count = len(doc_grams)
+            if doc_count < min_count or doc_count > max_count:
+                continue
+            score = 2 * len(query_grams & doc_grams) / (query_count + doc_count)
+            if score > best_score:
+                best_id, best_score = doc_id, score
+
+        if best_id < 0 or best_score < self.threshold:
+            return None
+        return self._keys[best_id], self._items[best_id], best_score
@@ -0,0 +1,147 @@
+import asyncio
+import time
+
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+import crud.qna
+
+from core.config import settings
+from core.db import engine
+from core.http import http_clients
+from core.log import get_logger
+
+logger = get_logger(__name__)
+
+# 의존성 확인 함수 (실패 시 예외 발생)
+ProbeFn = Callable[[], Awaitable[None]]
+
+
+def db_probe(async_engine: AsyncEngine) -> ProbeFn:
+    """ SELECT 1 실행 여부로 DB 연결 확인 """
+    async def probe():
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    return probe
+
+def http_probe(client_name: str, url: str) -> ProbeFn:
+    """ HTTP 응답 여부로 업스트림 연결 확인 (5xx는 실패) """
+    async def probe():
+        response = await http_clients.get(client_name).get(url, timeout=settings.READINESS_PROBE_TIMEOUT)
+        if response.status_code >= 500:
+            raise RuntimeError(f"HTTP {response.status_code}")
+    return probe
+
+
+class ReadinessProbe:
+    """
+    외부 의존성(채팅 DB, FAQ DB, LLM 서버, MCP 서버) 준비 상태 확인
+    - READINESS_PROBE_INTERVAL마다 백그라운드에서 모든 의존성을 동시에 확인하고 결과 보관
+    - /api/health/ready는 보관된 결과만 읽으므로 헬스 체크 요청이 의존성에 부하를 주지 않음
+    - 핵심 의존성(READINESS_CRITICAL)이 실패했거나 결과가 오래되면 준비되지 않음으로 판단
+    """
+    def __init__(self, critical: Iterable[str] = ()):
+        self.critical = set(critical)
+        self._probes: Dict[str, ProbeFn] = {}
+        self._results: Dict[str, Dict[str, Any]] = {}
+        self._checked_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def add_probe(self, name: str, probe: ProbeFn):
+        self._probes[name] = probe
+
+    async def start(self):
+        """ 최초 확인 후 주기적 확인 태스크 시작 """
+        await self.check()
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        """ 주기적 확인 태스크 종료 """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def check(self):
+        """ 모든 의존성을 동시에 확인하고 결과 교체 """
+        names = list(self._probes)
+        results = await asyncio.gather(*(self._run_probe(name) for name in names))
+        previous = self._results
+        self._results = dict(zip(names, results))
+        self._checked_at = time.monotonic()
+        # 상태가 바뀐 의존성만 기록
+        for name, result in self._results.items():
+            if name in previous and previous[name]["status"] == result["status"]:
+                continue
+            if result["status"] == "up":
+                logger.info("readiness.up", dependency=name, latency_ms=result["latency_ms"])
+            else:
+                logger.warning("readiness.down", dependency=name, error=result.get("error"))
+
+    def is_ready(self) -> bool:
+        """ 결과가 최신이고 핵심 의존성이 모두 정상인지 여부 """
+        if self._checked_at is None or self.age() > settings.READINESS_STALE_AFTER:
+            return False
+        return all(
+            self._results.get(name, {}).get("status") == "up"
+            for name in self.critical
+        )
+
+    def age(self) -> float:
+        """ 마지막 확인 이후 경과 시간(초) """
+        if self._checked_at is None:
+            return float("inf")
+        return time.monotonic() - self._checked_at
+
+    def report(self) -> Dict[str, Any]:
+        """ 준비 여부와 의존성별 상태/지연시간 """
+        return {
+            "status": "ready" if self.is_ready() else "not_ready",
+            "checked_seconds_ago": round(self.age(), 3) if self._checked_at is not None else None,
+            "dependencies": {
+                name: {**result, "critical": name in self.critical}
+                for name, result in self._results.items()
+            }
+        }
+
+    def dependency_up(self) -> Dict[str, int]:
+        """ 의존성별 정상 여부 (1/0, 메트릭 수집용) """
+        return {name: int(result["status"] == "up") for name, result in self._results.items()}
+
+    async def _run_probe(self, name: str) -> Dict[str, Any]:
+        start = time.perf_counter()
+        try:
+            await asyncio.wait_for(self._probes[name](), settings.READINESS_PROBE_TIMEOUT)
+        except Exception as e:
+            return {
+                "status": "down",
+                "latency_ms": round((time.perf_counter() - start) * 1000, 1),
+                "error": f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+            }
+        return {"status": "up", "latency_ms": round((time.perf_counter() - start) * 1000, 1)}
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(settings.READINESS_PROBE_INTERVAL)
+            try:
+                await self.check()
+            except Exception as e:
+                logger.warning("readiness.check_failed", error=str(e))
+
+
+def create_readiness_probe() -> ReadinessProbe:
+    """ 채팅 DB, FAQ DB, LLM 서버, MCP 서버 확인 등록 """
+    readiness = ReadinessProbe(settings.READINESS_CRITICAL)
+    readiness.add_probe("chat_db", db_probe(engine))
+    readiness.add_probe("faq_db", db_probe(crud.qna.qna_async_engine))
+    readiness.add_probe("llm", http_probe("llm", settings.LLMSERVER_URL))
+    readiness.add_probe("mcp", http_probe("mcp", settings.MCP_SERVER_URL))
+    return readiness
+
+readiness_probe = create_readiness_probe()
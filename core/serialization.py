@@ -0,0 +1,178 @@
+import json
+import zlib
+
+from datetime import date, datetime
+from typing import Any, Dict, Union
+from uuid import UUID
+
+from fastapi import WebSocket
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from core.config import settings
+from core.log import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    msgpack = None
+    MSGPACK_AVAILABLE = False
+
+# MessagePack 바이너리 프레임을 사용하는 WebSocket 서브프로토콜 이름
+MSGPACK_SUBPROTOCOL = "msgpack"
+# msgpack 연결의 압축 프레임 (ExtType 데이터가 raw deflate로 압축된 MessagePack 프레임)
+MSGPACK_DEFLATE_EXT_TYPE = 1
+
+
+def _default(obj: Any) -> Any:
+    """ 기본 JSON 타입이 아닌 값 변환 (orjson은 UUID/datetime을 직접 처리) """
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class StdlibSerializer:
+    """ 표준 라이브러리 json 사용 (Starlette send_json/JSONResponse와 같은 compact, UTF-8 출력) """
+    name = "stdlib"
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_default)
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return self.dumps(obj).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonSerializer:
+    """
+    orjson 사용 (bytes를 바로 생성/파싱하여 큰 card_list 페이로드의 CPU 사용량 감소)
+    파싱 오류는 json.JSONDecodeError의 하위 클래스로 발생하므로 호출부 예외 처리는 동일
+    """
+    name = "orjson"
+    option = orjson.OPT_NON_STR_KEYS if ORJSON_AVAILABLE else 0
+
+    def dumps(self, obj: Any) -> str:
+        return self.dumps_bytes(obj).decode("utf-8")
+
+    def dumps_bytes(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_default, option=self.option)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+
+Serializer = Union[StdlibSerializer, OrjsonSerializer]
+
+def create_serializer(backend: str = "auto") -> Serializer:
+    """
+    JSON 직렬화기 생성
+    - auto: orjson이 설치되어 있으면 orjson, 아니면 표준 라이브러리
+    - orjson: orjson 미설치 시 경고 후 표준 라이브러리 사용
+    - stdlib: 항상 표준 라이브러리
+    """
+    if backend not in ("auto", "orjson", "stdlib"):
+        raise ValueError(f"Unknown JSON backend: {backend}")
+    if backend != "stdlib" and ORJSON_AVAILABLE:
+        return OrjsonSerializer()
+    if backend == "orjson":
+        logger.warning("serialization.orjson_unavailable", fallback="stdlib")
+    return StdlibSerializer()
+
+serializer = create_serializer(settings.JSON_BACKEND)
+
+
+def dumps(obj: Any) -> str:
+    """ JSON 문자열 직렬화 (WebSocket 텍스트 프레임, NDJSON 줄) """
+    return serializer.dumps(obj)
+
+def dumps_bytes(obj: Any) -> bytes:
+    """ JSON UTF-8 bytes 직렬화 (HTTP 응답 본문) """
+    return serializer.dumps_bytes(obj)
+
+def loads(data: Union[str, bytes]) -> Any:
+    """ JSON 파싱 (WebSocket 수신 메세지, LLM/MCP 응답 본문) """
+    return serializer.loads(data)
+
+
+def validate_json(adapter: TypeAdapter, data: Union[str, bytes]) -> Any:
+    """
+    JSON 본문을 TypeAdapter 스키마로 검증
+    - orjson 사용 시: orjson 파싱 후 검증 (큰 card_list 본문에서 pydantic JSON 파서보다 빠름)
+    - stdlib 사용 시: pydantic JSON 파서로 bytes를 바로 검증 (표준 json.loads를 거치지 않음)
+    파싱 오류는 json.JSONDecodeError 또는 ValidationError(json_invalid)로 발생
+    """
+    if serializer.name == "orjson":
+        return adapter.validate_python(serializer.loads(data))
+    return adapter.validate_json(data)
+
+
+def pack(obj: Any) -> bytes:
+    """ MessagePack 직렬화 (msgpack 서브프로토콜 연결 전용) """
+    return msgpack.packb(obj, default=_default, use_bin_type=True)
+
+def unpack(data: bytes) -> Any:
+    """ MessagePack 파싱 (형식 오류 시 ValueError) """
+    return msgpack.unpackb(data, raw=False)
+
+
+def deflate(data: bytes, level: int = 6) -> bytes:
+    """ raw deflate 압축 (zlib 헤더 없음, 브라우저 DecompressionStream("deflate-raw")로 해제) """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+def inflate(data: bytes) -> bytes:
+    return zlib.decompress(data, -zlib.MAX_WBITS)
+
+
+async def send_frame(
+    websocket: WebSocket,
+    payload: Dict[str, Any],
+    binary: bool = False,
+    compress_threshold: int = 0
+) -> bool:
+    """
+    WebSocket.send_json 대체 (압축 여부 반환)
+    - 기본: serializer로 직렬화한 JSON 텍스트 프레임
+    - binary: MessagePack 바이너리 프레임 (msgpack 서브프로토콜로 연결된 경우)
+    - compress_threshold: 직렬화 결과가 이 크기 이상이면 raw deflate로 압축 (0이면 압축하지 않음)
+        - JSON 연결: 압축된 JSON을 바이너리 프레임으로 전송 (텍스트 프레임은 항상 비압축)
+        - msgpack 연결: 압축된 MessagePack을 ExtType(MSGPACK_DEFLATE_EXT_TYPE)으로 감싸 전송
+    """
+    if binary:
+        data = pack(payload)
+        if compress_threshold and len(data) >= compress_threshold:
+            await websocket.send_bytes(
+                msgpack.packb(msgpack.ExtType(MSGPACK_DEFLATE_EXT_TYPE, deflate(data, settings.WS_COMPRESSION_LEVEL)))
+            )
+            return True
+        await websocket.send_bytes(data)
+        return False
+    if compress_threshold:
+        data = serializer.dumps_bytes(payload)
+        if len(data) >= compress_threshold:
+            await websocket.send_bytes(deflate(data, settings.WS_COMPRESSION_LEVEL))
+            return True
+        await websocket.send_text(data.decode("utf-8"))
+        return False
+    await websocket.send_text(serializer.dumps(payload))
+    return False
+
+
+class FastJSONResponse(JSONResponse):
+    """ serializer로 본문을 직렬화하는 JSONResponse (앱 기본 응답 클래스) """
+    def render(self, content: Any) -> bytes:
+        return serializer.dumps_bytes(content)
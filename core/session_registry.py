@@ -0,0 +1,452 @@
+import abc
+import asyncio
+import json
+import os
+import socket
+
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+from uuid import UUID, uuid4
+
+import asyncpg
+
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+
+from core.config import settings
+from core.db import engine
+from core.log import get_logger
+
+logger = get_logger(__name__)
+
+
+# 소유 워커로 전달된 명령 처리 함수 (session_id, command) -> 처리 여부
+DeliverFn = Callable[[UUID, Dict[str, Any]], Awaitable[bool]]
+
+# 레지스트리에 공유하는 세션 필드
+SHARED_FIELDS = ("persona_id", "user_chat_id")
+
+# heartbeat마다 실행하는 끊긴 워커 정리 SQL (워커 -> 워커의 세션 -> 워커에게 보낸 명령 순)
+REAP_STALE_WORKERS_SQL = (
+    'DELETE FROM "SessionWorker" WHERE heartbeat_at < now() - make_interval(secs => :stale_after)',
+    'DELETE FROM "SessionRegistry" s WHERE NOT EXISTS '
+    '(SELECT 1 FROM "SessionWorker" w WHERE w.worker_id = s.worker_id)',
+    'DELETE FROM "SessionMessage" m WHERE NOT EXISTS '
+    '(SELECT 1 FROM "SessionWorker" w WHERE w.worker_id = m.worker_id)',
+)
+
+
+def make_worker_id() -> str:
+    """ 워커 식별자 (호스트:PID:임의값) """
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+
+
+class SessionRegistry(abc.ABC):
+    """
+    세션을 소유한(WebSocket이 연결된) 워커를 기록하는 레지스트리 인터페이스
+    - register/unregister: 소유 워커가 연결/종료 시 호출
+    - lookup/update: 어느 워커에서든 세션 정보(persona_id, user_chat_id) 조회·갱신
+    - publish: 소유 워커로 명령 전달 (소유 워커에서 bind된 deliver 함수가 처리)
+    """
+    backend: str
+
+    def __init__(self, worker_id: Optional[str] = None):
+        self.worker_id = worker_id or make_worker_id()
+        self._deliver: Optional[DeliverFn] = None
+        # 모니터링용 카운터
+        self.published = 0
+        self.delivered = 0
+
+    def bind(self, deliver: DeliverFn):
+        """ 이 워커로 전달된 명령을 처리할 함수 등록 """
+        self._deliver = deliver
+
+    async def start(self):
+        pass
+
+    async def close(self):
+        pass
+
+    @abc.abstractmethod
+    async def register(self, session_id: UUID):
+        ...
+
+    @abc.abstractmethod
+    async def unregister(self, session_id: UUID):
+        ...
+
+    @abc.abstractmethod
+    async def lookup(self, session_id: UUID) -> Optional[Dict[str, Any]]:
+        """ {"worker_id", "persona_id", "user_chat_id"} 반환, 없는 세션이면 None """
+
+    @abc.abstractmethod
+    async def update(self, session_id: UUID, **fields: Any):
+        ...
+
+    @abc.abstractmethod
+    async def publish(self, session_id: UUID, command: Dict[str, Any]) -> bool:
+        """ 소유 워커로 명령 전달, 소유 워커가 없으면 False """
+
+    async def _handle(self, session_id: UUID, command: Dict[str, Any]) -> bool:
+        if self._deliver is None:
+            return False
+        delivered = await self._deliver(session_id, command)
+        if delivered:
+            self.delivered += 1
+        return delivered
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "worker_id": self.worker_id,
+            "published": self.published,
+            "delivered": self.delivered
+        }
+
+
+class SessionRecord:
+    """ 인메모리 레지스트리의 세션 항목 """
+    __slots__ = ("worker_id", "persona_id", "user_chat_id")
+
+    def __init__(self, worker_id: str):
+        self.worker_id = worker_id
+        self.persona_id: Optional[int] = None
+        self.user_chat_id: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"worker_id": self.worker_id, "persona_id": self.persona_id, "user_chat_id": self.user_chat_id}
+
+
+class LocalSessionHub:
+    """ 같은 프로세스 안의 워커들이 공유하는 세션 테이블 (인메모리 레지스트리용) """
+    def __init__(self):
+        self.sessions: Dict[UUID, SessionRecord] = {}
+        self.workers: Dict[str, "InMemorySessionRegistry"] = {}
+
+
+class InMemorySessionRegistry(SessionRegistry):
+    """
+    인메모리 레지스트리 (기본값)
+    - 단일 프로세스에서는 모든 세션이 자기 자신 소유
+    - 같은 hub를 공유하면 한 프로세스 안에서 여러 워커를 흉내낼 수 있음 (테스트용)
+    """
+    backend = "memory"
+
+    def __init__(self, worker_id: Optional[str] = None, hub: Optional[LocalSessionHub] = None):
+        super().__init__(worker_id)
+        self.hub = hub or LocalSessionHub()
+
+    async def start(self):
+        self.hub.workers[self.worker_id] = self
+
+    async def close(self):
+        self.hub.workers.pop(self.worker_id, None)
+        for session_id in [
+            session_id for session_id, record in self.hub.sessions.items()
+            if record.worker_id == self.worker_id
+        ]:
+            del self.hub.sessions[session_id]
+
+    async def register(self, session_id: UUID):
+        self.hub.sessions[session_id] = SessionRecord(self.worker_id)
+
+    async def unregister(self, session_id: UUID):
+        record = self.hub.sessions.get(session_id)
+        if record is not None and record.worker_id == self.worker_id:
+            del self.hub.sessions[session_id]
+
+    async def lookup(self, session_id: UUID) -> Optional[Dict[str, Any]]:
+        record = self.hub.sessions.get(session_id)
+        return record.to_dict() if record is not None else None
+
+    async def update(self, session_id: UUID, **fields: Any):
+        record = self.hub.sessions.get(session_id)
+        if record is not None:
+            for key in SHARED_FIELDS:
+                if key in fields:
+                    setattr(record, key, fields[key])
+
+    async def publish(self, session_id: UUID, command: Dict[str, Any]) -> bool:
+        record = self.hub.sessions.get(session_id)
+        owner = self.hub.workers.get(record.worker_id) if record is not None else None
+        if owner is None:
+            return False
+        self.published += 1
+        return await owner._handle(session_id, command)
+
+
+class PostgresSessionRegistry(SessionRegistry):
+    """
+    Postgres 기반 레지스트리 (워커/노드 간 공유)
+    - "SessionWorker": 워커별 NOTIFY 채널과 heartbeat (heartbeat가 끊긴 워커의 세션은 무효)
+    - "SessionRegistry": 세션별 소유 워커와 persona_id, user_chat_id
+    - "SessionMessage": 소유 워커로 보낼 명령
+      NOTIFY 페이로드는 8000바이트로 제한되므로 명령은 테이블에 저장하고 ID만 NOTIFY로 전달
+    - LISTEN 연결이 끊기면 heartbeat를 멈추고(다른 워커가 이 워커로 명령을 보내지 않도록) 재연결 후 재개
+    """
+    backend = "postgres"
+
+    def __init__(self, database_url: str, heartbeat_interval: float, worker_id: Optional[str] = None):
+        super().__init__(worker_id)
+        self.database_url = database_url
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = heartbeat_interval * 3
+        self.channel = f"ws_worker_{uuid4().hex}"
+        self._listener = None
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._pending: Set[asyncio.Task] = set()
+        # 이 워커가 소유한 세션의 공유 필드 (정리된 후 재등록용)
+        self._owned: Dict[UUID, Dict[str, Any]] = {}
+        self.reconnects = 0
+
+    async def start(self):
+        """ 테이블 생성, 워커 등록, 명령 채널 LISTEN, heartbeat 시작 """
+        async with engine.begin() as conn:
+            for statement in (
+                'CREATE TABLE IF NOT EXISTS "SessionWorker" ('
+                ' worker_id TEXT PRIMARY KEY, channel TEXT NOT NULL,'
+                ' heartbeat_at TIMESTAMPTZ NOT NULL DEFAULT now())',
+                'CREATE TABLE IF NOT EXISTS "SessionRegistry" ('
+                ' session_id TEXT PRIMARY KEY, worker_id TEXT NOT NULL,'
+                ' persona_id INTEGER, user_chat_id TEXT,'
+                ' updated_at TIMESTAMPTZ NOT NULL DEFAULT now())',
+                'CREATE TABLE IF NOT EXISTS "SessionMessage" ('
+                ' id BIGSERIAL PRIMARY KEY, worker_id TEXT NOT NULL, session_id TEXT NOT NULL,'
+                ' command JSONB NOT NULL, created_at TIMESTAMPTZ NOT NULL DEFAULT now())',
+            ):
+                await conn.execute(text(statement))
+            await conn.execute(
+                text('INSERT INTO "SessionWorker" (worker_id, channel) VALUES (:worker_id, :channel)'),
+                {"worker_id": self.worker_id, "channel": self.channel}
+            )
+
+        await self._listen()
+        self._heartbeat_task = asyncio.create_task(self._heartbeat())
+        logger.info("session_registry.started", backend=self.backend, worker_id=self.worker_id)
+
+    async def _listen(self):
+        """ 전용 연결로 명령 채널 LISTEN (LISTEN은 연결에 묶이므로 풀과 별도 연결 사용) """
+        dsn = make_url(self.database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        listener = await asyncpg.connect(dsn)
+        try:
+            listener.add_termination_listener(self._on_listener_closed)
+            await listener.add_listener(self.channel, self._on_notify)
+        except Exception:
+            await listener.close()
+            raise
+        self._listener = listener
+
+    def _on_listener_closed(self, connection):
+        """ asyncpg 연결 종료 콜백 -> 다음 heartbeat에서 재연결 """
+        if connection is self._listener:
+            self._listener = None
+            logger.warning("session_registry.listener_lost", worker_id=self.worker_id)
+
+    def listening(self) -> bool:
+        return self._listener is not None and not self._listener.is_closed()
+
+    async def close(self):
+        """ heartbeat 중지, LISTEN 해제, 이 워커의 세션/워커 정보 삭제 """
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        if self._listener is not None:
+            listener, self._listener = self._listener, None
+            await listener.close()
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(
+                    text('DELETE FROM "SessionRegistry" WHERE worker_id = :worker_id'),
+                    {"worker_id": self.worker_id}
+                )
+                await conn.execute(
+                    text('DELETE FROM "SessionWorker" WHERE worker_id = :worker_id'),
+                    {"worker_id": self.worker_id}
+                )
+        except Exception as e:
+            logger.warning("session_registry.unregister_failed", worker_id=self.worker_id, error=str(e))
+
+    async def register(self, session_id: UUID):
+        async with engine.begin() as conn:
+            await conn.execute(
+                text(
+                    'INSERT INTO "SessionRegistry" (session_id, worker_id) VALUES (:session_id, :worker_id) '
+                    'ON CONFLICT (session_id) DO UPDATE SET worker_id = EXCLUDED.worker_id, '
+                    'persona_id = NULL, user_chat_id = NULL, updated_at = now()'
+                ),
+                {"session_id": str(session_id), "worker_id": self.worker_id}
+            )
+        self._owned[session_id] = {}
+
+    async def unregister(self, session_id: UUID):
+        self._owned.pop(session_id, None)
+        async with engine.begin() as conn:
+            await conn.execute(
+                text('DELETE FROM "SessionRegistry" WHERE session_id = :session_id AND worker_id = :worker_id'),
+                {"session_id": str(session_id), "worker_id": self.worker_id}
+            )
+
+    async def lookup(self, session_id: UUID) -> Optional[Dict[str, Any]]:
+        async with engine.connect() as conn:
+            row = (await conn.execute(
+                text(
+                    'SELECT s.worker_id, s.persona_id, s.user_chat_id FROM "SessionRegistry" s '
+                    'JOIN "SessionWorker" w ON w.worker_id = s.worker_id '
+                    'WHERE s.session_id = :session_id '
+                    'AND w.heartbeat_at > now() - make_interval(secs => :stale_after)'
+                ),
+                {"session_id": str(session_id), "stale_after": self.stale_after}
+            )).first()
+        if row is None:
+            return None
+        return {"worker_id": row.worker_id, "persona_id": row.persona_id, "user_chat_id": row.user_chat_id}
+
+    async def update(self, session_id: UUID, **fields: Any):
+        values = {key: fields[key] for key in SHARED_FIELDS if key in fields}
+        if not values:
+            return
+        if session_id in self._owned:
+            self._owned[session_id].update(values)
+        assignments = ", ".join(f"{key} = :{key}" for key in values)
+        async with engine.begin() as conn:
+            await conn.execute(
+                text(f'UPDATE "SessionRegistry" SET {assignments}, updated_at = now() WHERE session_id = :session_id'),
+                {**values, "session_id": str(session_id)}
+            )
+
+    async def publish(self, session_id: UUID, command: Dict[str, Any]) -> bool:
+        """ 명령 저장 후 소유 워커 채널로 명령 ID NOTIFY (커밋 시 전달) """
+        async with engine.begin() as conn:
+            result = await conn.execute(
+                text(
+                    'WITH target AS ('
+                    ' SELECT s.worker_id, w.channel FROM "SessionRegistry" s'
+                    ' JOIN "SessionWorker" w ON w.worker_id = s.worker_id'
+                    ' WHERE s.session_id = :session_id'
+                    ' AND w.heartbeat_at > now() - make_interval(secs => :stale_after)'
+                    '), message AS ('
+                    ' INSERT INTO "SessionMessage" (worker_id, session_id, command)'
+                    ' SELECT worker_id, CAST(:session_id AS TEXT), CAST(:command AS JSONB) FROM target'
+                    ' RETURNING id, worker_id'
+                    ') '
+                    'SELECT pg_notify(target.channel, CAST(message.id AS TEXT)) '
+                    'FROM message JOIN target ON target.worker_id = message.worker_id'
+                ),
+                {
+                    "session_id": str(session_id),
+                    "stale_after": self.stale_after,
+                    "command": json.dumps(command, ensure_ascii=False, default=str)
+                }
+            )
+            routed = result.first() is not None
+        if routed:
+            self.published += 1
+        return routed
+
+    def _on_notify(self, connection, pid: int, channel: str, payload: str):
+        """ asyncpg 리스너 콜백 (동기) -> 명령 처리 태스크 생성 """
+        try:
+            message_id = int(payload)
+        except ValueError:
+            logger.warning("session_registry.invalid_notify", channel=channel, payload=payload[:100])
+            return
+        self._spawn_consume(message_id)
+
+    def _spawn_consume(self, message_id: int):
+        task = asyncio.create_task(self._consume(message_id))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _consume(self, message_id: int):
+        try:
+            async with engine.begin() as conn:
+                row = (await conn.execute(
+                    text('DELETE FROM "SessionMessage" WHERE id = :id RETURNING session_id, command'),
+                    {"id": message_id}
+                )).first()
+            if row is None:
+                return
+            command = row.command if isinstance(row.command, dict) else json.loads(row.command)
+            await self._handle(UUID(row.session_id), command)
+        except Exception as e:
+            logger.warning("session_registry.deliver_failed", message_id=message_id, error=str(e))
+
+    async def _heartbeat(self):
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            await self.beat()
+
+    async def beat(self):
+        """
+        heartbeat 한 번 (LISTEN 연결 확인 -> heartbeat 갱신 -> 끊긴 워커의 세션/명령 정리)
+        - LISTEN 연결이 끊겼으면 재연결 (실패 시 heartbeat를 건너뛰어 다른 워커가 이 워커를 끊긴 워커로 처리)
+        - 재연결 후 끊긴 동안 NOTIFY를 받지 못한 명령 처리
+        - 이미 끊긴 워커로 정리됐다면 워커와 소유 세션을 다시 등록
+        """
+        relistened = False
+        if not self.listening():
+            try:
+                await self._listen()
+            except Exception as e:
+                logger.warning("session_registry.relisten_failed", worker_id=self.worker_id, error=str(e))
+                return
+            relistened = True
+            self.reconnects += 1
+            logger.info("session_registry.relistened", worker_id=self.worker_id)
+
+        try:
+            async with engine.begin() as conn:
+                result = await conn.execute(
+                    text('UPDATE "SessionWorker" SET heartbeat_at = now() WHERE worker_id = :worker_id'),
+                    {"worker_id": self.worker_id}
+                )
+                if result.rowcount == 0:
+                    await self._rejoin(conn)
+                for statement in REAP_STALE_WORKERS_SQL:
+                    await conn.execute(text(statement), {"stale_after": self.stale_after})
+                missed = (await conn.execute(
+                    text('SELECT id FROM "SessionMessage" WHERE worker_id = :worker_id ORDER BY id'),
+                    {"worker_id": self.worker_id}
+                )).scalars().all() if relistened else []
+        except Exception as e:
+            logger.warning("session_registry.heartbeat_failed", error=str(e))
+            return
+        for message_id in missed:
+            self._spawn_consume(message_id)
+
+    async def _rejoin(self, conn):
+        """ 끊긴 워커로 정리된 경우 워커와 소유 세션 재등록 (그 사이 다른 워커로 옮겨간 세션은 제외) """
+        await conn.execute(
+            text(
+                'INSERT INTO "SessionWorker" (worker_id, channel) VALUES (:worker_id, :channel) '
+                'ON CONFLICT (worker_id) DO UPDATE SET heartbeat_at = now()'
+            ),
+            {"worker_id": self.worker_id, "channel": self.channel}
+        )
+        if self._owned:
+            await conn.execute(
+                text(
+                    'INSERT INTO "SessionRegistry" (session_id, worker_id, persona_id, user_chat_id) '
+                    'VALUES (:session_id, :worker_id, :persona_id, :user_chat_id) '
+                    'ON CONFLICT (session_id) DO NOTHING'
+                ),
+                [
+                    {
+                        "session_id": str(session_id), "worker_id": self.worker_id,
+                        "persona_id": fields.get("persona_id"), "user_chat_id": fields.get("user_chat_id")
+                    }
+                    for session_id, fields in self._owned.items()
+                ]
+            )
+        logger.warning("session_registry.rejoined", worker_id=self.worker_id, sessions=len(self._owned))
+
+    def stats(self) -> Dict[str, Any]:
+        return {**super().stats(), "listening": self.listening(), "reconnects": self.reconnects}
+
+
+def create_session_registry() -> SessionRegistry:
+    """ SESSION_REGISTRY_BACKEND 설정에 따른 레지스트리 생성 """
+    if settings.SESSION_REGISTRY_BACKEND == "postgres":
+        return PostgresSessionRegistry(settings.DATABASE_URL, settings.SESSION_REGISTRY_HEARTBEAT_INTERVAL)
+    return InMemorySessionRegistry()
+
+session_registry = create_session_registry()
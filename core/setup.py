@@ -7,8 +7,19 @@ from sqlmodel import SQLModel, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from core.db import engine  # DB 엔진 (Session 생성용)
+from core.http import http_clients # LLM/MCP 공유 HTTP 클라이언트
+from core.chat_writer import chat_writer # 채팅 메세지 write-behind 저장
+from core.view_counter import view_counter # FAQ/용어 조회수 일괄 반영
+from core.qna_cache import qna_cache # FAQ/용어 답변 캐시
+from core.persona_catalog import persona_catalog # 페르소나 목록 인메모리 카탈로그
+from core.session_registry import session_registry # WebSocket 세션 소유 워커 레지스트리
+from core.partitions import ensure_response_columns, partition_maintainer # 채팅 테이블 월별 파티션 생성
+from core.readiness import readiness_probe # 외부 의존성 준비 상태 확인
+from core.log import get_logger # 구조화 로그
 from models import Persona # 페르소나 DB 모델
 
+logger = get_logger(__name__)
+
 # from core.db import create_db_and_tables
 
 
@@ -16,7 +27,7 @@ async def seed_initial_data():
     """
     JSON 파일에서 데이터를 로드하여 Persona 테이블을 시딩합니다.
     """
-    print("🌱 초기 데이터(Seeding) 확인 중...")
+    logger.info("seed.started")
     BASE_DIR = Path(__file__).resolve().parent.parent 
     DATA_FILE = BASE_DIR / "data" / "personas.json"
 
@@ -27,16 +38,16 @@ async def seed_initial_data():
             existing_persona = (await db.exec(statement)).first()
             
             if existing_persona:
-                print("... Persona 데이터가 이미 존재합니다. 시딩을 건너뜁니다.")
+                logger.info("seed.skipped", reason="Persona 데이터가 이미 존재합니다")
                 return
 
             # 2. JSON 파일이 존재하는지 확인
             if not DATA_FILE.exists():
-                print(f"WARN: {DATA_FILE} 파일이 없습니다. 시딩을 건너뜁니다.")
+                logger.warning("seed.skipped", reason="시딩 파일이 없습니다", path=DATA_FILE)
                 return
                 
             # 3. JSON 파일 로드
-            print(f"... {DATA_FILE}에서 데이터를 로드합니다.")
+            logger.info("seed.loading", path=DATA_FILE)
             with open(DATA_FILE, "r", encoding="utf-8") as f:
                 personas_data = json.load(f)
 
@@ -54,10 +65,10 @@ async def seed_initial_data():
             
             db.add_all(personas_to_add)
             await db.commit()
-            print(f"✅ {len(personas_to_add)}개의 페르소나를 성공적으로 시딩했습니다.")
+            logger.info("seed.completed", personas=len(personas_to_add))
 
     except Exception as e:
-        print(f"❌ 초기 데이터 시딩 중 오류 발생: {e}")
+        logger.exception("seed.failed")
         # (필요 시 세션 롤백)
         # session.rollback()
 
@@ -66,27 +77,71 @@ async def seed_initial_data():
 async def lifespan(app: FastAPI):
     """애플리케이션 수명 주기 관리"""
     # 시작 시점: DB 테이블 생성
-    print("🚀 백엔드 서버 시작 준비...")
+    logger.info("server.starting")
     
     # ----- DB 테이블 생성 -----
     #   - 서버 시작 시 SQLModel의 메타데이터에 등록된 모든 테이블 DB에 생성
     #   - 이미 존재하는 경우 무시
     #   - run_sync를 이용하여 비동기 이벤트 루프 내에서 create_all 동기 함수 실행 
+    #   - 파티션 전환 전 DB는 ChatbotResponse에 현재 모델이 저장하는 컬럼만 추가 (전환은 core.uuid_migration)
     try:
         async with engine.begin() as conn:
             await conn.run_sync(SQLModel.metadata.create_all)
+            await ensure_response_columns(conn)
     except Exception as e:
-        print(f"❌ DB 테이블 생성 중 오류 발생: {e}")
+        logger.exception("server.create_tables_failed")
         raise e
 
+    # ----- 채팅 테이블 월별 파티션 생성 -----
+    #   - 이번 달부터 CHAT_PARTITION_PREMAKE_MONTHS개월 뒤까지 없는 파티션 생성
+    #   - 이후 CHAT_PARTITION_CHECK_INTERVAL마다 백그라운드에서 확인
+    await partition_maintainer.start()
+
     # ----- 초기 데이터 시딩 -----
     #   - 서버 시작 시 각 테이블을 조회하고, 데이터가 없다면 초기 데이터 삽입
     await seed_initial_data()
+
+    # ----- 페르소나 카탈로그 적재 -----
+    #   - 페르소나 목록/존재 확인 요청이 DB를 조회하지 않도록 시딩 직후 메모리에 적재
+    #   - 이후 PERSONA_CATALOG_TTL마다 백그라운드에서 갱신
+    await persona_catalog.start()
+
+    # ----- 공유 HTTP 클라이언트 생성 -----
+    #   - LLM/MCP 서버 호출 시 커넥션 풀(keep-alive)을 재사용
+    await http_clients.start()
+
+    # ----- 외부 의존성 준비 상태 확인 시작 -----
+    #   - 채팅 DB, FAQ DB, LLM/MCP 서버를 주기적으로 확인 (/api/health/ready)
+    await readiness_probe.start()
+
+    # ----- 세션 레지스트리 시작 -----
+    #   - postgres 백엔드 사용 시 다른 워커에서 보낸 로그인 응답 전송 명령 수신
+    await session_registry.start()
+
+    # ----- 채팅 메세지 write-behind 저장 태스크 시작 -----
+    #   - CHAT_WRITE_BEHIND 활성화 시에만 동작
+    await chat_writer.start()
+
+    # ----- FAQ/용어 조회수 일괄 반영 태스크 시작 -----
+    await view_counter.start()
+
+    # ----- FAQ/용어 답변 캐시 적재 -----
+    #   - 배포 직후부터 캐시 히트가 가능하도록 FAQ DB에서 미리 적재
+    #   - 이후 QNA_CACHE_TTL마다 백그라운드에서 갱신
+    await qna_cache.start()
     
     # --- 서버 실행 준비 완료 ---
-    print("✅ 백엔드 서버가 시작되었습니다.")
+    logger.info("server.started")
 
     yield
     # --- 서버 종료 시점 ---
-    print("🛑 백엔드 서버가 종료되었습니다.")
+    await qna_cache.close()
+    await persona_catalog.close()
+    await partition_maintainer.close()
+    await chat_writer.close() # 큐에 남은 메세지 저장
+    await view_counter.close() # 누적된 조회수 반영
+    await session_registry.close() # 이 워커 소유 세션 정보 삭제
+    await readiness_probe.close()
+    await http_clients.close()
+    logger.info("server.stopped")
     # (필요 시 리소스 정리, 종료 작업 수행)
\ No newline at end of file
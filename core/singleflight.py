@@ -0,0 +1,56 @@
+import asyncio
+
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 비동기 호출을 하나로 합치는 클래스
+    - 첫 호출만 실제로 실행하고, 진행 중에 들어온 같은 키의 호출은 그 결과(또는 예외)를 공유
+    - 실제 호출은 별도 태스크로 실행하므로 첫 호출자가 취소되어도 다른 대기자는 결과를 받음
+    - shareable이 주어지면 공유할 수 없는 결과(호출자 전용 데이터 포함)를 받은 대기자는 직접 다시 호출
+    """
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        # 모니터링용 카운터
+        self.calls = 0      # 실제 실행된 호출 수
+        self.coalesced = 0  # 진행 중인 호출에 합류하여 절약된 호출 수
+        self.unshared = 0   # 합류했지만 결과를 공유할 수 없어 직접 호출한 수
+
+    async def do(
+        self,
+        key: Hashable,
+        fn: Callable[[], Awaitable[T]],
+        shareable: Optional[Callable[[T], bool]] = None
+    ) -> T:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, key=key: self._on_done(key, t))
+            self.calls += 1
+            return await asyncio.shield(task)
+
+        result = await asyncio.shield(task)
+        if shareable is not None and not shareable(result):
+            self.unshared += 1
+            return await fn()
+        self.coalesced += 1
+        return result
+
+    def _on_done(self, key: Hashable, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 모든 대기자가 취소된 경우에도 예외 미확인 경고가 남지 않도록 확인 처리
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "inflight": len(self._inflight),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "unshared": self.unshared
+        }
@@ -0,0 +1,579 @@
+"""
+채팅 테이블 온라인 전환 (ID 컬럼 CHAR(36) -> uuid, 비파티션 Chat/ChatbotResponse -> 월별 RANGE 파티션)
+
+서비스 중단 없이 전환하기 위해 uuid 컬럼/월별 파티션의 새 테이블("<테이블>__uuid")을 만들어 채운 뒤 이름을 교체
+(ALTER COLUMN TYPE이나 잠근 상태의 일괄 복사는 테이블 전체를 다시 쓰는 동안 읽기/쓰기를 모두 막으므로 사용하지 않음)
+ID가 이미 uuid인 비파티션 테이블도 같은 단계로 파티션 테이블로 전환
+1. prepare: 새 테이블(월 파티션 포함) 생성, 기존 테이블에 동기화 트리거 설치
+   (이후 기존 테이블의 INSERT/UPDATE/DELETE가 같은 트랜잭션에서 새 테이블에 반영됨)
+2. backfill: 기존 행을 PK 순서로 batch_size씩 복사 (배치마다 커밋, 복사 중인 행만 FOR SHARE 잠금)
+3. verify: 같은 스냅샷에서 기존/새 테이블 행 수 비교
+4. swap: 짧은 트랜잭션에서 기존 테이블을 "<테이블>__char"로, 새 테이블을 원래 이름으로 변경
+   (lock_timeout 초과 시 재시도, 잠금은 이름 변경 동안만 유지)
+   교체 후 swap 이전에 연결된 같은 DB/계정의 클라이언트 연결을 종료
+   (CHAR(36) 기준으로 준비된 prepared statement는 uuid 컬럼에서 다시 계획되지 않으므로 재연결 필요)
+5. cleanup: 확인 후 "<테이블>__char" 삭제 및 새 테이블의 파티션 인덱스/제약조건 이름 정리
+
+- UUID 형식이 아닌 기존 ID는 md5(ID)::uuid로 변환 (참조하는 컬럼도 같은 규칙이므로 관계 유지)
+- 파티션 전환 전(비파티션) 테이블도 그대로 처리되며, 새 테이블은 월별 파티션으로 생성됨
+
+배포 순서 (서비스 중단 없음):
+1. CHAR(36)/uuid 컬럼 모두에서 동작하는 버전(models.ChatKey) 배포
+2. run (prepare -> backfill -> verify -> swap), 연결 종료 시 요청 실패가 없도록 DB_POOL_PRE_PING=true 권장
+3. cleanup
+4. 모든 DB의 전환이 끝난 뒤 ChatKey를 PG_UUID(as_uuid=True)로 바꾼 버전 배포
+   (그 전에 PG_UUID 모델을 배포하면 CHAR(36) 테이블에서 uuid 바인드가 실패함)
+
+사용법 (프로젝트 루트에서 실행, 1번 버전 서비스 중 실행):
+    python -m core.uuid_migration status
+    python -m core.uuid_migration run --batch-size 5000   # prepare -> backfill -> verify -> swap
+    python -m core.uuid_migration cleanup                 # 새 버전 배포/확인 후 기존 테이블 삭제
+    python -m core.uuid_migration abort                   # swap 전 중단 (트리거/새 테이블 삭제)
+"""
+import argparse
+import asyncio
+import json
+
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from core.config import settings
+from core.db import engine
+from core.log import get_logger
+from core.partitions import (
+    PARTITION_UNIQUE_COLUMNS, create_partition_sql, is_partitioned, list_partitions,
+    months_to_create, partition_month, partition_name, unique_index_sql
+)
+
+logger = get_logger(__name__)
+
+
+SHADOW_SUFFIX = "__uuid" # 새 테이블 이름 접미사
+LEGACY_SUFFIX = "__char" # 교체 후 기존 테이블 이름 접미사
+
+# 기존 CHAR(36) 값을 uuid로 변환 (UUID 형식이 아니면 md5 기반 uuid)
+CAST_FUNCTION_SQL = r"""
+CREATE OR REPLACE FUNCTION uuid_migration_cast(value text) RETURNS uuid
+LANGUAGE sql IMMUTABLE AS $$
+    SELECT CASE
+        WHEN value ~* '^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$' THEN value::uuid
+        ELSE md5(value)::uuid
+    END
+$$
+"""
+
+
+class MigrationTable:
+    """ 전환 대상 테이블 정의 (이 마이그레이션 시점의 스키마로 고정) """
+    def __init__(
+        self,
+        name: str,
+        key: str,
+        conflict: Sequence[str],
+        uuid_columns: Sequence[str],
+        columns: Sequence[str],
+        ddl: Sequence[str],
+        partitioned: bool
+    ):
+        self.name = name
+        self.key = key                     # 행 식별 컬럼 (uuid)
+        self.conflict = tuple(conflict)    # 새 테이블 PK
+        self.uuid_columns = tuple(uuid_columns)
+        self.columns = tuple(columns)
+        self.ddl = tuple(ddl)              # 새 테이블 DDL ({t}: 새 테이블, {s}/{c}: 새 ChatSession/Chat 이름)
+        self.partitioned = partitioned
+
+    @property
+    def shadow(self) -> str:
+        return f"{self.name}{SHADOW_SUFFIX}"
+
+    @property
+    def legacy(self) -> str:
+        return f"{self.name}{LEGACY_SUFFIX}"
+
+
+# 참조 순서 (ChatSession -> Chat -> ChatbotResponse)
+TABLES = (
+    MigrationTable(
+        "ChatSession", key="session_id", conflict=("session_id",), uuid_columns=("session_id",),
+        columns=("session_id", "persona_id", "created_at"),
+        ddl=(
+            'CREATE TABLE IF NOT EXISTS "{t}" ('
+            ' session_id uuid NOT NULL,'
+            ' persona_id INTEGER REFERENCES "Persona" (id) ON DELETE SET NULL,'
+            ' created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),'
+            ' CONSTRAINT "{t}_pkey" PRIMARY KEY (session_id))',
+            'CREATE INDEX IF NOT EXISTS "idx_chat_session_created{x}" ON "{t}" (created_at)',
+        ),
+        partitioned=False
+    ),
+    MigrationTable(
+        "Chat", key="id", conflict=("id", "created_at"), uuid_columns=("id", "session_id"),
+        columns=("id", "session_id", "persona_id", "is_user", "content", "created_at"),
+        ddl=(
+            'CREATE TABLE IF NOT EXISTS "{t}" ('
+            ' id uuid NOT NULL,'
+            ' session_id uuid NOT NULL REFERENCES "{s}" (session_id) ON DELETE CASCADE,'
+            ' persona_id INTEGER REFERENCES "Persona" (id) ON DELETE SET NULL,'
+            ' is_user BOOLEAN NOT NULL,'
+            ' content TEXT NOT NULL,'
+            ' created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),'
+            ' CONSTRAINT "{t}_pkey" PRIMARY KEY (id, created_at)'
+            ') PARTITION BY RANGE (created_at)',
+            'CREATE INDEX IF NOT EXISTS "idx_session_created{x}" ON "{t}" (session_id, created_at)',
+        ),
+        partitioned=True
+    ),
+    MigrationTable(
+        "ChatbotResponse", key="chat_id", conflict=("chat_id", "created_at"), uuid_columns=("chat_id",),
+        columns=(
+            "chat_id", "prompt_chat_id", "prompt_chat_created_at", "created_at",
+            "is_helpful", "source_tool", "response_payload"
+        ),
+        ddl=(
+            'CREATE TABLE IF NOT EXISTS "{t}" ('
+            ' chat_id uuid NOT NULL,'
+            ' prompt_chat_id uuid,'
+            ' prompt_chat_created_at TIMESTAMP WITH TIME ZONE,'
+            ' created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),'
+            ' is_helpful BOOLEAN,'
+            ' source_tool TEXT,'
+            ' response_payload JSON,'
+            ' CONSTRAINT "{t}_pkey" PRIMARY KEY (chat_id, created_at),'
+            ' CONSTRAINT "fk_response_chat{x}" FOREIGN KEY (chat_id, created_at)'
+            ' REFERENCES "{c}" (id, created_at) ON DELETE CASCADE,'
+            ' CONSTRAINT "fk_response_prompt_chat{x}" FOREIGN KEY (prompt_chat_id, prompt_chat_created_at)'
+            ' REFERENCES "{c}" (id, created_at) MATCH FULL ON DELETE SET NULL'
+            ') PARTITION BY RANGE (created_at)',
+            'CREATE INDEX IF NOT EXISTS "idx_response_prompt_chat{x}" ON "{t}" (prompt_chat_id)',
+        ),
+        partitioned=True
+    ),
+)
+SESSION_TABLE, CHAT_TABLE = TABLES[0], TABLES[1]
+
+
+def trigger_name(table: MigrationTable) -> str:
+    return f"uuid_migration_sync_{table.name}"
+
+def source_expressions(table: MigrationTable, row: str, has_created_at: bool = True) -> List[str]:
+    """
+    새 테이블 컬럼별 기존 행 값 표현식
+    - uuid 컬럼: uuid_migration_cast(text)
+    - 파티션 전환 전 ChatbotResponse: 챗봇 메세지(Chat)의 created_at
+      (created_at 컬럼이 없거나, 서버 시작 시 추가된 컬럼이라 기존 행의 값이 NULL)
+    - 프롬프트 참조: 프롬프트 메세지(Chat)의 id/created_at (메세지가 없으면 둘 다 NULL, 외래키 MATCH FULL)
+    """
+    expressions = []
+    for column in table.columns:
+        if column in ("prompt_chat_id", "prompt_chat_created_at"):
+            value = "uuid_migration_cast(p.id::text)" if column == "prompt_chat_id" else "p.created_at"
+            expressions.append(f'(SELECT {value} FROM "Chat" p WHERE p.id = {row}.prompt_chat_id LIMIT 1)')
+        elif column in table.uuid_columns:
+            expressions.append(f"uuid_migration_cast({row}.{column}::text)")
+        elif column == "created_at" and table.name == "ChatbotResponse":
+            chat_created_at = f'(SELECT c.created_at FROM "Chat" c WHERE c.id = {row}.chat_id)'
+            expressions.append(f"coalesce({row}.created_at, {chat_created_at})" if has_created_at else chat_created_at)
+        else:
+            expressions.append(f"{row}.{column}")
+    return expressions
+
+def copy_sql(table: MigrationTable, alias: str, source: str) -> str:
+    """ 기존 행(source, 별칭 alias)을 새 테이블에 복사 (이미 있으면 건너뜀) """
+    return (
+        f'        INSERT INTO "{table.shadow}" ({", ".join(table.columns)}) '
+        f'SELECT {", ".join(source_expressions(table, alias))} FROM {source} ON CONFLICT DO NOTHING;\n'
+    )
+
+def sync_function_sql(table: MigrationTable, has_created_at: bool = True) -> str:
+    """
+    기존 테이블 행 변경을 새 테이블에 반영하는 트리거 함수
+    - DELETE 또는 PK(파티션 키 포함) 변경: 새 테이블의 기존 행 삭제
+    - INSERT/UPDATE: 새 테이블에 upsert
+    - 참조하는 행을 먼저 복사하여 외래키 보장 (아직 backfill되지 않은 기존 행일 수 있음)
+        - Chat: 세션
+        - ChatbotResponse: 챗봇/프롬프트 메세지와 그 세션 (prepare 이전 응답의 피드백 수정, prepare 이전 프롬프트 참조)
+    """
+    keys = [column for column in table.conflict if column != "created_at" or has_created_at]
+    old_keys = ", ".join(f"OLD.{column}" for column in keys)
+    new_keys = ", ".join(f"NEW.{column}" for column in keys)
+    columns = ", ".join(table.columns)
+    values = ", ".join(source_expressions(table, "NEW", has_created_at))
+    updates = ", ".join(f"{column} = EXCLUDED.{column}" for column in table.columns if column not in table.conflict)
+    parent_copy = ""
+    if table.name == "Chat":
+        parent_copy = copy_sql(SESSION_TABLE, "s", '"ChatSession" s WHERE s.session_id = NEW.session_id')
+    elif table.name == "ChatbotResponse":
+        parent_copy = (
+            copy_sql(
+                SESSION_TABLE, "s",
+                '"ChatSession" s WHERE s.session_id IN '
+                '(SELECT p.session_id FROM "Chat" p WHERE p.id IN (NEW.chat_id, NEW.prompt_chat_id))'
+            )
+            + copy_sql(CHAT_TABLE, "p", '"Chat" p WHERE p.id IN (NEW.chat_id, NEW.prompt_chat_id)')
+        )
+    return (
+        f'CREATE OR REPLACE FUNCTION "{trigger_name(table)}"() RETURNS trigger LANGUAGE plpgsql AS $$\n'
+        f"BEGIN\n"
+        f"    IF TG_OP = 'DELETE' OR (TG_OP = 'UPDATE' AND ROW({old_keys}) IS DISTINCT FROM ROW({new_keys})) THEN\n"
+        f'        DELETE FROM "{table.shadow}" WHERE {table.key} = uuid_migration_cast(OLD.{table.key}::text);\n'
+        f"    END IF;\n"
+        f"    IF TG_OP <> 'DELETE' THEN\n"
+        f"{parent_copy}"
+        f'        INSERT INTO "{table.shadow}" ({columns}) VALUES ({values})\n'
+        f'        ON CONFLICT ({", ".join(table.conflict)}) DO UPDATE SET {updates};\n'
+        f"    END IF;\n"
+        f"    RETURN NULL;\n"
+        f"END $$"
+    )
+
+def backfill_sql(table: MigrationTable, pk_columns: Sequence[str], first: bool, has_created_at: bool = True) -> str:
+    """
+    기존 테이블에서 PK 순서로 :batch_size행을 잠그고(FOR SHARE) 새 테이블에 복사하는 한 배치
+    - 첫 배치가 아니면 이전 배치 마지막 PK(:k0, :k1, ...) 다음부터 (PK 인덱스 범위 조회)
+    - 이미 트리거로 반영된 행은 건너뜀 (트리거가 반영한 값이 최신)
+    - 반환: 복사 대상 행 수, 배치 마지막 PK
+    """
+    keys = ", ".join(pk_columns)
+    where = "" if first else f"WHERE ({keys}) > ({', '.join(f':k{i}' for i in range(len(pk_columns)))}) "
+    last = ", ".join(f"max_row.{column} AS k{i}" for i, column in enumerate(pk_columns))
+    return (
+        f'WITH batch AS (SELECT * FROM "{table.name}" {where}'
+        f"ORDER BY {keys} LIMIT :batch_size FOR SHARE), "
+        f'copied AS (INSERT INTO "{table.shadow}" ({", ".join(table.columns)}) '
+        f"SELECT {', '.join(source_expressions(table, 'b', has_created_at))} FROM batch b ON CONFLICT DO NOTHING) "
+        f"SELECT (SELECT count(*) FROM batch) AS rows, {last} "
+        f"FROM (SELECT {keys} FROM batch ORDER BY {', '.join(f'{c} DESC' for c in pk_columns)} LIMIT 1) max_row"
+    )
+
+def final_name(name: str) -> str:
+    """ 교체 후 새 테이블 객체 이름 (Chat__uuid_p202501_pkey -> Chat_p202501_pkey) """
+    return name.replace(SHADOW_SUFFIX, "")
+
+
+async def column_type(conn: AsyncConnection, table: str, column: str) -> Optional[str]:
+    return (await conn.execute(
+        text(
+            "SELECT data_type FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = :table AND column_name = :column"
+        ),
+        {"table": table, "column": column}
+    )).scalar()
+
+async def primary_key_columns(conn: AsyncConnection, table: str) -> List[str]:
+    rows = await conn.execute(
+        text(
+            "SELECT a.attname FROM pg_index i "
+            "JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey) "
+            "WHERE i.indrelid = to_regclass(:table) AND i.indisprimary "
+            "ORDER BY array_position(i.indkey::int2[], a.attnum)"
+        ),
+        {"table": f'"{table}"'}
+    )
+    return list(rows.scalars().all())
+
+async def relation_exists(conn: AsyncConnection, name: str) -> bool:
+    return (await conn.execute(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": f'"{name}"'})).scalar()
+
+
+async def is_converted(conn: AsyncConnection, table: MigrationTable) -> bool:
+    """ ID 컬럼이 uuid이고, 파티션 대상 테이블이면 파티션 테이블인지 """
+    if await column_type(conn, table.name, table.key) != "uuid":
+        return False
+    return not table.partitioned or await is_partitioned(conn, table.name)
+
+async def migration_status() -> Dict[str, Any]:
+    """ 테이블별 전환 단계 (pending: 전환 전, preparing: 새 테이블/트리거 설치됨, done: 전환 완료) """
+    status = {}
+    async with engine.connect() as conn:
+        for table in TABLES:
+            if await is_converted(conn, table):
+                phase = "done"
+            elif await relation_exists(conn, table.shadow):
+                phase = "preparing"
+            else:
+                phase = "pending"
+            status[table.name] = {
+                "phase": phase,
+                "key_type": await column_type(conn, table.name, table.key),
+                "partitioned": await is_partitioned(conn, table.name),
+                "legacy_table": await relation_exists(conn, table.legacy)
+            }
+    return status
+
+
+async def ensure_shadow_partitions(conn: AsyncConnection, months: Sequence[date]) -> List[str]:
+    """
+    새 파티션 테이블에 월 파티션 생성 (기존 데이터가 있는 달 + 이번 달부터 미리 만들 달)
+    파티션마다 PARTITION_UNIQUE_COLUMNS UNIQUE 인덱스도 생성 (Chat.id는 같은 달 안에서 유일)
+    """
+    created = []
+    for table in TABLES:
+        if not table.partitioned:
+            continue
+        existing = await list_partitions(conn, table.shadow)
+        for month in months:
+            name = partition_name(table.shadow, month)
+            if name in existing:
+                continue
+            await conn.execute(text(create_partition_sql(table.shadow, month)))
+            if table.name in PARTITION_UNIQUE_COLUMNS:
+                await conn.execute(text(unique_index_sql(table.shadow, month, PARTITION_UNIQUE_COLUMNS[table.name])))
+            created.append(name)
+    return created
+
+async def source_months(conn: AsyncConnection) -> List[date]:
+    """ 기존 Chat 데이터가 있는 달 (파티션 테이블이면 파티션 목록, 아니면 최소 created_at부터) """
+    today = datetime.now(timezone.utc).date()
+    if await is_partitioned(conn, "Chat"):
+        months = [partition_month("Chat", name) for name in await list_partitions(conn, "Chat")]
+        oldest = min((month for month in months if month), default=today)
+    else:
+        oldest = (await conn.execute(text('SELECT min(created_at) FROM "Chat"'))).scalar() or today
+        oldest = oldest.astimezone(timezone.utc).date() if isinstance(oldest, datetime) else oldest
+    months_back = (today.year - oldest.year) * 12 + today.month - oldest.month
+    return months_to_create(today, settings.CHAT_PARTITION_PREMAKE_MONTHS, months_back)
+
+async def prepare(lock_timeout: float) -> Dict[str, Any]:
+    """ 변환 함수/새 테이블/파티션 생성 후 동기화 트리거 설치 (트리거 생성 시 테이블별로 잠시 쓰기 잠금) """
+    async with engine.begin() as conn:
+        await conn.execute(text(f"SET LOCAL lock_timeout = '{int(lock_timeout * 1000)}ms'"))
+        converted = [await is_converted(conn, table) for table in TABLES]
+        if all(converted):
+            raise RuntimeError("tables are already uuid and partitioned")
+        await conn.execute(text(CAST_FUNCTION_SQL))
+        # 새 Chat 테이블이 새 ChatSession을 참조하므로 세 테이블을 함께 전환 (uuid 값은 uuid_migration_cast에서 그대로 유지)
+        for table in TABLES:
+            for statement in table.ddl:
+                await conn.execute(text(statement.format(
+                    t=table.shadow, s=SESSION_TABLE.shadow, c=CHAT_TABLE.shadow, x=SHADOW_SUFFIX
+                )))
+        created = await ensure_shadow_partitions(conn, await source_months(conn))
+
+        has_created_at = await column_type(conn, "ChatbotResponse", "created_at") is not None
+        for table in TABLES:
+            await conn.execute(text(sync_function_sql(table, has_created_at)))
+            await conn.execute(text(f'DROP TRIGGER IF EXISTS "{trigger_name(table)}" ON "{table.name}"'))
+            await conn.execute(text(
+                f'CREATE TRIGGER "{trigger_name(table)}" AFTER INSERT OR UPDATE OR DELETE ON "{table.name}" '
+                f'FOR EACH ROW EXECUTE FUNCTION "{trigger_name(table)}"()'
+            ))
+    logger.info("uuid_migration.prepared", partitions=created)
+    return {"partitions": created}
+
+
+async def backfill(batch_size: int, pause: float = 0.0) -> Dict[str, int]:
+    """
+    참조 순서대로 테이블별 기존 행 복사 (세션 -> 채팅 -> 챗봇 응답)
+    - 배치마다 별도 트랜잭션 (긴 트랜잭션 없이 진행, 중단 후 재실행 시 처음부터 다시 훑되 복사된 행은 건너뜀)
+    - pause: 배치 사이 대기 시간(초, 운영 부하 조절)
+    """
+    async with engine.connect() as conn:
+        has_created_at = await column_type(conn, "ChatbotResponse", "created_at") is not None
+        # 복사 도중 달이 바뀌어도 트리거 INSERT가 실패하지 않도록 파티션 확인
+        await ensure_shadow_partitions(conn, await source_months(conn))
+        await conn.commit()
+
+    copied = {}
+    for table in TABLES:
+        async with engine.connect() as conn:
+            pk_columns = await primary_key_columns(conn, table.name)
+        params: Dict[str, Any] = {"batch_size": batch_size}
+        copied[table.name] = 0
+        first = True
+        while True:
+            async with engine.begin() as conn:
+                row = (await conn.execute(
+                    text(backfill_sql(table, pk_columns, first, has_created_at)), params
+                )).first()
+            if row is None or row.rows == 0:
+                break
+            copied[table.name] += row.rows
+            params.update({f"k{i}": row._mapping[f"k{i}"] for i in range(len(pk_columns))})
+            first = False
+            if row.rows < batch_size:
+                break
+            if pause:
+                await asyncio.sleep(pause)
+        logger.info("uuid_migration.backfilled", table=table.name, rows=copied[table.name])
+    return copied
+
+
+async def verify() -> Dict[str, Dict[str, int]]:
+    """ 같은 스냅샷(REPEATABLE READ)에서 기존/새 테이블 행 수 비교 (트리거로 동기화되므로 같아야 함) """
+    counts = {}
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="REPEATABLE READ")
+        async with conn.begin():
+            for table in TABLES:
+                source = (await conn.execute(text(f'SELECT count(*) FROM "{table.name}"'))).scalar()
+                shadow = (await conn.execute(text(f'SELECT count(*) FROM "{table.shadow}"'))).scalar()
+                counts[table.name] = {"source": source, "shadow": shadow}
+    mismatched = [name for name, count in counts.items() if count["source"] != count["shadow"]]
+    if mismatched:
+        raise RuntimeError(f"row count mismatch: {counts}")
+    return counts
+
+
+async def _rename_relation(conn: AsyncConnection, old: str, new: str):
+    await conn.execute(text(f'ALTER TABLE "{old}" RENAME TO "{new}"'))
+
+async def _index_names(conn: AsyncConnection, table: str) -> List[str]:
+    rows = await conn.execute(
+        text(
+            "SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE i.indrelid = to_regclass(:table)"
+        ),
+        {"table": f'"{table}"'}
+    )
+    return list(rows.scalars().all())
+
+async def reset_connections() -> int:
+    """
+    같은 DB/계정의 다른 클라이언트 연결 종료 후 종료한 수 반환
+    - 워커 커넥션의 prepared statement는 파라미터 타입(bpchar)이 고정되어 있어 교체된 uuid 테이블에서 실패하므로
+      기존 연결을 끊어 풀이 새 연결(새 테이블 기준 statement)을 만들도록 함
+    - 세션 레지스트리 LISTEN 연결은 종료 감지 후 다시 연결됨
+    """
+    async with engine.begin() as conn:
+        terminated = (await conn.execute(text(
+            "SELECT count(pg_terminate_backend(pid)) FROM pg_stat_activity "
+            "WHERE datname = current_database() AND usename = current_user "
+            "AND backend_type = 'client backend' AND pid <> pg_backend_pid()"
+        ))).scalar()
+    logger.info("uuid_migration.connections_reset", terminated=terminated)
+    return terminated
+
+async def swap(lock_timeout: float, retries: int = 10, reset: bool = True) -> Dict[str, Any]:
+    """
+    기존/새 테이블 이름 교체 (한 트랜잭션, 세 테이블 ACCESS EXCLUSIVE 잠금)
+    - 기존: 테이블/월 파티션 이름에 __char, 테이블 수준 인덱스 이름에 __char 추가
+    - 새 테이블: 테이블/월 파티션/테이블 수준 인덱스 이름에서 __uuid 제거
+    - lock_timeout 안에 잠금을 얻지 못하면 롤백 후 재시도 (대기 중 다른 쿼리를 오래 막지 않도록)
+    - reset: 교체 후 기존 연결 종료 (reset_connections)
+    """
+    for attempt in range(1, retries + 1):
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(text(f"SET LOCAL lock_timeout = '{int(lock_timeout * 1000)}ms'"))
+                await conn.execute(text(
+                    'LOCK TABLE "ChatbotResponse", "Chat", "ChatSession" IN ACCESS EXCLUSIVE MODE'
+                ))
+                for table in TABLES:
+                    await conn.execute(text(f'DROP TRIGGER IF EXISTS "{trigger_name(table)}" ON "{table.name}"'))
+                    await conn.execute(text(f'DROP FUNCTION IF EXISTS "{trigger_name(table)}"()'))
+
+                for table in TABLES:
+                    for index in await _index_names(conn, table.name):
+                        await conn.execute(text(f'ALTER INDEX "{index}" RENAME TO "{index}{LEGACY_SUFFIX}"'))
+                    for partition in await list_partitions(conn, table.name):
+                        month = partition_month(table.name, partition)
+                        await _rename_relation(conn, partition, f"{table.legacy}_p{month:%Y%m}")
+                    await _rename_relation(conn, table.name, table.legacy)
+
+                for table in TABLES:
+                    for index in await _index_names(conn, table.shadow):
+                        await conn.execute(text(f'ALTER INDEX "{index}" RENAME TO "{final_name(index)}"'))
+                    for partition in await list_partitions(conn, table.shadow):
+                        await _rename_relation(conn, partition, final_name(partition))
+                    await _rename_relation(conn, table.shadow, table.name)
+            logger.info("uuid_migration.swapped", attempt=attempt)
+            result = {"swapped": True, "attempts": attempt}
+            if reset:
+                result["terminated_connections"] = await reset_connections()
+            return result
+        except DBAPIError as e:
+            # 55P03: lock_not_available
+            if getattr(e.orig, "sqlstate", None) != "55P03" or attempt == retries:
+                raise
+            logger.warning("uuid_migration.lock_timeout", attempt=attempt)
+            await asyncio.sleep(min(attempt, 5))
+
+
+async def cleanup() -> Dict[str, Any]:
+    """ 기존 테이블(__char) 삭제 후 새 테이블 파티션 수준 인덱스/제약조건 이름에서 __uuid 제거 """
+    renamed = []
+    async with engine.begin() as conn:
+        for table in reversed(TABLES):
+            await conn.execute(text(f'DROP TABLE IF EXISTS "{table.legacy}"'))
+        await conn.execute(text("DROP FUNCTION IF EXISTS uuid_migration_cast(text)"))
+
+        for table in TABLES:
+            relations = [table.name] + list(await list_partitions(conn, table.name))
+            for relation in relations:
+                constraints = (await conn.execute(
+                    text(
+                        "SELECT conname FROM pg_constraint WHERE conrelid = to_regclass(:table) "
+                        "AND conislocal AND contype = 'f' AND strpos(conname, :suffix) > 0"
+                    ),
+                    {"table": f'"{relation}"', "suffix": SHADOW_SUFFIX}
+                )).scalars().all()
+                for name in constraints:
+                    await conn.execute(text(f'ALTER TABLE "{relation}" RENAME CONSTRAINT "{name}" TO "{final_name(name)}"'))
+                    renamed.append(name)
+                for index in await _index_names(conn, relation):
+                    if SHADOW_SUFFIX in index:
+                        await conn.execute(text(f'ALTER INDEX "{index}" RENAME TO "{final_name(index)}"'))
+                        renamed.append(index)
+    logger.info("uuid_migration.cleaned_up", renamed=len(renamed))
+    return {"dropped": [table.legacy for table in TABLES], "renamed": renamed}
+
+
+async def abort() -> Dict[str, Any]:
+    """ swap 전 중단: 트리거/함수/새 테이블 삭제 (기존 테이블은 변경되지 않음) """
+    async with engine.begin() as conn:
+        for table in TABLES:
+            await conn.execute(text(f'DROP TRIGGER IF EXISTS "{trigger_name(table)}" ON "{table.name}"'))
+            await conn.execute(text(f'DROP FUNCTION IF EXISTS "{trigger_name(table)}"()'))
+        for table in reversed(TABLES):
+            await conn.execute(text(f'DROP TABLE IF EXISTS "{table.shadow}"'))
+        await conn.execute(text("DROP FUNCTION IF EXISTS uuid_migration_cast(text)"))
+    return {"aborted": True}
+
+
+async def run_command(args: argparse.Namespace) -> Any:
+    if args.command == "status":
+        return await migration_status()
+    if args.command == "cleanup":
+        return await cleanup()
+    if args.command == "abort":
+        return await abort()
+
+    result: Dict[str, Any] = {}
+    if args.command in ("prepare", "run"):
+        result["prepare"] = await prepare(args.lock_timeout)
+    if args.command in ("backfill", "run"):
+        result["backfill"] = await backfill(args.batch_size, args.pause)
+    if args.command in ("verify", "run"):
+        result["verify"] = await verify()
+    if args.command in ("swap", "run"):
+        result["swap"] = await swap(args.lock_timeout, args.retries, reset=not args.keep_connections)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        "command", choices=["status", "prepare", "backfill", "verify", "swap", "run", "cleanup", "abort"]
+    )
+    parser.add_argument("--batch-size", type=int, default=5000, help="backfill 배치당 행 수")
+    parser.add_argument("--pause", type=float, default=0.0, help="backfill 배치 사이 대기 시간(초)")
+    parser.add_argument("--lock-timeout", type=float, default=5.0, help="prepare/swap 잠금 대기 최대 시간(초)")
+    parser.add_argument("--retries", type=int, default=10, help="swap 잠금 대기 초과 시 재시도 횟수")
+    parser.add_argument("--keep-connections", action="store_true", help="swap 후 기존 연결을 종료하지 않음")
+    args = parser.parse_args()
+
+    async def run():
+        try:
+            return await run_command(args)
+        finally:
+            await engine.dispose()
+    print(json.dumps(asyncio.run(run()), indent=2, default=str, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+import asyncio
+
+from collections import defaultdict
+from typing import Dict, Optional
+
+import crud.qna
+
+from core.config import settings
+from core.log import get_logger
+
+logger = get_logger(__name__)
+
+
+class ViewCountBuffer:
+    """
+    FAQ/용어 캐시 히트 조회수를 메모리에 누적했다가 주기적으로 일괄 반영하는 클래스
+    - 응답 경로에서는 dict 증가만 수행 (DB 대기 없음)
+    - VIEW_COUNT_FLUSH_INTERVAL마다, 그리고 서버 종료 시 누적분을 반영
+    """
+    def __init__(self):
+        self._faq_deltas: Dict[str, int] = defaultdict(int)
+        self._term_deltas: Dict[str, int] = defaultdict(int)
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = asyncio.Event()
+        self._lock = asyncio.Lock() # 주기 반영과 종료 시 반영이 겹치지 않도록
+        # 모니터링용 카운터
+        self.flushed_views = 0
+        self.failed_flushes = 0
+
+    def incr_faq(self, question: str, delta: int = 1):
+        """ FAQ 질문 조회수 증가분 누적 """
+        self._faq_deltas[question] += delta
+
+    def incr_term(self, term: str, delta: int = 1):
+        """ 용어 조회수 증가분 누적 """
+        self._term_deltas[term] += delta
+
+    async def start(self):
+        """ 주기적 반영 태스크 시작 """
+        if self._task is None:
+            self._stopping.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self):
+        """ 반영 태스크 종료 후 남은 누적분 반영 """
+        if self._task is not None:
+            # 반영 도중 취소되어 증가분이 유실되지 않도록 신호로 종료
+            self._stopping.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    async def flush(self):
+        """ 누적된 증가분을 FAQ DB에 반영 """
+        async with self._lock:
+            # 반영 중 들어오는 증가분은 새 dict에 누적되도록 먼저 교체
+            faq_deltas, self._faq_deltas = self._faq_deltas, defaultdict(int)
+            term_deltas, self._term_deltas = self._term_deltas, defaultdict(int)
+
+            for deltas, bulk_update, pending in (
+                (faq_deltas, crud.qna.bulk_increment_faq_view_counts, self._faq_deltas),
+                (term_deltas, crud.qna.bulk_increment_term_view_counts, self._term_deltas),
+            ):
+                if not deltas:
+                    continue
+                try:
+                    await bulk_update(deltas)
+                    self.flushed_views += sum(deltas.values())
+                except Exception as e:
+                    # 실패한 증가분은 다음 주기에 다시 반영
+                    self.failed_flushes += 1
+                    logger.error("view_counter.flush_failed", error=str(e))
+                    for key, delta in deltas.items():
+                        pending[key] += delta
+
+    def stats(self) -> Dict[str, int]:
+        """ 반영 대기 중인 증가분 현황 """
+        return {
+            "pending_faq_views": sum(self._faq_deltas.values()),
+            "pending_faq_keys": len(self._faq_deltas),
+            "pending_term_views": sum(self._term_deltas.values()),
+            "pending_term_keys": len(self._term_deltas),
+            "flushed_views": self.flushed_views,
+            "failed_flushes": self.failed_flushes
+        }
+
+    async def _run(self):
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(
+                    self._stopping.wait(), settings.VIEW_COUNT_FLUSH_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                await self.flush()
+
+view_counter = ViewCountBuffer()
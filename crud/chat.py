@@ -1,11 +1,77 @@
 from sqlmodel import select
+from sqlalchemy import Row, bindparam, insert, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
 from uuid import UUID, uuid4
 
-from models import Chat, ChatbotResponse
+from core.metrics import db_commit_seconds
+from models import Chat, ChatbotResponse, ChatSession
 
 
+# 채팅 기록 조회 시 선택하는 컬럼 (ORM 객체 대신 행 튜플로 조회)
+HISTORY_COLUMNS = (Chat.id, Chat.persona_id, Chat.is_user, Chat.content, Chat.created_at)
+
+# 세션 생성 시각과 메세지 생성 시각의 허용 오차 (워커/노드 간 시계 차이)
+SESSION_CLOCK_SKEW = timedelta(minutes=10)
+
+
+class DuplicateChatId(ValueError):
+    """ 이미 저장된 채팅 ID (다른 달 파티션의 메세지 포함) """
+
+
+def session_window(session_id: UUID):
+    """
+    세션의 채팅 조회 조건 (session_id + 세션 생성 시각 이후)
+    Chat은 created_at 월별 파티션이므로 세션 생성 시각을 하한으로 주면
+    실행 시점 파티션 프루닝으로 세션 이전 달의 파티션은 조회하지 않음
+    """
+    session_started = (
+        select(ChatSession.created_at)
+        .where(ChatSession.session_id == session_id)
+        .scalar_subquery()
+    )
+    return (
+        Chat.session_id == session_id,
+        Chat.created_at >= session_started - SESSION_CLOCK_SKEW
+    )
+
+
+def prompt_created_at(prompt_chat_id, session_id):
+    """
+    프롬프트 메세지의 created_at 조회 서브쿼리 (ChatbotResponse -> Chat 프롬프트 외래키 값)
+    프롬프트는 같은 세션의 메세지이므로 세션 범위 조건으로 조회 파티션을 한정
+    """
+    return (
+        select(Chat.created_at)
+        .where(Chat.id == prompt_chat_id, *session_window(session_id))
+        .scalar_subquery()
+    )
+
+# 챗봇 응답 multi-row INSERT
+#   - 행마다 prompt_id(프롬프트 메세지 ID), session_id로 프롬프트 created_at을 조회
+#   - bindparam 이름은 INSERT 컬럼 이름과 겹칠 수 없으므로 prompt_chat_id 대신 prompt_id 사용
+_prompt_id = bindparam("prompt_id", type_=ChatbotResponse.__table__.c.prompt_chat_id.type)
+RESPONSE_INSERT = insert(ChatbotResponse).values(
+    prompt_chat_id=_prompt_id,
+    prompt_chat_created_at=prompt_created_at(
+        _prompt_id, bindparam("session_id", type_=Chat.__table__.c.session_id.type)
+    )
+)
+
+
+async def existing_chat_ids(db: AsyncSession, chat_ids: Iterable[UUID]) -> Set[UUID]:
+    """
+    주어진 ID 중 이미 저장된 채팅 ID를 조회합니다.
+    Chat.id는 월 파티션마다 UNIQUE 인덱스로만 보장되므로(PK는 (id, created_at))
+    다른 달 파티션과의 중복은 저장 전에 확인 (파티션마다 PK 인덱스 선두 컬럼 조회)
+    """
+    chat_ids = list(chat_ids)
+    if not chat_ids:
+        return set()
+    result = await db.execute(select(Chat.id).where(Chat.id.in_(chat_ids)))
+    return set(result.scalars().all())
+
 async def create_user_chat(
     db: AsyncSession,
     client_message_id: UUID,
@@ -15,16 +81,20 @@ async def create_user_chat(
 ) -> Chat:
     """
     사용자 채팅 메시지를 생성합니다.
+    클라이언트가 보낸 메세지 ID가 이미 저장되어 있으면 DuplicateChatId 발생
     """
+    if await existing_chat_ids(db, [client_message_id]):
+        raise DuplicateChatId(f"message_id {client_message_id} already exists")
     new_chat = Chat(
-        id=str(client_message_id),
-        session_id=str(session_id),
+        id=client_message_id,
+        session_id=session_id,
         persona_id=persona_id,
         is_user=True,
         content=content
     )
     db.add(new_chat)
-    await db.commit()
+    with db_commit_seconds.labels("create_user_chat").time():
+        await db.commit()
     await db.refresh(new_chat)
     
     return new_chat
@@ -34,7 +104,7 @@ async def create_chatbot_chat(
     session_id: UUID,
     persona_id: int,
     content: str,
-    prompt_chat_id: UUID,
+    prompt_chat_id: Optional[UUID],
     tool_name: Optional[str],
     tool_metadata: Optional[dict]
 ) -> Chat:
@@ -42,8 +112,8 @@ async def create_chatbot_chat(
     챗봇 응답을 Chat 테이블과 ChatbotResponse 테이블에 트랜잭션으로 저장합니다.
     """
     new_chat = Chat(
-        id=str(uuid4()),
-        session_id=str(session_id),
+        id=uuid4(),
+        session_id=session_id,
         persona_id=persona_id,
         is_user=False,
         content=content
@@ -52,23 +122,53 @@ async def create_chatbot_chat(
     await db.flush([new_chat])  # new_chat.id 값을 얻기 위해 flush 사용
 
     new_res_detail = ChatbotResponse(
-        chat_id=str(new_chat.id),
-        prompt_chat_id=str(prompt_chat_id),
+        chat_id=new_chat.id,
+        prompt_chat_id=prompt_chat_id,
+        created_at=new_chat.created_at, # 챗봇 메세지와 같은 월 파티션에 저장
         source_tool=tool_name,
         response_payload=tool_metadata
     )
+    # 프롬프트 외래키 값은 INSERT 시 DB에서 조회
+    new_res_detail.prompt_chat_created_at = prompt_created_at(prompt_chat_id, session_id)
     db.add(new_res_detail)
-    await db.commit()
+    with db_commit_seconds.labels("create_chatbot_chat").time():
+        await db.commit()
     
     return new_chat
 
+async def bulk_create_chats(
+    db: AsyncSession,
+    chat_rows: List[Dict[str, Any]],
+    response_rows: List[Dict[str, Any]]
+) -> Set[UUID]:
+    """
+    여러 Chat 행과 ChatbotResponse 행을 multi-row INSERT로 한 트랜잭션에 저장합니다.
+    (ChatbotResponse 행의 created_at은 챗봇 메세지(Chat) 행과 같은 값이어야 하며,
+     프롬프트 메세지 ID는 prompt_id, 세션 ID는 session_id 키로 전달 (RESPONSE_INSERT))
+    이미 저장된 ID의 사용자 메세지는 저장하지 않고(해당 메세지를 프롬프트로 참조하는 응답은 프롬프트 없이 저장)
+    제외한 ID를 반환합니다.
+    """
+    duplicates = await existing_chat_ids(db, [row["id"] for row in chat_rows if row["is_user"]])
+    if duplicates:
+        chat_rows = [row for row in chat_rows if row["id"] not in duplicates]
+        response_rows = [
+            dict(row, prompt_id=None) if row["prompt_id"] in duplicates else row for row in response_rows
+        ]
+    if chat_rows:
+        await db.execute(insert(Chat), chat_rows)
+    if response_rows:
+        await db.execute(RESPONSE_INSERT, response_rows)
+    with db_commit_seconds.labels("bulk_create_chats").time():
+        await db.commit()
+    return duplicates
+
 async def get_chat_by_id(db: AsyncSession, chat_id: UUID) -> Optional[Chat]:
     """
     주어진 ID에 해당하는 채팅을 조회합니다.
     """
     statement = (
         select(Chat)
-        .where(Chat.id == str(chat_id))
+        .where(Chat.id == chat_id)
     )
     result = await db.execute(statement)
     
@@ -80,40 +180,95 @@ async def fetch_chats_by_session_id(db: AsyncSession, session_id: UUID) -> List[
     """
     statement = (
         select(Chat)
-        .where(Chat.session_id == str(session_id))
+        .where(*session_window(session_id))
         .order_by(Chat.created_at)
     )
     result = await db.execute(statement)
     
     return result.scalars().all()
 
+async def fetch_chat_page(
+    db: AsyncSession,
+    session_id: UUID,
+    limit: Optional[int] = None,
+    cursor: Optional[Tuple[datetime, UUID]] = None,
+    descending: bool = False
+) -> List[Row]:
+    """
+    특정 세션의 채팅 메시지를 (created_at, id) 키셋 기준으로 한 페이지 조회합니다.
+    Args:
+        limit (Optional[int]): 최대 행 수 (None이면 전체)
+        cursor (Optional[Tuple[datetime, UUID]]): 이전 페이지 마지막 행의 (created_at, id), 이 행 다음부터 조회
+        descending (bool): True면 최신 메시지부터 조회
+    Returns:
+        List[Row]: HISTORY_COLUMNS 순서의 행 튜플 목록
+    """
+    order_key = tuple_(Chat.created_at, Chat.id)
+    statement = select(*HISTORY_COLUMNS).where(*session_window(session_id))
+    if cursor is not None:
+        # idx_session_created(session_id, created_at) 범위 조회 + id로 동일 시각 행 구분
+        # (커서 값은 컬럼 타입으로 바인드, ID는 전환 전 CHAR(36) 컬럼에서도 비교되도록 ChatKey 사용)
+        cursor_key = tuple_(*cursor, types=(Chat.created_at.type, Chat.id.type))
+        statement = statement.where(order_key < cursor_key if descending else order_key > cursor_key)
+    if descending:
+        statement = statement.order_by(Chat.created_at.desc(), Chat.id.desc())
+    else:
+        statement = statement.order_by(Chat.created_at, Chat.id)
+    if limit is not None:
+        statement = statement.limit(limit)
+    result = await db.execute(statement)
+
+    return result.all()
+
+async def stream_chats_by_session_id(
+    db: AsyncSession, session_id: UUID, batch_size: int = 500
+) -> AsyncIterator[List[Row]]:
+    """
+    특정 세션의 전체 채팅 메시지를 서버 측 커서로 batch_size 행씩 나누어 반환합니다.
+    (세션 전체를 메모리에 올리지 않음)
+    """
+    statement = (
+        select(*HISTORY_COLUMNS)
+        .where(*session_window(session_id))
+        .order_by(Chat.created_at, Chat.id)
+        .execution_options(yield_per=batch_size)
+    )
+    result = await db.stream(statement)
+    async for partition in result.partitions():
+        yield partition
+
 async def update_chat_feedback(
     db: AsyncSession, prompt_chat_id: UUID, is_helpful: bool
-) -> Optional[ChatbotResponse]:
+) -> Optional[Row]:
     """
     Args:
         db (AsyncSession): 데이터베이스 세션
         prompt_chat_id (UUID): 피드백 대상 챗봇 응답을 유발한 사용자의 메세지 ID
         is_helpful (bool): 유용함 여부 (True: 유용함, False: 유용하지 않음)
     Returns:
-        Optional[ChatbotResponse]: 업데이트된 ChatbotResponse 객체 또는 None
+        Optional[Row]: 업데이트된 챗봇 응답의 (chat_id, is_helpful) 또는 None
     """
-
+    # ORM 객체 대신 chat_id로 UPDATE
+    #   (PK가 (chat_id, created_at)이므로 ORM flush는 created_at이 비어 있는 파티션 전환 전 기존 행을 찾지 못함)
+    target = (
+        select(ChatbotResponse.chat_id)
+        .where(ChatbotResponse.prompt_chat_id == prompt_chat_id)
+        .limit(1)
+        .scalar_subquery()
+    )
     statement = (
-        select(ChatbotResponse)
-        .where(
-            ChatbotResponse.prompt_chat_id == str(prompt_chat_id)
-        )
+        update(ChatbotResponse)
+        .where(ChatbotResponse.chat_id == target)
+        .values(is_helpful=is_helpful)
+        .returning(ChatbotResponse.chat_id, ChatbotResponse.is_helpful)
     )
     result = await db.execute(statement)
-    res_to_update = result.scalars().first()
+    updated = result.first()
 
-    if not res_to_update:
+    if updated is None:
         return None  # ChatbotResponse가 없는 경우
 
-    res_to_update.is_helpful = is_helpful
-    db.add(res_to_update)
-    await db.commit()
-    await db.refresh(res_to_update)
+    with db_commit_seconds.labels("update_chat_feedback").time():
+        await db.commit()
 
-    return res_to_update
\ No newline at end of file
+    return updated
\ No newline at end of file
@@ -1,15 +1,18 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel.ext.asyncio.session import AsyncSession as SQLModelAsyncSession
 from sqlalchemy import text
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from core.config import settings
+from core.db import create_pooled_engine
 
-qna_async_engine = create_async_engine(settings.FAQ_DATABASE_URL)
+qna_async_engine = create_pooled_engine(
+    "faq", settings.FAQ_DATABASE_URL, settings.FAQ_DB_POOL_SIZE, settings.FAQ_DB_MAX_OVERFLOW
+)
 
-async def get_faqs_with_high_views(top_k: int=3) -> List[Dict]:
+async def get_faqs_with_high_views(top_k: Optional[int]=3) -> List[Dict]:
     """
-    조회수가 높은 FAQ 항목들을 상위 K개 조회합니다.
+    조회수가 높은 FAQ 항목들을 상위 K개 조회합니다. (None이면 전체를 조회수 순으로 조회)
     """
 
     query = """
@@ -27,9 +30,9 @@ async def get_faqs_with_high_views(top_k: int=3) -> List[Dict]:
     
     return result.mappings().all()
 
-async def get_terms_with_high_views(top_k: int=6) -> List[Dict]:
+async def get_terms_with_high_views(top_k: Optional[int]=6) -> List[Dict]:
     """
-    조회수가 높은 용어 질문 항목들을 상위 K개 조회합니다.
+    조회수가 높은 용어 질문 항목들을 상위 K개 조회합니다. (None이면 전체 조회)
     """
 
     # query = """
@@ -86,4 +89,44 @@ async def increment_term_view_count(term: str) -> None:
             text(query),
             {"term": term}
         )
-        await db.commit() 
\ No newline at end of file
+        await db.commit()
+
+async def _bulk_increment_view_counts(
+    table: str, key_column: str, deltas: Dict[str, int]
+) -> None:
+    """
+    여러 항목의 조회수 증가분을 UPDATE ... FROM (VALUES ...) 한 번으로 반영합니다.
+    """
+    if not deltas:
+        return
+
+    # 여러 워커가 동시에 반영해도 행 잠금 순서가 같도록 키 정렬
+    values = []
+    params = {}
+    for i, (key, delta) in enumerate(sorted(deltas.items())):
+        values.append(f"(CAST(:k{i} AS TEXT), CAST(:d{i} AS INTEGER))")
+        params[f"k{i}"] = key
+        params[f"d{i}"] = delta
+
+    query = f"""
+    UPDATE {table} AS t
+    SET views = t.views + v.delta
+    FROM (VALUES {", ".join(values)}) AS v(key, delta)
+    WHERE t.{key_column} = v.key;
+    """
+
+    async with SQLModelAsyncSession(qna_async_engine) as db:
+        await db.execute(text(query), params)
+        await db.commit()
+
+async def bulk_increment_faq_view_counts(deltas: Dict[str, int]) -> None:
+    """
+    FAQ 질문별 조회수 증가분을 한 번에 반영합니다.
+    """
+    await _bulk_increment_view_counts("faqs", "question", deltas)
+
+async def bulk_increment_term_view_counts(deltas: Dict[str, int]) -> None:
+    """
+    용어별 조회수 증가분을 한 번에 반영합니다.
+    """
+    await _bulk_increment_view_counts("terms", "term", deltas)
@@ -15,7 +15,7 @@ async def create_chat_session(
     새로운 채팅 세션을 생성합니다.
     """
     new_session = ChatSession(
-        session_id=str(session_id),
+        session_id=session_id,
         persona_id=persona_id
     )
     db.add(new_session)
@@ -33,7 +33,7 @@ async def get_chat_session_by_id(
     """
     statement = (
         select(ChatSession).
-        where(ChatSession.session_id == str(session_id))
+        where(ChatSession.session_id == session_id)
     )
     result = await db.execute(statement)
     
@@ -1,11 +1,12 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from core.serialization import FastJSONResponse
 from core.setup import lifespan
 from api.router import api_router
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
 app.include_router(api_router, prefix='/api')
 
 # CORS 설정
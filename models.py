@@ -1,11 +1,11 @@
 from sqlmodel import SQLModel, Field, Relationship
 from sqlalchemy import (
-    Column, ForeignKey, Index,
+    Column, ForeignKey, ForeignKeyConstraint, Index,
     TEXT, JSON, TIMESTAMP, 
     String, Integer
 )
 from sqlalchemy.sql import func
-from sqlalchemy.dialects.postgresql import CHAR
+from sqlalchemy.types import TypeDecorator, UserDefinedType
 
 from typing import List, Optional
 from datetime import datetime, timezone
@@ -14,13 +14,43 @@ from uuid import UUID, uuid4
 from schemas.persona import PersonaBase
 
 
-def get_timestamp_column():
-    """타임스탬프 컬럼 생성 헬퍼 함수"""
+def get_timestamp_column(primary_key: bool = False):
+    """타임스탬프 컬럼 생성 헬퍼 함수 (파티션 키로 쓰는 경우 primary_key=True)"""
     return Column(
         TIMESTAMP(timezone=True),  # DB에 저장되는 실제 컬럼 타입
         server_default=func.now(), # DB 서버에 실제로 저장될 때의 기본값
-        nullable=False
-    )
+        nullable=False,
+        primary_key=primary_key
+    )
+
+class _UUIDColumn(UserDefinedType):
+    """ DDL만 uuid로 생성하는 컬럼 타입 (바인드 파라미터에 타입 캐스트를 붙이지 않음) """
+    cache_ok = True
+
+    def get_col_spec(self, **kw):
+        return "UUID"
+
+class ChatKey(TypeDecorator):
+    """
+    채팅 테이블 ID 컬럼 타입 (uuid 전환 전 CHAR(36) 컬럼과 전환 후 uuid 컬럼 모두에서 동작)
+    - 새로 생성하는 테이블은 uuid 컬럼
+    - 값은 캐스트 없는 문자열로 바인드하므로 DB가 실제 컬럼 타입(bpchar/uuid)으로 파라미터 타입을 추론
+    - 조회 값은 UUID로 변환 (UUID 형식이 아닌 기존 CHAR(36) 값은 문자열 그대로)
+    - core.uuid_migration 전환(swap/cleanup)이 모든 DB에서 끝난 뒤의 배포에서 PG_UUID(as_uuid=True)로 교체
+    """
+    impl = _UUIDColumn
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        return None if value is None else str(value)
+
+    def process_result_value(self, value, dialect):
+        if value is None or isinstance(value, UUID):
+            return value
+        try:
+            return UUID(value)
+        except ValueError:
+            return value
 
 class Persona(PersonaBase, table=True):
     __tablename__ = "Persona" # DB에 저장되는 테이블 이름
@@ -48,10 +78,15 @@ class Persona(PersonaBase, table=True):
 class ChatSession(SQLModel, table=True):
     __tablename__ = "ChatSession"
 
+    # 메세지 없는 오래된 세션 정리 시 생성 시각 순 조회
+    __table_args__ = (
+        Index("idx_chat_session_created", "created_at"),
+    )
+
     # Primary Key
     session_id: UUID = Field(
         default_factory=uuid4,
-        sa_column=Column(CHAR(36), primary_key=True) # UUID를 CHAR(36)로 저장
+        sa_column=Column(ChatKey(), primary_key=True) # uuid (전환 전 DB는 CHAR(36))
     )
     
     # Foreign Key - Persona.id (페르소나 삭제 시 NULL로 변경)
@@ -78,19 +113,22 @@ class Chat(SQLModel, table=True):
     __tablename__ = "Chat"
     
     # 인덱스 설정하여 성능 최적화
+    #   - created_at 기준 월별 RANGE 파티션 (파티션 생성/보관은 core/partitions.py)
+    #   - 파티션 테이블의 PK/UNIQUE 제약에는 파티션 키가 포함되어야 하므로 PK는 (id, created_at)
     __table_args__ = (
         Index("idx_session_created", "session_id", "created_at"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     # Primary Key
     id: UUID = Field(
-        sa_column=Column(CHAR(36), primary_key=True)
+        sa_column=Column(ChatKey(), primary_key=True)
     )
     
     # Foreign Key - ChatSession.session_id
     session_id: UUID = Field(
         sa_column=Column(
-            CHAR(36),
+            ChatKey(),
             ForeignKey("ChatSession.session_id", ondelete="CASCADE"), 
             nullable=False
         )
@@ -108,42 +146,73 @@ class Chat(SQLModel, table=True):
     # 실제 채팅 내용
     content: str = Field(sa_column=Column(TEXT, nullable=False))
     
-    # 채팅 생성 시점 타임스탬프 컬럼
+    # 채팅 생성 시점 타임스탬프 컬럼 (파티션 키)
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc), 
-        sa_column=get_timestamp_column()
+        sa_column=get_timestamp_column(primary_key=True)
     )
 
     # --- Relationships ---
     session: ChatSession = Relationship(back_populates="chats")
     persona: Optional[Persona] = Relationship(back_populates="chats")
+    # ChatbotResponse가 Chat을 두 경로(챗봇 메세지, 프롬프트 메세지)로 참조하므로 조인 조건을 직접 지정
     response_detail: Optional["ChatbotResponse"] = Relationship(
         back_populates="chat",
         sa_relationship_kwargs={
             "cascade": "all, delete-orphan",
-            "foreign_keys": "ChatbotResponse.chat_id"
+            "primaryjoin": "and_(Chat.id == foreign(ChatbotResponse.chat_id), "
+                           "Chat.created_at == foreign(ChatbotResponse.created_at))"
         }
     )
     prompted_responses: List["ChatbotResponse"] = Relationship(
         back_populates="prompt_chat",
-        sa_relationship_kwargs={"foreign_keys": "ChatbotResponse.prompt_chat_id"}
+        sa_relationship_kwargs={
+            "primaryjoin": "and_(Chat.id == foreign(ChatbotResponse.prompt_chat_id), "
+                           "Chat.created_at == foreign(ChatbotResponse.prompt_chat_created_at))"
+        }
     )
 
 class ChatbotResponse(SQLModel, table=True):
     __tablename__ = "ChatbotResponse"
 
-    # Foreign Key - Chat.id (is_user가 False인 챗봇 응답 메시지 ID)
+    # Chat과 같은 월별 RANGE 파티션 (같은 달의 Chat 파티션과 함께 보관/삭제)
+    #   - 파티션 테이블(Chat)을 참조하는 외래키는 PK (id, created_at) 전체를 참조해야 하므로
+    #     챗봇 메세지/프롬프트 메세지의 created_at을 함께 저장
+    #   - 프롬프트 외래키는 MATCH FULL (ID만 있고 created_at이 NULL인 행은 허용하지 않음)
+    __table_args__ = (
+        Index("idx_response_prompt_chat", "prompt_chat_id"), # 피드백 대상 조회, 프롬프트 삭제 시 참조 행 조회
+        ForeignKeyConstraint(
+            ["chat_id", "created_at"], ["Chat.id", "Chat.created_at"],
+            name="fk_response_chat", ondelete="CASCADE"
+        ),
+        ForeignKeyConstraint(
+            ["prompt_chat_id", "prompt_chat_created_at"], ["Chat.id", "Chat.created_at"],
+            name="fk_response_prompt_chat", ondelete="SET NULL", match="FULL"
+        ),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    # Chat.id (is_user가 False인 챗봇 응답 메시지 ID)
     chat_id: UUID = Field(
-        sa_column=Column(
-            CHAR(36), ForeignKey("Chat.id", ondelete="CASCADE"), 
-            primary_key=True
-        )
+        sa_column=Column(ChatKey(), primary_key=True)
     )
     
-    # Foreign Key - Chat.id (챗봇 응답을 유발한 사용자의 프롬프트 메시지 ID)
+    # Chat.id (챗봇 응답을 유발한 사용자의 프롬프트 메시지 ID)
     prompt_chat_id: Optional[UUID] = Field(
         default=None,
-        sa_column=Column(CHAR(36), ForeignKey("Chat.id", ondelete="SET NULL"))
+        sa_column=Column(ChatKey())
+    )
+
+    # 프롬프트 메세지(Chat)의 created_at (프롬프트 외래키)
+    prompt_chat_created_at: Optional[datetime] = Field(
+        default=None,
+        sa_column=Column(TIMESTAMP(timezone=True))
+    )
+
+    # 챗봇 응답 메세지(Chat)의 created_at (파티션 키, 챗봇 메세지 외래키)
+    created_at: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_column=get_timestamp_column(primary_key=True)
     )
 
     # True: 유용함, False: 유용하지 않음, None: 미평가 (기본값)
@@ -165,10 +234,16 @@ class ChatbotResponse(SQLModel, table=True):
     # --- Relationships ---
     chat: Chat = Relationship(
         back_populates="response_detail",
-        sa_relationship_kwargs={"foreign_keys": "ChatbotResponse.chat_id"}
+        sa_relationship_kwargs={
+            "primaryjoin": "and_(Chat.id == foreign(ChatbotResponse.chat_id), "
+                           "Chat.created_at == foreign(ChatbotResponse.created_at))"
+        }
     )
     
     prompt_chat: Optional[Chat] = Relationship(
         back_populates="prompted_responses",
-        sa_relationship_kwargs={"foreign_keys": "ChatbotResponse.prompt_chat_id"}
+        sa_relationship_kwargs={
+            "primaryjoin": "and_(Chat.id == foreign(ChatbotResponse.prompt_chat_id), "
+                           "Chat.created_at == foreign(ChatbotResponse.prompt_chat_created_at))"
+        }
     )
\ No newline at end of file
@@ -0,0 +1,30 @@
+from sqlmodel import SQLModel
+from pydantic import TypeAdapter, field_validator
+
+from typing import Any, Dict, List, Optional
+
+
+# LLM 서버 MCP 라우터 디스패치 응답
+class ToolResponseContent(SQLModel):
+    answer: str
+    login_required: Optional[bool] = None
+    relatedQuestions: Optional[List[Any]] = None # LLM 서버 필드명 그대로 사용
+    card_list: Optional[List[Dict[str, Any]]] = None
+
+class ToolResponse(SQLModel):
+    tool_name: Optional[str] = None
+    tool_response_content: ToolResponseContent
+
+class DispatchResponse(SQLModel):
+    answer: Optional[str] = None # 챗봇 표준 응답
+    tool_response: Optional[ToolResponse] = None # 툴이 호출된 응답
+
+    @field_validator("tool_response", mode="before")
+    @classmethod
+    def empty_tool_response(cls, value: Any) -> Any:
+        # 빈 tool_response({})는 툴이 호출되지 않은 표준 응답으로 처리
+        return value or None
+
+
+# 모듈 로딩 시 한 번만 검증기 생성 (응답 본문 bytes를 바로 검증)
+dispatch_response_adapter = TypeAdapter(DispatchResponse)
@@ -0,0 +1,48 @@
+from sqlmodel import SQLModel
+from pydantic import TypeAdapter
+from typing_extensions import NotRequired, TypedDict
+
+from typing import Any, Dict, List, Literal, Union
+from uuid import UUID
+
+
+# --- 클라이언트 -> 서버 ---
+class ClientMessage(SQLModel):
+    message_id: UUID # Chat.id (uuid)로 저장
+    message: str
+    stream: bool = False # LLM 스트리밍 응답(delta 프레임) 요청 여부
+
+
+# --- 서버 -> 클라이언트 ---
+# 전송 프레임 형식 (ConnectionState.send 타입 표기용, 전송 시 런타임 검증은 하지 않음)
+# 연결 직후 세션 ID 전달
+class SessionFrame(TypedDict):
+    session_id: str
+
+# 챗봇 응답 (툴 응답인 경우 tool_name, card_list 등 포함)
+class BotFrame(TypedDict):
+    sender: Literal["bot"]
+    timestamp: str
+    message_id: str
+    login_required: bool
+    message: str
+    type: NotRequired[Literal["final"]] # 스트리밍 요청 시 최종 프레임 표시
+    tool_name: NotRequired[str]
+    card_list: NotRequired[List[Dict[str, Any]]]
+    related_questions: NotRequired[List[Any]]
+    busy: NotRequired[bool] # LLM 서버 동시 호출 한도 초과
+
+# 스트리밍 응답 텍스트 조각
+class DeltaFrame(TypedDict):
+    type: Literal["delta"]
+    message_id: str
+    delta: str
+
+class ErrorFrame(TypedDict):
+    error: str
+
+ServerFrame = Union[BotFrame, DeltaFrame, SessionFrame, ErrorFrame]
+
+
+# 모듈 로딩 시 한 번만 검증기 생성 (메세지마다 스키마를 다시 만들지 않음)
+client_message_adapter = TypeAdapter(ClientMessage)
@@ -2,6 +2,8 @@ import pytest
 import json
 import os
 
+from types import SimpleNamespace
+
 from fastapi.testclient import TestClient
 
 from main import app
@@ -39,4 +41,32 @@ def dummy_chat_history():
 
     with open(json_path, "r", encoding="utf-8") as f:
         data = json.load(f)
-    return data
\ No newline at end of file
+    return data
+
+class CapturingSession:
+    """ 실행된 SQL 문/파라미터와 커밋 수를 기록하고 rows를 결과로 반환하는 가짜 DB 세션 """
+    def __init__(self):
+        self.statements = []
+        self.params = []
+        self.rows = []
+        self.commits = 0
+
+    async def execute(self, statement, params=None):
+        self.statements.append(statement)
+        self.params.append(params)
+        rows = list(self.rows)
+        return SimpleNamespace(
+            all=lambda: rows,
+            first=lambda: rows[0] if rows else None,
+            scalars=lambda: SimpleNamespace(all=lambda: rows)
+        )
+
+    async def commit(self):
+        self.commits += 1
+
+@pytest.fixture
+def capturing_session():
+    """
+    crud 함수가 만든 SQL 문을 DB 없이 검증하기 위한 가짜 DB 세션을 반환합니다.
+    """
+    return CapturingSession()
@@ -0,0 +1,102 @@
+import asyncio
+import pytest
+
+from core.admission import AdmissionController, AdmissionRejected
+
+
+# --- 1. 동시 호출 제한 테스트 ---
+def test_concurrency_is_limited_to_max_concurrency():
+    """
+    동시에 여러 호출이 들어와도
+    1. 실행 중인 호출 수가 max_concurrency를 넘지 않는지
+    2. 대기한 호출도 모두 실행되는지 검증
+    """
+    controller = AdmissionController("test", max_concurrency=2, max_queue=10, max_wait=1.0)
+    running = 0
+    peak = 0
+
+    async def call():
+        nonlocal running, peak
+        async with controller.slot():
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+    async def scenario():
+        await asyncio.gather(*[call() for _ in range(6)])
+
+    asyncio.run(scenario())
+
+    stats = controller.stats()
+    assert peak == 2
+    assert stats["admitted"] == 6
+    assert stats["active"] == 0
+    assert stats["queue_depth"] == 0
+    assert stats["rejected_queue_full"] == stats["rejected_timeout"] == 0
+
+
+# --- 2. 부하 차단 테스트 ---
+def test_rejects_immediately_when_queue_is_full():
+    """
+    슬롯과 대기열이 모두 찬 상태에서 들어온 호출은 기다리지 않고 바로 거절되는지 검증
+    """
+    controller = AdmissionController("test", max_concurrency=1, max_queue=1, max_wait=5.0)
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def holder():
+            async with controller.slot():
+                await release.wait()
+
+        tasks = [asyncio.create_task(holder()) for _ in range(2)] # 실행 1 + 대기 1
+        await asyncio.sleep(0)
+        assert controller.stats()["queue_depth"] == 1
+
+        with pytest.raises(AdmissionRejected):
+            async with controller.slot():
+                pass
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
+
+    stats = controller.stats()
+    assert stats["rejected_queue_full"] == 1
+    assert stats["admitted"] == 2
+
+def test_rejects_after_max_wait_and_releases_slot():
+    """
+    최대 대기 시간 안에 슬롯을 얻지 못하면 거절되고,
+    거절된 호출이 슬롯을 점유하지 않아 이후 호출은 정상 실행되는지 검증
+    """
+    controller = AdmissionController("test", max_concurrency=1, max_queue=5, max_wait=0.01)
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def holder():
+            async with controller.slot():
+                await release.wait()
+
+        task = asyncio.create_task(holder())
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionRejected):
+            async with controller.slot():
+                pass
+
+        release.set()
+        await task
+        async with controller.slot():
+            pass
+
+    asyncio.run(scenario())
+
+    stats = controller.stats()
+    assert stats["rejected_timeout"] == 1
+    assert stats["admitted"] == 2
+    assert stats["queue_depth"] == 0
+    assert stats["active"] == 0
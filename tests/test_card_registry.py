@@ -0,0 +1,81 @@
+import asyncio
+import json
+
+import pytest
+
+from core import serialization
+from core.card_registry import CardRegistry, card_key
+from api.routes.ws import ConnectionState
+
+
+class RecordingWebSocket:
+    """ 전송된 프레임을 종류별로 기록하는 테스트용 웹소켓 """
+    def __init__(self):
+        self.frames = []
+
+    async def send_text(self, message):
+        self.frames.append(("text", message))
+
+    async def send_bytes(self, data):
+        self.frames.append(("bytes", data))
+
+
+CARDS = [{"card_id": i, "card_name": f"카드 {i}", "benefits": ["주유 5%"] * 20} for i in range(4)]
+
+
+# --- 1. 카드 참조 변환 테스트 ---
+def test_registry_sends_body_once_then_references():
+    """
+    1. 처음 전송하는 카드는 본문+card_key, 이미 보낸 카드는 card_ref만 전송하는지
+    2. 카드 키가 연결과 무관하게 내용 기준으로 고정되는지
+    3. max_entries를 넘어 제거된 카드는 다시 본문으로 전송하는지 검증
+    """
+    registry = CardRegistry(max_entries=3)
+
+    first = registry.encode(CARDS[:2])
+    second = registry.encode(CARDS[1:3])
+
+    assert first == [{**card, "card_key": card_key(card)} for card in CARDS[:2]]
+    assert second[0] == {"card_ref": card_key(CARDS[1])}
+    assert second[1]["card_key"] == card_key(CARDS[2])
+    assert CardRegistry().encode(CARDS[:1]) == first[:1]
+
+    # CARDS[3] 추가로 가장 오래 쓰이지 않은 CARDS[0]이 제거됨
+    registry.encode(CARDS[3:])
+    assert len(registry) == 3
+    assert "card_key" in registry.encode(CARDS[:1])[0]
+
+# --- 2. 연결별 전송 옵션 테스트 ---
+@pytest.mark.parametrize("binary", [False, True])
+def test_connection_send_applies_card_refs_and_compression(binary):
+    """
+    1. 카드 참조를 사용하는 연결은 두 번째 프레임부터 card_ref로 전송하는지
+    2. 압축 임계값 이상 프레임은 deflate 압축되고(JSON: 바이너리 프레임, msgpack: ExtType) 해제 시 원본과 같은지
+    3. 임계값 미만 프레임은 압축하지 않는지 검증
+    """
+    if binary and not serialization.MSGPACK_AVAILABLE:
+        pytest.skip("msgpack 미설치")
+    websocket = RecordingWebSocket()
+    state = ConnectionState(websocket, binary=binary, cards=CardRegistry(), compress_threshold=512)
+    frame = {"sender": "bot", "message": "추천 카드", "card_list": CARDS}
+
+    async def scenario():
+        await state.send(frame)
+        await state.send(frame)
+    asyncio.run(scenario())
+
+    def decode(kind, data):
+        """ (압축 여부, 프레임) """
+        if not binary:
+            return (True, json.loads(serialization.inflate(data))) if kind == "bytes" else (False, json.loads(data))
+        message = serialization.msgpack.unpackb(data)
+        if isinstance(message, serialization.msgpack.ExtType):
+            assert message.code == serialization.MSGPACK_DEFLATE_EXT_TYPE
+            return True, serialization.unpack(serialization.inflate(message.data))
+        return False, message
+
+    (first_compressed, first), (second_compressed, second) = (decode(*sent) for sent in websocket.frames)
+    assert first["card_list"] == CardRegistry().encode(CARDS)
+    assert second["card_list"] == [{"card_ref": card_key(card)} for card in CARDS]
+    # 카드 본문 전체를 보낸 첫 프레임만 임계값을 넘어 압축됨
+    assert (first_compressed, second_compressed) == (True, False)
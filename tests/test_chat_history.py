@@ -0,0 +1,81 @@
+import asyncio
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+
+import crud.chat
+import crud.session
+
+from api.routes import chat as chat_routes
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect()))
+
+
+def _rows(n: int):
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return [
+        SimpleNamespace(
+            id=uuid4(), persona_id=1, is_user=i % 2 == 0,
+            content=f"message {i}", created_at=start + timedelta(seconds=i)
+        )
+        for i in range(n)
+    ]
+
+
+# --- 1. 키셋 조회 쿼리 테스트 ---
+def test_fetch_chat_page_builds_keyset_query_on_columns(capturing_session):
+    """
+    1. ORM 엔티티 대신 필요한 컬럼만 선택하는지
+    2. 커서가 있으면 (created_at, id) 행 비교 조건과 정렬 방향이 일치하는지 검증
+    """
+    db = capturing_session
+    cursor = (datetime(2025, 1, 1, tzinfo=timezone.utc), uuid4())
+
+    asyncio.run(crud.chat.fetch_chat_page(db, uuid4(), limit=21, cursor=cursor))
+    asyncio.run(crud.chat.fetch_chat_page(db, uuid4(), limit=21, cursor=cursor, descending=True))
+    forward, backward = (_sql(statement) for statement in db.statements)
+
+    assert 'SELECT "Chat".id, "Chat".persona_id, "Chat".is_user, "Chat".content, "Chat".created_at' in forward
+    assert '("Chat".created_at, "Chat".id) > (' in forward
+    assert 'ORDER BY "Chat".created_at, "Chat".id' in forward
+    assert "LIMIT" in forward
+    assert '("Chat".created_at, "Chat".id) < (' in backward
+    assert 'ORDER BY "Chat".created_at DESC, "Chat".id DESC' in backward
+
+# --- 2. 페이지 이어 받기 테스트 ---
+def test_history_pages_follow_next_cursor(monkeypatch):
+    """
+    next_cursor를 다음 요청에 넘기면 이전 페이지 다음 행부터 이어서 조회되고,
+    마지막 페이지에서는 next_cursor가 None인지 검증
+    """
+    rows = _rows(5)
+
+    async def get_chat_session_by_id(db, session_id):
+        return object()
+
+    async def fetch_chat_page(db, session_id, limit=None, cursor=None, descending=False):
+        remaining = [row for row in rows if cursor is None or (row.created_at, row.id) > cursor]
+        return remaining[:limit]
+
+    monkeypatch.setattr(crud.session, "get_chat_session_by_id", get_chat_session_by_id)
+    monkeypatch.setattr(crud.chat, "fetch_chat_page", fetch_chat_page)
+
+    async def read_all():
+        pages, cursor = [], None
+        while True:
+            page = await chat_routes.get_chat_history(uuid4(), None, limit=2, cursor=cursor, direction="asc")
+            pages.append(page)
+            if page["next_cursor"] is None:
+                return pages
+            cursor = page["next_cursor"]
+
+    pages = asyncio.run(read_all())
+
+    assert [len(page["history"]) for page in pages] == [2, 2, 1]
+    assert [item["content"] for page in pages for item in page["history"]] == [row.content for row in rows]
+    assert pages[0]["history"][0]["created_at"] == rows[0].created_at.isoformat()
@@ -0,0 +1,92 @@
+import asyncio
+
+from contextlib import asynccontextmanager
+from uuid import uuid4
+
+import pytest
+
+import crud.chat
+
+from core import chat_writer as chat_writer_module
+from core.chat_writer import ChatWriteBehind, as_uuid
+from core.config import settings
+
+
+@pytest.fixture
+def writer(monkeypatch):
+    """ 배치 3행, 대기 10ms로 설정한 write-behind 저장기와 배치 INSERT 호출 기록 """
+    monkeypatch.setattr(settings, "CHAT_WRITE_BEHIND", True)
+    monkeypatch.setattr(settings, "CHAT_WRITE_BATCH_SIZE", 3)
+    monkeypatch.setattr(settings, "CHAT_WRITE_FLUSH_INTERVAL", 0.01)
+    monkeypatch.setattr(settings, "CHAT_WRITE_QUEUE_SIZE", 100)
+    calls = []
+    failing = set()
+
+    @asynccontextmanager
+    async def fake_db():
+        yield None
+
+    async def bulk_create_chats(db, chat_rows, response_rows):
+        if len(chat_rows) > 1 and failing & {row["content"] for row in chat_rows}:
+            raise RuntimeError("batch insert failed")
+        if failing & {row["content"] for row in chat_rows}:
+            raise RuntimeError("row insert failed")
+        calls.append(([row["content"] for row in chat_rows], response_rows))
+
+    monkeypatch.setattr(chat_writer_module, "get_async_context_db", fake_db)
+    monkeypatch.setattr(crud.chat, "bulk_create_chats", bulk_create_chats)
+    return ChatWriteBehind(), calls, failing
+
+
+# --- 1. 배치 저장 테스트 ---
+def test_messages_are_batched_and_drained_on_close(writer):
+    """
+    1. 큐에 쌓인 메세지가 CHAT_WRITE_BATCH_SIZE 단위로 저장되는지
+    2. close() 시 큐에 남은 메세지를 모두 저장한 뒤 종료하는지
+    3. 챗봇 응답 행에 프롬프트 ID(prompt_id)와 세션 ID가 담기고, 프롬프트 ID가 없으면 None으로 저장되는지 검증
+    """
+    chat_writer, calls, _ = writer
+    session_id = uuid4()
+    prompt_id = uuid4()
+
+    async def scenario():
+        await chat_writer.start()
+        for i in range(5):
+            await chat_writer.save_user_chat(uuid4(), session_id, None, f"user-{i}")
+        await chat_writer.save_chatbot_chat(session_id, None, "bot-0", str(prompt_id), None, {})
+        await chat_writer.save_chatbot_chat(session_id, None, "bot-1", None, "card_recommend", {})
+        await chat_writer.close()
+
+    asyncio.run(scenario())
+
+    assert [contents for contents, _ in calls] == [
+        ["user-0", "user-1", "user-2"], ["user-3", "user-4", "bot-0"], ["bot-1"]
+    ]
+    responses = [row for _, rows in calls for row in rows]
+    assert [(row["prompt_id"], row["session_id"]) for row in responses] == [
+        (prompt_id, session_id), (None, session_id)
+    ]
+    assert chat_writer.stats() == {
+        "enabled": False, "pending": 0, "enqueued": 7, "written": 7, "failed": 0, "batches": 3
+    }
+    assert as_uuid(None) is None
+
+# --- 2. 배치 실패 재시도 테스트 ---
+def test_failed_batch_falls_back_to_per_row_inserts(writer):
+    """
+    배치 INSERT가 실패하면 메세지 단위로 다시 저장하여 실패한 행만 제외되는지 검증
+    """
+    chat_writer, calls, failing = writer
+    failing.add("user-1")
+    session_id = uuid4()
+
+    async def scenario():
+        await chat_writer.start()
+        for i in range(3):
+            await chat_writer.save_user_chat(uuid4(), session_id, None, f"user-{i}")
+        await chat_writer.close()
+
+    asyncio.run(scenario())
+
+    assert [contents for contents, _ in calls] == [["user-0"], ["user-2"]]
+    assert (chat_writer.written, chat_writer.failed, chat_writer.batches) == (2, 1, 0)
@@ -0,0 +1,57 @@
+import asyncio
+
+from unittest import mock
+
+import pytest
+
+from sqlalchemy import exc
+from sqlalchemy.util import greenlet_spawn
+
+from core.config import settings
+from core.db import InstrumentedPool, engines, pool_stats
+from core.metrics import db_pool_checkout_seconds, db_pool_timeouts_total
+
+
+# --- 1. 엔진 설정 테스트 ---
+def test_engines_use_instrumented_pool_and_statement_cache():
+    """
+    채팅/FAQ 엔진 모두 계측 풀과 설정된 풀 크기, prepared statement 캐시 크기를 사용하는지 검증
+    """
+    import crud.qna  # noqa: F401  FAQ 엔진 생성
+
+    stats = pool_stats()
+    assert stats["chat"]["pool_size"] == settings.DB_POOL_SIZE
+    assert stats["chat"]["max_overflow"] == settings.DB_MAX_OVERFLOW
+    assert stats["faq"]["pool_size"] == settings.FAQ_DB_POOL_SIZE
+    assert stats["faq"]["max_overflow"] == settings.FAQ_DB_MAX_OVERFLOW
+
+    assert set(engines) >= {"chat", "faq"}
+    for name, async_engine in engines.items():
+        assert isinstance(async_engine.pool, InstrumentedPool)
+        assert async_engine.pool.engine_name == name
+        assert "prepared_statement_cache_size" in async_engine.url.query
+        assert stats[name]["in_use"] == 0
+
+# --- 2. 체크아웃 계측 테스트 ---
+def test_pool_records_checkout_wait_and_timeouts():
+    """
+    1. 체크아웃 성공 시 대기시간 히스토그램에 기록되는지
+    2. 풀이 가득 차 pool_timeout이 지나면 타임아웃 카운터가 증가하는지 검증
+    """
+    pool_class = type("TestPool", (InstrumentedPool,), {"engine_name": "test_pool"})
+    pool = pool_class(lambda: mock.MagicMock(), pool_size=1, max_overflow=0, timeout=0.01)
+
+    def checkout_twice():
+        first = pool.connect()
+        with pytest.raises(exc.TimeoutError):
+            pool.connect()
+        in_use = pool.checkedout()
+        first.close()
+        return in_use
+
+    in_use = asyncio.run(greenlet_spawn(checkout_twice))
+
+    assert in_use == 1
+    assert pool.checkedout() == 0
+    assert sum(db_pool_checkout_seconds.labels("test_pool").counts) == 1
+    assert db_pool_timeouts_total.labels("test_pool").value == 1
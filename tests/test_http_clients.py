@@ -0,0 +1,74 @@
+import asyncio
+
+import httpx
+import pytest
+
+from core import http
+
+
+class ClosingMockTransport(httpx.MockTransport):
+    """ 종료 여부를 기록하는 가짜 업스트림 트랜스포트 """
+    def __init__(self, handler):
+        super().__init__(handler)
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    """ 실제 커넥션 풀 대신 가짜 트랜스포트를 사용하는 HTTP 클라이언트 레지스트리 """
+    transports = []
+
+    async def stream_body():
+        yield b"data: "
+        yield b"done"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=stream_body())
+
+    def build_transport(limits, http2):
+        transport = ClosingMockTransport(handler)
+        transports.append(transport)
+        return transport
+
+    monkeypatch.setattr(http.httpx, "AsyncHTTPTransport", build_transport)
+    return http.HTTPClientRegistry(), transports
+
+# --- 1. 공유 클라이언트 재사용/종료 테스트 ---
+def test_pooled_client_is_reused_and_closed_on_shutdown(registry):
+    """
+    1. 업스트림마다 클라이언트가 하나만 만들어지고 여러 요청에서 같은 클라이언트를 재사용하는지
+    2. 스트리밍 응답 본문을 읽는 동안 진행 중 요청으로 집계되고, 종료 후 0으로 돌아오는지
+    3. close() 시 클라이언트와 트랜스포트(커넥션 풀)가 닫히고 더 이상 클라이언트를 반환하지 않는지 검증
+    """
+    clients, transports = registry
+
+    async def scenario():
+        await clients.start()
+        llm_client = clients.get("llm")
+        assert clients.get("llm") is llm_client
+        assert clients.get("mcp") is not llm_client
+        assert len(transports) == 2
+
+        for _ in range(3):
+            response = await clients.get("llm").get("http://llm/health")
+            assert response.text == "data: done"
+
+        async with llm_client.stream("POST", "http://llm/chat") as response:
+            assert clients.stats()["llm"]["in_flight"] == 1
+            assert [chunk async for chunk in response.aiter_bytes()] == [b"data: ", b"done"]
+        stats = clients.stats()["llm"]
+
+        await clients.close()
+        return llm_client, stats
+
+    llm_client, stats = asyncio.run(scenario())
+    assert stats["in_flight"] == 0
+    assert stats["requests"] == 4
+    assert stats["queued_requests"] == 0
+    assert llm_client.is_closed
+    assert all(transport.closed for transport in transports)
+    with pytest.raises(RuntimeError):
+        clients.get("llm")
@@ -0,0 +1,75 @@
+import pytest
+
+from core import llm_cache as llm_cache_module
+from core.config import settings
+from core.llm_cache import LLMResponseCache
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    """ TTL 60초, 최대 2개, card_history 툴 제외 설정의 캐시 (시계는 now 값으로 제어) """
+    monkeypatch.setattr(settings, "LLM_CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "LLM_CACHE_TTL", 60.0)
+    monkeypatch.setattr(settings, "LLM_CACHE_MAX_ENTRIES", 2)
+    monkeypatch.setattr(settings, "LLM_CACHE_EXCLUDED_TOOLS", ["card_history"])
+    now = [1000.0]
+    monkeypatch.setattr(llm_cache_module.time, "monotonic", lambda: now[0])
+    return LLMResponseCache(), now
+
+
+# --- 1. 캐시 키 / 만료 테스트 ---
+def test_cache_key_normalization_ttl_and_lru(cache):
+    """
+    1. 공백·문장부호·대소문자만 다른 질문은 같은 키이고, 페르소나가 다르면 다른 키인지
+    2. 저장된 응답은 복사본으로 반환되어 호출자 수정이 캐시에 반영되지 않는지
+    3. TTL이 지나면 만료되고, 최대 크기를 넘으면 가장 오래 사용되지 않은 응답이 제거되는지 검증
+    """
+    llm_cache, now = cache
+    key = llm_cache.make_key("연회비 없는 카드 추천해줘?", 1)
+    assert key == llm_cache.make_key(" 연회비없는 카드  추천해줘 ", 1)
+    assert key == llm_cache.make_key("연회비 없는 카드 추천해줘!!", 1)
+    assert key != llm_cache.make_key("연회비 없는 카드 추천해줘", 2)
+    assert llm_cache.make_key("Ｖisa 카드", None) == llm_cache.make_key("visa카드", None)
+
+    assert llm_cache.put(key, {"message": "추천 카드입니다."})
+    reply = llm_cache.get(llm_cache.make_key("연회비없는카드 추천해줘", 1))
+    reply["message_id"] = "m-1"
+    assert llm_cache.get(key) == {"message": "추천 카드입니다."}
+
+    now[0] += 61
+    assert llm_cache.get(key) is None
+
+    for question in ("a", "b"):
+        llm_cache.put(llm_cache.make_key(question, None), {"message": question})
+    llm_cache.get(llm_cache.make_key("a", None))
+    llm_cache.put(llm_cache.make_key("c", None), {"message": "c"})
+    assert llm_cache.get(llm_cache.make_key("b", None)) is None
+    assert llm_cache.get(llm_cache.make_key("a", None)) == {"message": "a"}
+    assert llm_cache.stats()["entries"] == 2
+
+# --- 2. 개인화 응답 제외 테스트 ---
+def test_personalized_and_excluded_replies_are_not_cached(cache):
+    """
+    1. login_required/card_list가 포함된 응답은 저장하지 않는지 (값이 False/빈 목록이어도 제외)
+    2. 제외 툴 응답, 빈 질문 키는 저장하지 않는지
+    3. 캐시 비활성화 시 저장/조회하지 않는지 검증
+    """
+    llm_cache, _ = cache
+    key = llm_cache.make_key("내 카드 혜택", 1)
+
+    for reply in (
+        {"message": "로그인이 필요합니다.", "login_required": True},
+        {"message": "로그인 불필요", "login_required": False},
+        {"message": "추천 카드", "card_list": []},
+        {"message": "결제 내역", "tool_name": "card_history"},
+    ):
+        assert not llm_cache.is_cacheable(reply)
+        assert llm_cache.put(key, reply) is False
+    assert llm_cache.put(llm_cache.make_key("?!", 1), {"message": "빈 질문"}) is False
+    assert llm_cache.get(key) is None
+    assert llm_cache.stats()["skips"] == 4
+
+    assert llm_cache.put(key, {"message": "혜택 안내", "tool_name": "card_benefit"})
+    llm_cache.enabled = False
+    assert llm_cache.get(key) is None
+    assert llm_cache.put(key, {"message": "다른 안내"}) is False
@@ -0,0 +1,93 @@
+import asyncio
+import json
+
+from uuid import uuid4
+
+import httpx
+import pytest
+
+from core import llm
+
+
+def split_bytes(text: str, size: int):
+    """ 본문을 size 바이트씩 잘라 전송 (줄/UTF-8 문자 경계와 무관하게 분할) """
+    body = text.encode()
+    return [body[i:i + size] for i in range(0, len(body), size)]
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """ content-type과 분할 청크를 지정하여 LLM 서버 스트리밍 응답을 흉내내는 클라이언트 """
+    monkeypatch.setattr(llm.llm_cache, "enabled", False)
+    response = {}
+
+    async def stream_body():
+        for chunk in response["chunks"]:
+            yield chunk
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert json.loads(request.content)["stream"] is True
+        return httpx.Response(200, headers={"content-type": response["content_type"]}, content=stream_body())
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(llm.http_clients, "get", lambda name: client)
+
+    def dispatch(content_type: str, body: str, size: int = 7):
+        response.update(content_type=content_type, chunks=split_bytes(body, size))
+        deltas = []
+
+        async def on_delta(delta):
+            deltas.append(delta)
+
+        reply = asyncio.run(llm.dispatch_stream("연회비 없는 카드", uuid4(), None, on_delta))
+        return reply, deltas
+
+    return dispatch
+
+
+# --- 1. 스트리밍 응답 파싱 테스트 ---
+def test_sse_and_ndjson_streams_are_parsed_across_chunk_boundaries(upstream):
+    """
+    1. SSE: 청크가 줄/문자 중간에서 나뉘어도 이벤트 단위로 파싱되는지
+       (여러 줄 data 필드는 줄바꿈으로 합치고, event/id/주석 줄은 무시하며 [DONE]에서 종료)
+    2. 최종 페이로드에 답변이 없으면 스트리밍된 텍스트로 응답을 구성하는지
+    3. NDJSON: 분할된 줄을 다시 조립하고 tool_response 최종 페이로드를 사용하는지 검증
+    """
+    sse = (
+        ": keep-alive\n\n"
+        "event: delta\nid: 1\ndata: {\"delta\": \"연회비 \"}\n\n"
+        "data: {\"delta\":\ndata:  \"없는 카드\"}\n\n"
+        "data: {\"answer\": \"\"}\n\n"
+        "data: [DONE]\n\n"
+        "data: {\"delta\": \"무시\"}\n\n"
+    )
+    reply, deltas = upstream("text/event-stream; charset=utf-8", sse)
+    assert deltas == ["연회비 ", "없는 카드"]
+    assert reply == {"message": "연회비 없는 카드"}
+
+    ndjson = "\n".join(json.dumps(chunk, ensure_ascii=False) for chunk in (
+        {"delta": "추천 "},
+        {"delta": "카드입니다."},
+        {"tool_response": {
+            "tool_name": "card_recommend",
+            "tool_response_content": {"answer": "추천 카드입니다.", "card_list": [{"card_id": 1}]}
+        }}
+    )) + "\n\n"
+    reply, deltas = upstream("application/x-ndjson", ndjson, size=5)
+    assert deltas == ["추천 ", "카드입니다."]
+    assert reply == {"message": "추천 카드입니다.", "card_list": [{"card_id": 1}], "tool_name": "card_recommend"}
+
+# --- 2. 비스트리밍 응답 대체 처리 테스트 ---
+def test_non_stream_content_type_falls_back_to_json_body(upstream):
+    """
+    1. 스트리밍을 지원하지 않는 서버의 JSON 응답(분할 수신)은 일반 디스패치와 같이 파싱되는지
+    2. 마지막 SSE 이벤트가 빈 줄 없이 끝나도 처리되고, 최종 페이로드가 없으면 델타로 응답을 구성하는지 검증
+    """
+    body = json.dumps({"answer": "스트리밍 미지원 응답입니다."}, ensure_ascii=False)
+    reply, deltas = upstream("application/json", body, size=4)
+    assert deltas == []
+    assert reply == {"message": "스트리밍 미지원 응답입니다."}
+
+    reply, deltas = upstream("text/event-stream", "data: {\"delta\": \"마지막 \"}\n\ndata: {\"delta\": \"이벤트\"}")
+    assert deltas == ["마지막 ", "이벤트"]
+    assert reply == {"message": "마지막 이벤트"}
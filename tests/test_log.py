@@ -0,0 +1,57 @@
+import io
+import json
+
+from core.config import settings
+from core.log import configure_logging, get_logger, shutdown_logging
+
+
+def _capture(level: str, sample_rates=None, emit=None):
+    """ 지정한 설정으로 로그를 기록하고 출력된 JSON 줄 목록 반환 (리스너 종료로 출력 완료 보장) """
+    stream = io.StringIO()
+    configure_logging(level, sample_rates, stream)
+    try:
+        emit(get_logger("tests"))
+    finally:
+        shutdown_logging()
+        configure_logging(settings.LOG_LEVEL, settings.LOG_SAMPLE_RATES)
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+# --- 1. 출력 형식 테스트 ---
+def test_logger_writes_one_json_object_per_line():
+    """
+    1. 이벤트 이름과 키워드 필드가 한 줄의 JSON으로 출력되는지
+    2. exception()은 traceback을 함께 출력하는지 검증
+    """
+    def emit(logger):
+        logger.info("ws.connected", session_id="abc", count=3)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("ws.unknown_error", session_id="abc")
+
+    connected, failed = _capture("INFO", emit=emit)
+
+    assert connected["event"] == "ws.connected"
+    assert connected["level"] == "info"
+    assert connected["logger"] == "chatbot.tests"
+    assert connected["session_id"] == "abc"
+    assert connected["count"] == 3
+    assert failed["level"] == "error"
+    assert "ValueError: boom" in failed["exc_info"]
+
+# --- 2. 레벨/샘플링 테스트 ---
+def test_logger_filters_by_level_and_sample_rate():
+    """
+    1. 설정 레벨 미만(debug) 로그는 출력되지 않는지
+    2. 샘플링 비율 0인 이벤트는 버려지고, 나머지 이벤트는 모두 출력되는지 검증
+    """
+    def emit(logger):
+        logger.debug("ws.response_payload", payload={"message": "본문"})
+        for _ in range(10):
+            logger.info("ws.message_received")
+            logger.info("qna.cache_hit")
+
+    lines = _capture("INFO", {"ws.message_received": 0.0}, emit)
+
+    assert [line["event"] for line in lines] == ["qna.cache_hit"] * 10
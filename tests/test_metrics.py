@@ -0,0 +1,70 @@
+from core.metrics import MetricsRegistry
+
+
+# --- 1. 수집기 기록 테스트 ---
+def test_counter_and_gauge_render_prometheus_text():
+    """
+    1. 레이블 없는 카운터/레이블 있는 카운터가 누적되는지
+    2. set_function을 지정한 게이지는 수집 시점 값이 출력되는지 검증
+    """
+    registry = MetricsRegistry()
+    messages = registry.counter("messages_total", "Messages")
+    errors = registry.counter("errors_total", "Errors", ("reason",))
+    connections = registry.gauge("connections", "Connections")
+    active = []
+    connections.set_function(lambda: len(active))
+
+    messages.inc()
+    messages.inc(2)
+    errors.labels("Timeout").inc()
+    errors.labels('bad "quote"').inc()
+    active.extend([1, 2, 3])
+
+    text = registry.render()
+
+    assert "# TYPE messages_total counter" in text
+    assert "messages_total 3" in text
+    assert 'errors_total{reason="Timeout"} 1' in text
+    assert 'errors_total{reason="bad \\"quote\\""} 1' in text
+    assert "# TYPE connections gauge" in text
+    assert "connections 3" in text
+
+def test_histogram_buckets_are_cumulative_per_label():
+    """
+    히스토그램이 레이블별로 누적 버킷, 합계, 개수를 출력하는지 검증
+    """
+    registry = MetricsRegistry()
+    latency = registry.histogram("latency_seconds", "Latency", ("tool_name",), buckets=(0.1, 1.0))
+
+    latency.labels("faq").observe(0.05)
+    latency.labels("faq").observe(0.1)
+    latency.labels("faq").observe(5)
+    latency.labels("card").observe(0.5)
+
+    text = registry.render()
+
+    assert 'latency_seconds_bucket{tool_name="faq",le="0.1"} 2' in text
+    assert 'latency_seconds_bucket{tool_name="faq",le="1"} 2' in text
+    assert 'latency_seconds_bucket{tool_name="faq",le="+Inf"} 3' in text
+    assert 'latency_seconds_sum{tool_name="faq"} 5.15' in text
+    assert 'latency_seconds_count{tool_name="faq"} 3' in text
+    assert 'latency_seconds_bucket{tool_name="card",le="0.1"} 0' in text
+    assert 'latency_seconds_count{tool_name="card"} 1' in text
+
+# --- 2. 콜백 메트릭 테스트 ---
+def test_callback_metric_reads_values_at_render_time():
+    """
+    콜백 메트릭은 기록 없이 수집 시점에 함수 값을 읽는지 검증
+    """
+    registry = MetricsRegistry()
+    stats = {"hit": 0, "miss": 0}
+    registry.callback(
+        "cache_lookups_total", "Lookups", "counter",
+        lambda: {(result,): count for result, count in stats.items()}, ("result",)
+    )
+
+    stats["hit"] = 7
+    text = registry.render()
+
+    assert 'cache_lookups_total{result="hit"} 7' in text
+    assert 'cache_lookups_total{result="miss"} 0' in text
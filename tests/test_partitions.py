@@ -0,0 +1,236 @@
+import asyncio
+import json
+
+from datetime import date, datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+import pytest
+
+import crud.chat
+
+from core import partitions
+from core.partitions import (
+    add_months, create_partition_sql, expired_months,
+    months_to_create, partition_month, partition_name, unique_index_sql
+)
+from models import Chat, ChatbotResponse
+
+
+# --- 1. 월 파티션 범위/보관 대상 계산 테스트 ---
+def test_partition_months_and_retention():
+    """
+    1. 연도가 바뀌는 달에도 생성 대상 월과 파티션 이름이 올바른지
+    2. 파티션 경계가 UTC 기준 [이번 달 1일, 다음 달 1일) 인지
+    3. 보관 기간이 지난 월만 보관 대상이 되고, 0이면 보관하지 않는지 검증
+    """
+    today = date(2025, 11, 20)
+    months = months_to_create(today, months_ahead=3, months_back=1)
+
+    assert months == [date(2025, 10, 1), date(2025, 11, 1), date(2025, 12, 1), date(2026, 1, 1), date(2026, 2, 1)]
+    assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+    assert partition_name("Chat", months[3]) == "Chat_p202601"
+    assert partition_month("Chat", "Chat_p202601") == date(2026, 1, 1)
+    assert partition_month("Chat", "ChatbotResponse_p202601") is None
+    assert create_partition_sql("Chat", date(2025, 12, 1)) == (
+        'CREATE TABLE IF NOT EXISTS "Chat_p202512" PARTITION OF "Chat" '
+        "FOR VALUES FROM ('2025-12-01 00:00:00+00') TO ('2026-01-01 00:00:00+00')"
+    )
+
+    existing = [date(2024, 9, 1), date(2024, 10, 1), date(2024, 11, 1), date(2025, 11, 1)]
+    assert expired_months(existing, today, retention_months=12) == [date(2024, 9, 1), date(2024, 10, 1)]
+    assert expired_months(existing, today, retention_months=0) == []
+
+# --- 2. 파티션 테이블 스키마/조회 조건 테스트 ---
+def test_partitioned_schema_and_session_window(capturing_session):
+    """
+    1. Chat/ChatbotResponse가 created_at RANGE 파티션이고 PK에 파티션 키가 포함되는지
+    2. ChatbotResponse가 챗봇/프롬프트 메세지를 (id, created_at) 복합 외래키로 참조하는지
+    3. 세션 채팅 조회가 세션 생성 시각 하한 조건으로 파티션을 한정하는지 검증
+    """
+    for table in (Chat.__table__, ChatbotResponse.__table__):
+        ddl = str(CreateTable(table).compile(dialect=postgresql.dialect()))
+        assert "PARTITION BY RANGE (created_at)" in ddl
+        assert "created_at" in table.primary_key.columns
+    assert (
+        "FOREIGN KEY(chat_id, created_at) REFERENCES \"Chat\" (id, created_at) ON DELETE CASCADE" in ddl
+    )
+    assert (
+        "FOREIGN KEY(prompt_chat_id, prompt_chat_created_at) REFERENCES \"Chat\" (id, created_at) "
+        "MATCH FULL ON DELETE SET NULL" in ddl
+    )
+
+    db = capturing_session
+    asyncio.run(crud.chat.fetch_chat_page(db, uuid4(), limit=21))
+    sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+    assert '"Chat".created_at >= (SELECT "ChatSession".created_at' in sql
+
+class FakeArchiveConnection:
+    """ 보관 작업의 asyncpg 연결 (실행한 SQL 기록, 삭제한 파티션은 연결 목록에서 제거) """
+    def __init__(self, attached):
+        self.attached = attached
+        self.executed = []
+
+    async def fetchval(self, sql, *args):
+        return False if "inhdetachpending" in sql else 3
+
+    async def execute(self, sql, *args):
+        self.executed.append(sql)
+        if sql.startswith("DROP TABLE"):
+            name = sql.split('"')[1]
+            table = name.rsplit("_p", 1)[0]
+            self.attached[table].pop(name)
+        return "UPDATE 2" if sql.startswith("UPDATE") else "OK"
+
+    async def copy_from_table(self, name, output, **kwargs):
+        await output(b"id,created_at\n")
+        return "COPY 3"
+
+    async def close(self):
+        pass
+
+class FakeEngine:
+    """ engine.connect()/begin() 대체 (빈 세션 정리 DELETE의 파라미터 기록) """
+    def __init__(self):
+        self.params = []
+
+    def connect(self):
+        return self
+
+    def begin(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params=None):
+        self.params.append(params)
+        return SimpleNamespace(rowcount=0)
+
+# --- 3. 보관 후 빈 세션 정리 테스트 ---
+def test_archive_then_purge_keeps_archived_sessions(monkeypatch, tmp_path):
+    """
+    1. 보관 대상 월마다 ChatbotResponse 파티션을 Chat 파티션보다 먼저 분리/삭제하는지 (외래키 순서)
+    2. Chat 파티션 분리 전에 다음 달 챗봇 응답의 프롬프트 참조를 해제하는지
+    3. 보관 후 빈 세션 정리 하한이 남은 가장 오래된 Chat 파티션 시작(+시계 오차)으로 올라가
+       메세지가 보관된 달의 세션은 삭제 대상에서 제외되는지 검증
+    """
+    months = [date(2024, 9, 1), date(2024, 10, 1), date(2025, 11, 1)]
+    attached = {table: {partition_name(table, month): True for month in months} for table in partitions.PARTITIONED_TABLES}
+    archive_conn = FakeArchiveConnection(attached)
+    engine = FakeEngine()
+
+    async def list_partitions(conn, table):
+        return dict(attached[table])
+
+    async def is_partitioned(conn, table):
+        return True
+
+    async def connect(dsn):
+        return archive_conn
+
+    monkeypatch.setattr(partitions, "engine", engine)
+    monkeypatch.setattr(partitions, "list_partitions", list_partitions)
+    monkeypatch.setattr(partitions, "is_partitioned", is_partitioned)
+    monkeypatch.setattr(partitions.asyncpg, "connect", connect)
+
+    async def scenario():
+        archived = await partitions.archive_expired(
+            "postgresql+asyncpg://u:p@localhost/db", tmp_path, retention_months=12, today=date(2025, 11, 20)
+        )
+        await partitions.purge_empty_sessions(timedelta(days=7), batch_size=100)
+        return archived
+    archived = asyncio.run(scenario())
+
+    assert [manifest["partition"] for manifest in archived] == [
+        "ChatbotResponse_p202409", "Chat_p202409", "ChatbotResponse_p202410", "Chat_p202410"
+    ]
+    assert archived[1]["released_prompt_references"] == 2
+    statements = [sql.split(" FROM ")[0].split(" SET ")[0] for sql in archive_conn.executed]
+    assert statements[:4] == [
+        'ALTER TABLE "ChatbotResponse" DETACH PARTITION "ChatbotResponse_p202409" CONCURRENTLY',
+        'DROP TABLE "ChatbotResponse_p202409"',
+        'UPDATE "ChatbotResponse"',
+        'ALTER TABLE "Chat" DETACH PARTITION "Chat_p202409" CONCURRENTLY',
+    ]
+    assert json.loads((tmp_path / "Chat_p202409.json").read_text())["rows"] == 3
+
+    horizon = engine.params[0]["horizon"]
+    assert horizon == datetime(2025, 11, 1, tzinfo=timezone.utc) + crud.chat.SESSION_CLOCK_SKEW
+    # 보관된 2024년 10월에 생성된 세션은 정리 대상이 아님
+    assert datetime(2024, 10, 15, tzinfo=timezone.utc) < horizon
+    assert partitions.purge_horizon([]) is None
+
+class FakeDDLConnection:
+    """ 파티션/컬럼 조회 결과를 지정하고 실행된 DDL을 기록하는 가짜 연결 """
+    def __init__(self, columns=()):
+        self.columns = list(columns)
+        self.executed = []
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        self.executed.append(sql)
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: self.columns))
+
+# --- 4. Chat.id 유일성 / 전환 전 DB 호환 테스트 ---
+def test_chat_id_uniqueness_and_unpartitioned_compatibility(capturing_session, monkeypatch):
+    """
+    1. 새 Chat 월 파티션에만 id UNIQUE 인덱스가 함께 생성되는지
+    2. 다른 달에 이미 저장된 사용자 메세지 ID는 저장 전에 거부(즉시 저장)/제외(배치 저장)되고,
+       제외된 메세지를 참조하는 챗봇 응답은 프롬프트 없이 저장되는지
+    3. 비파티션 ChatbotResponse에 없는 컬럼만 추가하고, 피드백은 chat_id로 UPDATE하는지 검증
+    """
+    assert unique_index_sql("Chat", date(2025, 12, 1), "id") == (
+        'CREATE UNIQUE INDEX IF NOT EXISTS "Chat_p202512_id_key" ON "Chat_p202512" (id)'
+    )
+
+    async def is_partitioned(conn, table):
+        return True
+
+    async def list_partitions(conn, table):
+        return {partition_name(table, date(2025, 11, 1)): True}
+
+    monkeypatch.setattr(partitions, "is_partitioned", is_partitioned)
+    monkeypatch.setattr(partitions, "list_partitions", list_partitions)
+    conn = FakeDDLConnection()
+    created = asyncio.run(partitions.ensure_partitions(conn, today=date(2025, 11, 20), months_ahead=1))
+    assert created == ["Chat_p202512", "ChatbotResponse_p202512"]
+    assert [sql for sql in conn.executed if "UNIQUE INDEX" in sql] == [unique_index_sql("Chat", date(2025, 12, 1), "id")]
+
+    db = capturing_session
+    message_id, bot_id, session_id = uuid4(), uuid4(), uuid4()
+    db.rows = [message_id]
+    with pytest.raises(crud.chat.DuplicateChatId):
+        asyncio.run(crud.chat.create_user_chat(db, message_id, session_id, 1, "중복 메세지"))
+    assert db.commits == 0
+
+    chat_rows = [{"id": message_id, "is_user": True}, {"id": bot_id, "is_user": False}]
+    response_rows = [{"chat_id": bot_id, "prompt_id": message_id, "session_id": session_id}]
+    duplicates = asyncio.run(crud.chat.bulk_create_chats(db, chat_rows, response_rows))
+    assert duplicates == {message_id}
+    lookup, chat_insert, response_insert = db.params[1:]
+    assert lookup is None and chat_insert == [{"id": bot_id, "is_user": False}]
+    assert response_insert == [{"chat_id": bot_id, "prompt_id": None, "session_id": session_id}]
+    assert 'WHERE "Chat".id IN' in str(db.statements[1].compile(dialect=postgresql.dialect()))
+
+    conn = FakeDDLConnection(columns=["chat_id", "prompt_chat_id", "created_at"])
+    assert asyncio.run(partitions.ensure_response_columns(conn, lock_timeout=2)) == ["prompt_chat_created_at"]
+    assert conn.executed[1:] == [
+        "SET LOCAL lock_timeout = '2000ms'",
+        'ALTER TABLE "ChatbotResponse" ADD COLUMN IF NOT EXISTS prompt_chat_created_at TIMESTAMP WITH TIME ZONE'
+    ]
+    conn = FakeDDLConnection(columns=["chat_id", "created_at", "prompt_chat_created_at"])
+    assert asyncio.run(partitions.ensure_response_columns(conn)) == []
+    assert len(conn.executed) == 1
+
+    db.rows = [SimpleNamespace(chat_id=bot_id, is_helpful=True)]
+    assert asyncio.run(crud.chat.update_chat_feedback(db, message_id, True)).chat_id == bot_id
+    sql = str(db.statements[-1].compile(dialect=postgresql.dialect()))
+    assert sql.startswith('UPDATE "ChatbotResponse" SET is_helpful=') and "RETURNING" in sql
+    assert 'WHERE "ChatbotResponse".chat_id = (SELECT "ChatbotResponse".chat_id' in sql
@@ -0,0 +1,89 @@
+import asyncio
+import json
+
+from types import SimpleNamespace
+from unittest import mock
+
+from core.config import settings
+from core.persona_catalog import PersonaCatalog
+
+
+class FakePersonaTable:
+    """ 조회 횟수를 세는 가짜 Persona 테이블 """
+    def __init__(self, rows):
+        self.rows = rows
+        self.loads = 0
+
+    async def load(self):
+        self.loads += 1
+        await asyncio.sleep(0)
+        return list(self.rows)
+
+
+def _persona(persona_id: int, name: str):
+    return SimpleNamespace(id=persona_id, name=name, description=None, created_at=None)
+
+
+# --- 1. 조건부 응답 테스트 ---
+def test_catalog_serves_cached_body_and_304_on_matching_etag():
+    """
+    1. 최초 적재 후에는 목록 응답/ID 조회가 DB를 다시 조회하지 않는지
+    2. If-None-Match가 ETag와 같으면 본문 없이 304, 다르면 200을 반환하는지 검증
+    """
+    table = FakePersonaTable([_persona(1, "사회초년생"), _persona(2, "주부")])
+    catalog = PersonaCatalog(loader=table.load)
+
+    async def scenario():
+        first = await catalog.response()
+        etag = first.headers["etag"]
+        cached = await catalog.response(etag)
+        weak = await catalog.response(f'W/{etag}, "other"')
+        stale = await catalog.response('"other"')
+        persona = await catalog.get(2)
+        missing = await catalog.get(99)
+        return first, cached, weak, stale, persona, missing
+
+    first, cached, weak, stale, persona, missing = asyncio.run(scenario())
+
+    assert table.loads == 1
+    assert first.status_code == 200
+    assert json.loads(first.body)["personas"] == [
+        {"id": 1, "name": "사회초년생", "description": None},
+        {"id": 2, "name": "주부", "description": None}
+    ]
+    assert "max-age" in first.headers["cache-control"]
+    assert cached.status_code == 304 and cached.body == b""
+    assert cached.headers["etag"] == first.headers["etag"]
+    assert weak.status_code == 304
+    assert stale.status_code == 200
+    assert persona.name == "주부"
+    assert missing is None
+
+# --- 2. 주기적 갱신 테스트 ---
+def test_periodic_refresh_loads_once_and_changes_etag():
+    """
+    1. 적재 전 동시에 들어온 조회는 한 번만 적재하는지
+    2. DB에서 변경된 목록이 PERSONA_CATALOG_TTL 후 갱신 태스크로 반영되어 이전 ETag 요청에 새 본문(200)을 반환하는지 검증
+    """
+    table = FakePersonaTable([_persona(1, "사회초년생")])
+    catalog = PersonaCatalog(loader=table.load)
+
+    async def scenario():
+        first = await asyncio.gather(*(catalog.response() for _ in range(10)))
+        loads_before_refresh = table.loads
+        before = first[0].headers["etag"]
+        table.rows.append(_persona(2, "주부"))
+        with mock.patch.object(settings, "PERSONA_CATALOG_TTL", 0.01):
+            await catalog.start()
+            while table.loads < loads_before_refresh + 2:
+                await asyncio.sleep(0.01)
+            await catalog.close()
+        responses = [await catalog.response(before) for _ in range(3)]
+        return loads_before_refresh, before, responses
+
+    loads_before_refresh, before, responses = asyncio.run(scenario())
+
+    assert loads_before_refresh == 1
+    assert all(response.status_code == 200 for response in responses)
+    assert responses[0].headers["etag"] != before
+    assert len(json.loads(responses[0].body)["personas"]) == 2
@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+import crud.qna
+
+from core.config import settings
+from core.qna_cache import LRUCache, QnACache
+
+
+def faq(question: str, views: int = 0):
+    return {"faq_id": hash(question), "question": question, "answer": f"{question} 답변", "views": views}
+
+
+def term(name: str):
+    return {"term_id": hash(name), "term": name, "definition": f"{name} 정의"}
+
+
+@pytest.fixture
+def qna_db(monkeypatch):
+    """ 조회수 순 FAQ/용어 목록을 반환하는 가짜 FAQ DB (gate가 열릴 때까지 조회 지연 가능) """
+    monkeypatch.setattr(settings, "QNA_CACHE_MAX_ENTRIES", 2)
+    db = {"faqs": [], "terms": [], "gate": None, "error": None}
+
+    async def rows(kind, top_k):
+        if db["gate"] is not None:
+            await db["gate"].wait()
+        if db["error"] is not None:
+            raise db["error"]
+        return db[kind] if top_k is None else db[kind][:top_k]
+
+    async def get_faqs_with_high_views(top_k=3):
+        return await rows("faqs", top_k)
+
+    async def get_terms_with_high_views(top_k=6):
+        return await rows("terms", top_k)
+
+    monkeypatch.setattr(crud.qna, "get_faqs_with_high_views", get_faqs_with_high_views)
+    monkeypatch.setattr(crud.qna, "get_terms_with_high_views", get_terms_with_high_views)
+    return db
+
+
+# --- 1. LRU 제거 테스트 ---
+def test_lru_cache_evicts_least_recently_used_entry():
+    """
+    1. 최대 크기를 넘으면 가장 오래 사용되지 않은 항목이 제거되는지
+    2. 조회/재저장한 항목은 가장 최근 사용으로 갱신되는지 검증
+    """
+    cache = LRUCache(2)
+    cache.put("a", {"v": 1})
+    cache.put("b", {"v": 2})
+    assert cache.get("a") == {"v": 1}
+    cache.put("c", {"v": 3})
+
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    cache.put("a", {"v": 4})
+    cache.put("d", {"v": 5})
+    assert cache.get("c") is None
+    assert cache.get("a") == {"v": 4}
+
+# --- 2. 캐시 갱신 테스트 ---
+def test_refresh_swaps_cache_atomically_and_keeps_old_cache_on_failure(qna_db):
+    """
+    1. 갱신 중(DB 조회 대기)에는 이전 캐시로 응답하고, 완료 후 새 캐시로 한 번에 교체되는지
+    2. 조회수 상위 항목이 가장 나중에 제거되도록 적재되는지
+    3. 갱신에 실패하면 이전 캐시를 그대로 유지하는지 검증
+    """
+    cache = QnACache()
+    qna_db["faqs"] = [faq("연회비란?", 10), faq("결제일 변경", 5)]
+    qna_db["terms"] = [term("리볼빙")]
+
+    async def scenario():
+        await cache.refresh()
+        assert cache.get_faq("연회비란?")["answer"] == "연회비란? 답변"
+
+        qna_db["faqs"] = [faq("한도 상향", 20), faq("연회비란?", 10)]
+        qna_db["terms"] = [term("할부")]
+        qna_db["gate"] = asyncio.Event()
+        refreshing = asyncio.create_task(cache.refresh())
+        await asyncio.sleep(0)
+        # 갱신 완료 전: 이전 캐시 그대로
+        assert cache.get_faq("결제일 변경") is not None
+        assert cache.get_faq("한도 상향") is None
+        assert cache.get_term("리볼빙") is not None
+        qna_db["gate"].set()
+        await refreshing
+
+        assert cache.get_faq("결제일 변경") is None
+        assert cache.get_term("리볼빙") is None
+        assert cache.get_term("할부")["definition"] == "할부 정의"
+        # 조회수 하위 항목(연회비란?)부터 제거
+        cache.put_faqs([faq("카드 해지")])
+        assert cache.get_faq("한도 상향") is not None
+
+        qna_db["error"] = RuntimeError("faq db unavailable")
+        with pytest.raises(RuntimeError):
+            await cache.refresh()
+
+    asyncio.run(scenario())
+
+    assert cache.get_faq("한도 상향") is not None
+    assert cache.stats()["refreshes"] == 2
+    assert cache.stats()["faq_entries"] == 2
+
+# --- 3. 매칭 인덱스 범위 테스트 ---
+def test_matcher_indexes_full_corpus_and_added_entries(qna_db):
+    """
+    1. 캐시 크기(QNA_CACHE_MAX_ENTRIES)를 넘는 조회수 하위 항목도 매칭 인덱스로 조회되는지
+    2. API로 추가된(put_faqs/put_terms) 항목이 다음 갱신 전에도 매칭되는지 검증
+    """
+    cache = QnACache()
+    qna_db["faqs"] = [faq("연회비란?", 10), faq("한도 상향 방법", 5), faq("결제일 변경 방법", 1)]
+    qna_db["terms"] = [term("리볼빙"), term("할부"), term("선결제")]
+
+    asyncio.run(cache.refresh())
+
+    assert cache.stats()["faq_entries"] == 2
+    assert cache.get_faq("결제일 변경방법?")["answer"] == "결제일 변경 방법 답변"
+    assert cache.get_term("선 결제")["definition"] == "선결제 정의"
+    assert cache.stats()["faq_fuzzy_hits"] == 1
+
+    assert cache.get_faq("카드 해지 방법") is None
+    cache.put_faqs([faq("카드 해지 방법")])
+    cache.put_terms([term("리워드")])
+    assert cache.get_faq("카드해지 방법?")["answer"] == "카드 해지 방법 답변"
+    assert cache.get_term("리워드!")["definition"] == "리워드 정의"
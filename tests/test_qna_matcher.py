@@ -0,0 +1,60 @@
+from core.qna_matcher import QnAMatcher, normalize_text
+
+
+FAQ_ENTRIES = {
+    "카드 추천해 주세요": {"question": "카드 추천해 주세요", "answer": "추천 카드 목록입니다."},
+    "연회비는 얼마인가요?": {"question": "연회비는 얼마인가요?", "answer": "카드별로 상이합니다."},
+    "해외 결제 수수료가 있나요?": {"question": "해외 결제 수수료가 있나요?", "answer": "1% 부과됩니다."},
+}
+
+# --- 1. 정규화 테스트 ---
+def test_normalize_text_ignores_spacing_and_punctuation():
+    """
+    공백, 문장부호, 전각 문자, 대소문자 차이가 정규화 후 동일한지 검증
+    """
+    assert normalize_text("카드 추천") == normalize_text("카드추천")
+    assert normalize_text("연회비는 얼마인가요?") == normalize_text(" 연회비는얼마인가요 ")
+    assert normalize_text("ＶＩＳＡ 카드!") == normalize_text("visa카드")
+
+# --- 2. 매칭 테스트 ---
+def test_match_normalized_exact():
+    """
+    띄어쓰기/물음표만 다른 질문이 유사도 1.0으로 매칭되는지 검증
+    """
+    matcher = QnAMatcher(FAQ_ENTRIES, threshold=0.85)
+
+    matched = matcher.match("카드추천해주세요?")
+    assert matched is not None
+    key, item, score = matched
+    assert key == "카드 추천해 주세요"
+    assert item["answer"] == "추천 카드 목록입니다."
+    assert score == 1.0
+
+def test_match_fuzzy_near_duplicate():
+    """
+    한 글자 정도 다른 질문이 임계값 이상 유사도로 매칭되는지 검증
+    """
+    matcher = QnAMatcher(FAQ_ENTRIES, threshold=0.8)
+
+    matched = matcher.match("해외 결제 수수료 있나요")
+    assert matched is not None
+    assert matched[0] == "해외 결제 수수료가 있나요?"
+    assert 0.8 <= matched[2] < 1.0
+
+def test_match_miss_below_threshold():
+    """
+    관련 없는 질문이나 빈 입력은 매칭되지 않는지 검증
+    """
+    matcher = QnAMatcher(FAQ_ENTRIES, threshold=0.85)
+
+    assert matcher.match("오늘 날씨 어때?") is None
+    assert matcher.match("   ?! ") is None
+
+def test_match_exact_only_threshold():
+    """
+    threshold 1.0이면 정규화 완전 일치만 허용하는지 검증
+    """
+    matcher = QnAMatcher(FAQ_ENTRIES, threshold=1.0)
+
+    assert matcher.match("연회비는얼마인가요") is not None
+    assert matcher.match("해외 결제 수수료 있나요") is None
@@ -0,0 +1,61 @@
+import asyncio
+
+from core.readiness import ReadinessProbe
+
+
+def _probe(fail: bool = False, delay: float = 0.0):
+    async def probe():
+        await asyncio.sleep(delay)
+        if fail:
+            raise ConnectionRefusedError("connection refused")
+    return probe
+
+
+# --- 1. 준비 상태 판단 테스트 ---
+def test_readiness_fails_only_on_critical_dependency():
+    """
+    1. 확인 전에는 준비되지 않음으로 판단하는지
+    2. 비핵심 의존성 실패는 준비 상태에 영향을 주지 않고, 핵심 의존성 실패 시 not_ready인지 검증
+    """
+    readiness = ReadinessProbe(critical=["chat_db", "llm"])
+    readiness.add_probe("chat_db", _probe())
+    readiness.add_probe("llm", _probe())
+    readiness.add_probe("mcp", _probe(fail=True))
+
+    before = readiness.is_ready()
+    asyncio.run(readiness.check())
+    report = readiness.report()
+
+    assert before is False
+    assert report["status"] == "ready"
+    assert report["dependencies"]["mcp"]["status"] == "down"
+    assert report["dependencies"]["mcp"]["critical"] is False
+    assert "ConnectionRefusedError" in report["dependencies"]["mcp"]["error"]
+    assert report["dependencies"]["llm"]["latency_ms"] >= 0
+
+    readiness.add_probe("llm", _probe(fail=True))
+    asyncio.run(readiness.check())
+
+    assert readiness.report()["status"] == "not_ready"
+    assert readiness.dependency_up() == {"chat_db": 1, "llm": 0, "mcp": 0}
+
+# --- 2. 타임아웃 테스트 ---
+def test_slow_probe_times_out_without_blocking_others(monkeypatch):
+    """
+    응답하지 않는 의존성은 READINESS_PROBE_TIMEOUT 후 down 처리되고,
+    다른 의존성 확인은 동시에 완료되는지 검증
+    """
+    from core.config import settings
+    monkeypatch.setattr(settings, "READINESS_PROBE_TIMEOUT", 0.05)
+
+    readiness = ReadinessProbe(critical=["chat_db"])
+    readiness.add_probe("chat_db", _probe())
+    readiness.add_probe("llm", _probe(delay=10))
+
+    asyncio.run(readiness.check())
+    report = readiness.report()
+
+    assert report["status"] == "ready"
+    assert report["dependencies"]["llm"]["status"] == "down"
+    assert report["dependencies"]["llm"]["error"] == "TimeoutError"
+    assert report["dependencies"]["llm"]["latency_ms"] < 1000
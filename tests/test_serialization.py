@@ -0,0 +1,55 @@
+import json
+
+from datetime import datetime, timezone
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+
+from fastapi.responses import JSONResponse
+
+from core import serialization
+from core.serialization import (
+    ORJSON_AVAILABLE, FastJSONResponse, OrjsonSerializer, StdlibSerializer, create_serializer
+)
+
+
+# --- 1. 백엔드 간 호환성 테스트 ---
+@pytest.mark.skipif(not ORJSON_AVAILABLE, reason="orjson 미설치")
+def test_backends_produce_equivalent_json():
+    """
+    1. stdlib/orjson 직렬화 결과가 같은 JSON으로 파싱되고 한글이 이스케이프되지 않는지
+    2. UUID/datetime 값이 두 백엔드에서 같은 문자열로 변환되는지
+    3. 잘못된 JSON은 두 백엔드 모두 json.JSONDecodeError로 처리되는지 검증
+    """
+    payload = {
+        "sender": "bot",
+        "message_id": uuid4(),
+        "timestamp": datetime(2025, 1, 1, 9, 30, 15, 123456, tzinfo=timezone.utc),
+        "message": "연회비 없는 카드 추천",
+        "card_list": [{"card_id": i, "benefits": ["주유 5%"]} for i in range(3)]
+    }
+    stdlib, fast = StdlibSerializer(), OrjsonSerializer()
+
+    assert stdlib.loads(stdlib.dumps(payload)) == fast.loads(fast.dumps_bytes(payload))
+    assert "연회비" in fast.dumps(payload)
+    for serializer in (stdlib, fast):
+        with pytest.raises(json.JSONDecodeError):
+            serializer.loads("{invalid")
+
+# --- 2. 폴백 및 응답 클래스 테스트 ---
+def test_fallback_and_response_render():
+    """
+    1. orjson 미설치 시 auto/orjson 설정 모두 stdlib 직렬화기로 대체되는지
+    2. FastJSONResponse 본문이 기본 JSONResponse와 같은지 (stdlib 사용 시 바이트 동일)
+    """
+    with mock.patch.object(serialization, "ORJSON_AVAILABLE", False):
+        assert create_serializer("auto").name == "stdlib"
+        assert create_serializer("orjson").name == "stdlib"
+    with pytest.raises(ValueError):
+        create_serializer("ujson")
+
+    content = {"personas": [{"id": 1, "name": "사회초년생"}], "count": 1}
+    with mock.patch.object(serialization, "serializer", StdlibSerializer()):
+        assert FastJSONResponse(content=content).body == JSONResponse(content=content).body
+    assert json.loads(FastJSONResponse(content=content).body) == content
@@ -0,0 +1,243 @@
+import asyncio
+import json
+
+from contextlib import asynccontextmanager
+from types import SimpleNamespace
+from uuid import uuid4
+
+import core.session_registry as session_registry_module
+
+from api.routes.ws import ConnectionManager
+from core.session_registry import (
+    REAP_STALE_WORKERS_SQL, InMemorySessionRegistry, LocalSessionHub, PostgresSessionRegistry
+)
+
+
+class FakeWebSocket:
+    """ 전송된 메세지를 기록하는 테스트용 웹소켓 """
+    def __init__(self):
+        self.sent = []
+        self.scope = {"subprotocols": []}
+        self.query_params = {}
+
+    async def accept(self, subprotocol=None):
+        pass
+
+    async def send_json(self, payload):
+        self.sent.append(payload)
+
+    async def send_text(self, message):
+        self.sent.append(message)
+
+
+def make_workers():
+    """ 같은 세션 테이블을 공유하는 워커 2개 생성 """
+    hub = LocalSessionHub()
+    worker_a = ConnectionManager(InMemorySessionRegistry("worker-a", hub))
+    worker_b = ConnectionManager(InMemorySessionRegistry("worker-b", hub))
+    return worker_a, worker_b
+
+
+# --- 1. 워커 간 라우팅 테스트 ---
+def test_login_on_other_worker_is_routed_to_owner():
+    """
+    워커 A에 연결된 세션에 대해 워커 B에서
+    1. 세션 조회가 가능한지
+    2. 페르소나 갱신이 A의 연결 정보에 반영되는지
+    3. JSON 전송이 A의 웹소켓으로 전달되는지 검증
+    """
+    worker_a, worker_b = make_workers()
+    session_id = uuid4()
+    websocket = FakeWebSocket()
+
+    async def scenario():
+        await worker_a.registry.start()
+        await worker_b.registry.start()
+        await worker_a.connect(session_id, websocket)
+        await worker_a.set_user_chat_id(session_id, "user-chat-1")
+
+        session = await worker_b.get_session(session_id)
+        assert session["worker_id"] == "worker-a"
+        assert session["user_chat_id"] == "user-chat-1"
+
+        await worker_b.update_persona_id(session_id, 3)
+        sent = await worker_b.send_json(session_id, {"message": "추천 카드"})
+        return sent, await worker_b.get_session(session_id)
+
+    sent, session = asyncio.run(scenario())
+
+    assert sent is True
+    assert session["persona_id"] == 3
+    assert worker_a.active_connections[session_id].persona_id == 3
+    assert [json.loads(message) for message in websocket.sent] == [{"message": "추천 카드"}]
+    assert session_id not in worker_b.active_connections
+
+# --- 2. 연결 종료 테스트 ---
+def test_disconnected_or_closed_worker_sessions_are_not_found():
+    """
+    1. 소유 워커에서 연결이 끊긴 세션은 다른 워커에서 조회/전송되지 않는지
+    2. 종료된 워커의 세션은 레지스트리에서 제거되는지 검증
+    """
+    worker_a, worker_b = make_workers()
+    first, second = uuid4(), uuid4()
+
+    async def scenario():
+        await worker_a.registry.start()
+        await worker_b.registry.start()
+        await worker_a.connect(first, FakeWebSocket())
+        await worker_a.connect(second, FakeWebSocket())
+
+        await worker_a.disconnect(first)
+        assert await worker_b.get_session(first) is None
+        assert await worker_b.send_json(first, {"message": "x"}) is False
+
+        await worker_a.registry.close()
+        assert await worker_b.get_session(second) is None
+
+    asyncio.run(scenario())
+
+
+class FakeResult:
+    def __init__(self, rowcount=1, rows=()):
+        self.rowcount = rowcount
+        self.rows = list(rows)
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class FakeConnection:
+    """ 실행된 SQL을 기록하고 SQL 앞부분으로 지정한 결과를 반환하는 연결 """
+    def __init__(self, results):
+        self.results = results
+        self.executed = []
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        self.executed.append((sql, params))
+        for prefix, result in self.results.items():
+            if sql.startswith(prefix):
+                return result
+        return FakeResult()
+
+
+class FakeEngine:
+    def __init__(self, results=None):
+        self.conn = FakeConnection(results or {})
+
+    @asynccontextmanager
+    async def begin(self):
+        yield self.conn
+
+
+class FakeListener:
+    def __init__(self):
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+
+def make_postgres_registry(monkeypatch, results=None):
+    fake_engine = FakeEngine(results)
+    monkeypatch.setattr(session_registry_module, "engine", fake_engine)
+    registry = PostgresSessionRegistry("postgresql+asyncpg://user:pw@localhost/db", 1.0, "worker-a")
+    return registry, fake_engine.conn
+
+
+# --- 3. NOTIFY 페이로드 처리 테스트 ---
+def test_notify_payload_is_consumed_and_delivered(monkeypatch):
+    """
+    1. 숫자 페이로드는 명령 ID로 처리 태스크를 만들고, 잘못된 페이로드는 무시하는지
+    2. 명령 행을 꺼내(DELETE ... RETURNING) JSON 명령을 세션 ID와 함께 전달하는지
+    3. 처리 후 진행 중 태스크 목록이 비워지는지 검증
+    """
+    session_id = uuid4()
+    row = SimpleNamespace(session_id=str(session_id), command=json.dumps({"type": "send_json"}))
+    registry, conn = make_postgres_registry(monkeypatch, {'DELETE FROM "SessionMessage"': FakeResult(rows=[row])})
+    delivered = []
+
+    async def deliver(target, command):
+        delivered.append((target, command))
+        return True
+
+    registry.bind(deliver)
+
+    async def scenario():
+        registry._on_notify(None, 1, registry.channel, "42")
+        registry._on_notify(None, 1, registry.channel, "not-a-message-id")
+        assert len(registry._pending) == 1
+        await asyncio.gather(*registry._pending)
+
+    asyncio.run(scenario())
+
+    assert [params for _, params in conn.executed] == [{"id": 42}]
+    assert delivered == [(session_id, {"type": "send_json"})]
+    assert registry.delivered == 1
+    assert not registry._pending
+
+# --- 4. heartbeat / LISTEN 재연결 테스트 ---
+def test_heartbeat_relistens_rejoins_and_reaps_stale_workers(monkeypatch):
+    """
+    1. LISTEN 재연결에 실패하면 heartbeat를 건너뛰는지 (다른 워커가 이 워커를 끊긴 워커로 처리)
+    2. 재연결 후 이미 정리된 워커면 워커와 소유 세션(공유 필드 포함)을 다시 등록하는지
+    3. 끊긴 워커 정리 SQL을 워커 -> 세션 -> 명령 순으로 실행하는지
+    4. 끊긴 동안 받지 못한 명령을 처리하는지 검증
+    """
+    registry, conn = make_postgres_registry(monkeypatch, {
+        'UPDATE "SessionWorker"': FakeResult(rowcount=0),
+        'SELECT id FROM "SessionMessage"': FakeResult(rows=[7, 8])
+    })
+    session_id = uuid4()
+    registry._owned[session_id] = {"user_chat_id": "user-chat-1"}
+    consumed = []
+    attempts = []
+
+    async def listen():
+        attempts.append(True)
+        if len(attempts) == 1:
+            raise OSError("connection refused")
+        registry._listener = FakeListener()
+
+    async def consume(message_id):
+        consumed.append(message_id)
+
+    monkeypatch.setattr(registry, "_listen", listen)
+    monkeypatch.setattr(registry, "_consume", consume)
+
+    async def scenario():
+        await registry.beat()
+        assert conn.executed == []
+        await registry.beat()
+        await asyncio.gather(*registry._pending)
+
+    asyncio.run(scenario())
+
+    statements = [sql for sql, _ in conn.executed]
+    assert statements[0].startswith('UPDATE "SessionWorker" SET heartbeat_at = now()')
+    assert statements[1].startswith('INSERT INTO "SessionWorker"')
+    assert statements[2].startswith('INSERT INTO "SessionRegistry"')
+    assert conn.executed[2][1] == [{
+        "session_id": str(session_id), "worker_id": "worker-a", "persona_id": None, "user_chat_id": "user-chat-1"
+    }]
+    assert tuple(statements[3:6]) == REAP_STALE_WORKERS_SQL
+    assert all(params == {"stale_after": 3.0} for _, params in conn.executed[3:6])
+    assert statements[6].startswith('SELECT id FROM "SessionMessage"')
+    assert consumed == [7, 8]
+    assert registry.listening() and registry.reconnects == 1
+
+    # 연결이 유지되면 재연결/미수신 명령 조회 없이 heartbeat만 갱신
+    conn.executed.clear()
+    asyncio.run(registry.beat())
+    assert len(attempts) == 2
+    assert not any(sql.startswith("SELECT") for sql, _ in conn.executed)
+
+    # LISTEN 연결 종료 콜백 이후에는 다음 heartbeat에서 재연결
+    registry._on_listener_closed(registry._listener)
+    assert not registry.listening()
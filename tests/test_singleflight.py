@@ -0,0 +1,134 @@
+import asyncio
+import pytest
+
+from uuid import uuid4
+
+from core.singleflight import SingleFlight
+
+
+# --- 1. 동시 호출 병합 테스트 ---
+def test_concurrent_calls_share_one_upstream_call():
+    """
+    같은 키로 동시에 호출하면
+    1. 실제 함수는 한 번만 실행되는지
+    2. 모든 호출자가 같은 결과를 받는지 검증
+    """
+    flight = SingleFlight()
+    executed = 0
+
+    async def upstream():
+        nonlocal executed
+        executed += 1
+        await asyncio.sleep(0.01)
+        return {"message": "답변"}
+
+    async def scenario():
+        return await asyncio.gather(*[flight.do("같은 질문", upstream) for _ in range(10)])
+
+    results = asyncio.run(scenario())
+
+    assert executed == 1
+    assert all(result == {"message": "답변"} for result in results)
+    assert flight.stats() == {"inflight": 0, "calls": 1, "coalesced": 9, "unshared": 0}
+
+def test_different_keys_and_sequential_calls_are_not_merged():
+    """
+    키가 다르거나, 이전 호출이 끝난 뒤 들어온 호출은 각각 실행되는지 검증
+    """
+    flight = SingleFlight()
+
+    async def upstream():
+        await asyncio.sleep(0)
+        return "ok"
+
+    async def scenario():
+        await asyncio.gather(flight.do("a", upstream), flight.do("b", upstream))
+        await flight.do("a", upstream)
+
+    asyncio.run(scenario())
+
+    assert flight.calls == 3
+    assert flight.coalesced == 0
+
+# --- 2. 예외/취소 전파 테스트 ---
+def test_exception_is_shared_with_all_waiters():
+    """
+    업스트림 예외가 합류한 모든 호출자에게 전달되는지 검증
+    """
+    flight = SingleFlight()
+
+    async def upstream():
+        await asyncio.sleep(0.01)
+        raise ValueError("LLM 서버 오류")
+
+    async def scenario():
+        return await asyncio.gather(
+            *[flight.do("key", upstream) for _ in range(3)], return_exceptions=True
+        )
+
+    results = asyncio.run(scenario())
+
+    assert all(isinstance(result, ValueError) for result in results)
+
+def test_leader_cancellation_does_not_cancel_waiters():
+    """
+    첫 호출자가 취소되어도 합류한 호출자는 결과를 받는지 검증
+    """
+    flight = SingleFlight()
+
+    async def upstream():
+        await asyncio.sleep(0.02)
+        return "ok"
+
+    async def scenario():
+        leader = asyncio.create_task(flight.do("key", upstream))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(flight.do("key", upstream))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(scenario()) == "ok"
+
+# --- 3. LLM 디스패치 병합 테스트 ---
+def test_personalized_reply_is_not_shared_between_sessions(monkeypatch):
+    """
+    같은 질문을 두 세션이 동시에 보낼 때
+    1. 먼저 호출한 세션의 응답에 login_required가 있으면 합류한 세션도 직접 업스트림을 호출하는지
+    2. 비개인화 응답은 업스트림 호출 하나의 결과를 공유하는지 검증
+    """
+    from core import llm
+
+    monkeypatch.setattr(llm.settings, "LLM_COALESCE_ENABLED", True)
+    monkeypatch.setattr(llm.llm_cache, "enabled", False)
+    monkeypatch.setattr(llm, "llm_singleflight", SingleFlight())
+    replies = {}
+    called = []
+
+    async def post_dispatch(query, session_id):
+        called.append(session_id)
+        await asyncio.sleep(0.01)
+        return dict(replies[query], message=f"{query} ({session_id})")
+
+    monkeypatch.setattr(llm, "_post_dispatch", post_dispatch)
+    replies["내 카드 혜택 알려줘"] = {"login_required": True, "tool_name": "getMyCards"}
+    replies["연회비 없는 카드"] = {}
+    first, second = uuid4(), uuid4()
+
+    async def scenario(query):
+        return await asyncio.gather(llm.dispatch(query, first, 1), llm.dispatch(query, second, 1))
+
+    personal = asyncio.run(scenario("내 카드 혜택 알려줘"))
+    assert called == [first, second]
+    assert [reply["message"] for reply in personal] == [
+        f"내 카드 혜택 알려줘 ({first})", f"내 카드 혜택 알려줘 ({second})"
+    ]
+    assert llm.llm_singleflight.unshared == 1
+
+    called.clear()
+    shared = asyncio.run(scenario("연회비 없는 카드"))
+    assert called == [first]
+    assert shared[0] == shared[1] and shared[0] is not shared[1]
+    assert llm.llm_singleflight.coalesced == 1
@@ -0,0 +1,204 @@
+import asyncio
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import UUID, uuid4
+
+import pytest
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import asyncpg
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.schema import CreateTable
+
+import crud.chat
+
+from core import uuid_migration
+from core.chat_writer import as_uuid
+from core.uuid_migration import TABLES, backfill_sql, final_name, sync_function_sql
+from models import Chat, ChatbotResponse, ChatSession
+
+
+class SwapConnection:
+    """ 실행된 SQL을 기록하고, 엔진에 지정한 오류(sqlstate)를 LOCK TABLE 실행 시 순서대로 발생시키는 가짜 연결 """
+    indexes = {
+        "Chat": ["Chat_pkey", "idx_session_created"],
+        "Chat__uuid": ["Chat__uuid_pkey", "idx_session_created__uuid"],
+    }
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        if sql.startswith("SELECT c.relname FROM pg_index"):
+            return SimpleNamespace(scalars=lambda: SimpleNamespace(
+                all=lambda: self.indexes.get(params["table"].strip('"'), [])
+            ))
+        self.engine.executed.append(sql)
+        if "pg_terminate_backend" in sql:
+            return SimpleNamespace(scalar=lambda: 4)
+        if sql.startswith("LOCK TABLE") and self.engine.lock_errors:
+            raise DBAPIError(sql, None, SimpleNamespace(sqlstate=self.engine.lock_errors.pop(0)))
+
+
+class SwapEngine:
+    def __init__(self, lock_errors):
+        self.lock_errors = list(lock_errors)
+        self.executed = []
+        self.attempts = 0
+
+    @asynccontextmanager
+    async def begin(self):
+        self.attempts += 1
+        yield SwapConnection(self)
+
+
+# --- 1. uuid 컬럼 스키마 테스트 ---
+def test_chat_keys_work_with_char_and_uuid_columns(capturing_session):
+    """
+    1. 새로 생성하는 세션/채팅/챗봇 응답 테이블의 ID 컬럼이 uuid 타입인지
+    2. ID 바인드 파라미터에 타입 캐스트가 없고 문자열로 전달되어 전환 전 CHAR(36) 컬럼에서도 비교되는지
+       (히스토리 커서의 ID 포함)
+    3. 조회 값이 UUID로 변환되고, UUID 형식이 아닌 기존 CHAR(36) 값은 그대로 반환되는지 검증
+    """
+    for table, columns in (
+        (ChatSession.__table__, ["session_id"]),
+        (Chat.__table__, ["id", "session_id"]),
+        (ChatbotResponse.__table__, ["chat_id", "prompt_chat_id"])
+    ):
+        ddl = str(CreateTable(table).compile(dialect=postgresql.dialect()))
+        for column in columns:
+            assert f"{column} UUID" in ddl
+        assert "CHAR(36)" not in ddl
+
+    dialect = asyncpg.dialect()
+    message_id = uuid4()
+    compiled = select(Chat.id).where(Chat.id == message_id).compile(dialect=dialect)
+    assert str(compiled).endswith('WHERE "Chat".id = $1')
+    key_type = Chat.__table__.c.id.type
+    assert key_type.bind_processor(dialect)(message_id) == str(message_id)
+
+    db = capturing_session
+    cursor = (datetime(2025, 1, 1, tzinfo=timezone.utc), message_id)
+    asyncio.run(crud.chat.fetch_chat_page(db, uuid4(), limit=21, cursor=cursor))
+    sql = str(db.statements[0].compile(dialect=dialect))
+    assert '("Chat".created_at, "Chat".id) > ($4::TIMESTAMP WITH TIME ZONE, $5)' in sql
+
+    to_python = key_type.result_processor(dialect, None)
+    assert to_python(str(message_id)) == to_python(message_id) == message_id
+    assert to_python("legacy-message-1") == "legacy-message-1"
+    assert as_uuid(str(message_id)) == as_uuid(message_id) == message_id
+    assert isinstance(as_uuid(str(message_id)), UUID)
+
+# --- 2. 온라인 전환 SQL 생성 테스트 ---
+def test_migration_sql_keeps_tables_in_sync():
+    """
+    1. 트리거가 삭제/PK 변경 시 새 테이블 행을 지우고, 그 외에는 upsert하는지
+    2. 채팅 트리거가 참조하는 세션을 먼저 복사하는지
+    3. backfill이 이전 배치 마지막 PK 다음부터 잠금 후 복사하는지
+    4. 파티션 전환 전 챗봇 응답은 채팅의 created_at을 사용하는지
+    5. 챗봇 응답 트리거가 챗봇/프롬프트 메세지와 세션을 먼저 복사하고, 프롬프트 외래키 값을 함께 채우는지
+    6. 교체 후 이름에서 __uuid가 제거되는지 검증
+    """
+    session, chat, response = TABLES
+
+    chat_sync = sync_function_sql(chat)
+    assert "ROW(OLD.id, OLD.created_at) IS DISTINCT FROM ROW(NEW.id, NEW.created_at)" in chat_sync
+    assert 'DELETE FROM "Chat__uuid" WHERE id = uuid_migration_cast(OLD.id::text)' in chat_sync
+    assert chat_sync.index('INSERT INTO "ChatSession__uuid"') < chat_sync.index('INSERT INTO "Chat__uuid"')
+    assert "ON CONFLICT (id, created_at) DO UPDATE SET session_id = EXCLUDED.session_id" in chat_sync
+    assert 'FROM "ChatSession" s' not in sync_function_sql(session)
+
+    first = backfill_sql(chat, ["id", "created_at"], first=True)
+    following = backfill_sql(chat, ["id", "created_at"], first=False)
+    assert "WHERE" not in first.split("LIMIT")[0]
+    assert 'WHERE (id, created_at) > (:k0, :k1) ORDER BY id, created_at LIMIT :batch_size FOR SHARE' in following
+    assert "ON CONFLICT DO NOTHING" in following
+
+    legacy = backfill_sql(response, ["chat_id"], first=True, has_created_at=False)
+    assert '(SELECT c.created_at FROM "Chat" c WHERE c.id = b.chat_id)' in legacy
+    # 서버 시작 시 추가된 created_at 컬럼은 기존 행에서 NULL이므로 채팅의 created_at으로 채움
+    assert 'coalesce(b.created_at, (SELECT c.created_at FROM "Chat" c WHERE c.id = b.chat_id))' in (
+        backfill_sql(response, ["chat_id"], first=True)
+    )
+
+    response_sync = sync_function_sql(response)
+    assert (
+        response_sync.index('INSERT INTO "ChatSession__uuid"')
+        < response_sync.index('INSERT INTO "Chat__uuid"')
+        < response_sync.index('INSERT INTO "ChatbotResponse__uuid"')
+    )
+    assert 'FROM "Chat" p WHERE p.id IN (NEW.chat_id, NEW.prompt_chat_id)' in response_sync
+    assert '(SELECT p.created_at FROM "Chat" p WHERE p.id = NEW.prompt_chat_id LIMIT 1)' in response_sync
+    ddl = response.ddl[0].format(t=response.shadow, s=session.shadow, c=chat.shadow, x="__uuid")
+    assert 'FOREIGN KEY (chat_id, created_at) REFERENCES "Chat__uuid" (id, created_at) ON DELETE CASCADE' in ddl
+    assert 'REFERENCES "Chat__uuid" (id, created_at) MATCH FULL ON DELETE SET NULL' in ddl
+
+    assert final_name("Chat__uuid_p202501_pkey") == "Chat_p202501_pkey"
+    assert final_name("idx_session_created__uuid") == "idx_session_created"
+
+# --- 3. 테이블 교체 테스트 ---
+def test_swap_renames_in_order_and_retries_on_lock_timeout(monkeypatch):
+    """
+    1. lock_timeout(55P03)으로 잠금을 얻지 못하면 롤백 후 재시도하는지
+    2. 한 트랜잭션에서 lock_timeout 설정 -> 세 테이블 잠금 -> 트리거 삭제 -> 기존 테이블 이름 변경(__char)
+       -> 새 테이블 이름 변경(__uuid 제거) 순으로 실행되는지
+    3. 교체 후 기존 연결을 종료하는지 (prepared statement 재준비)
+    4. 다른 DB 오류나 재시도 횟수 초과 시 예외가 그대로 전달되는지 검증
+    """
+    partitions = {
+        "Chat": ["Chat_p202501"], "Chat__uuid": ["Chat__uuid_p202501"],
+        "ChatbotResponse": ["ChatbotResponse_p202501"], "ChatbotResponse__uuid": ["ChatbotResponse__uuid_p202501"],
+    }
+
+    async def list_partitions(conn, table):
+        return partitions.get(table, [])
+
+    async def no_sleep(seconds):
+        pass
+
+    monkeypatch.setattr(uuid_migration, "list_partitions", list_partitions)
+    monkeypatch.setattr(uuid_migration.asyncio, "sleep", no_sleep)
+
+    engine = SwapEngine(["55P03"])
+    monkeypatch.setattr(uuid_migration, "engine", engine)
+    assert asyncio.run(uuid_migration.swap(lock_timeout=0.5, retries=3)) == {
+        "swapped": True, "attempts": 2, "terminated_connections": 4
+    }
+
+    executed = engine.executed
+    assert executed[:2] == [
+        "SET LOCAL lock_timeout = '500ms'",
+        'LOCK TABLE "ChatbotResponse", "Chat", "ChatSession" IN ACCESS EXCLUSIVE MODE'
+    ]
+    swapped = executed[2:]
+    assert swapped[:2] == ["SET LOCAL lock_timeout = '500ms'", executed[1]]
+    assert swapped[2].startswith('DROP TRIGGER IF EXISTS "uuid_migration_sync_ChatSession"')
+    legacy = [
+        'ALTER INDEX "Chat_pkey" RENAME TO "Chat_pkey__char"',
+        'ALTER TABLE "Chat_p202501" RENAME TO "Chat__char_p202501"',
+        'ALTER TABLE "Chat" RENAME TO "Chat__char"',
+        'ALTER TABLE "ChatbotResponse_p202501" RENAME TO "ChatbotResponse__char_p202501"',
+    ]
+    shadow = [
+        'ALTER INDEX "Chat__uuid_pkey" RENAME TO "Chat_pkey"',
+        'ALTER INDEX "idx_session_created__uuid" RENAME TO "idx_session_created"',
+        'ALTER TABLE "Chat__uuid_p202501" RENAME TO "Chat_p202501"',
+        'ALTER TABLE "Chat__uuid" RENAME TO "Chat"',
+        'ALTER TABLE "ChatbotResponse__uuid" RENAME TO "ChatbotResponse"',
+    ]
+    positions = [swapped.index(sql) for sql in legacy + shadow]
+    assert positions == sorted(positions)
+    assert max(i for i, sql in enumerate(swapped) if sql.startswith("DROP")) < positions[0]
+    assert "pg_terminate_backend" in swapped[-1] and "pid <> pg_backend_pid()" in swapped[-1]
+
+    for lock_errors, attempts in ((["42P01"], 1), (["55P03"] * 3, 3)):
+        engine = SwapEngine(lock_errors)
+        monkeypatch.setattr(uuid_migration, "engine", engine)
+        with pytest.raises(DBAPIError):
+            asyncio.run(uuid_migration.swap(lock_timeout=0.5, retries=3))
+        assert engine.attempts == attempts
+        assert not any(sql.startswith("ALTER") or "pg_terminate_backend" in sql for sql in engine.executed)
@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+import crud.qna
+
+from core.config import settings
+from core.view_counter import ViewCountBuffer
+
+
+class FakeQnASession:
+    """ 실행된 UPDATE 문/파라미터와 커밋을 기록하는 가짜 QnA DB 세션 """
+    executed = []
+    fail_tables = set()
+
+    def __init__(self, engine):
+        pass
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params):
+        sql = str(statement)
+        if any(f"UPDATE {table} " in sql for table in self.fail_tables):
+            raise RuntimeError("qna db unavailable")
+        self.executed.append((sql, params))
+
+    async def commit(self):
+        self.executed.append(("COMMIT", None))
+
+
+@pytest.fixture
+def qna_session(monkeypatch):
+    monkeypatch.setattr(crud.qna, "SQLModelAsyncSession", FakeQnASession)
+    monkeypatch.setattr(FakeQnASession, "executed", [])
+    monkeypatch.setattr(FakeQnASession, "fail_tables", set())
+    return FakeQnASession
+
+
+# --- 1. 조회수 일괄 반영 테스트 ---
+def test_view_deltas_are_merged_into_one_update_per_table(qna_session):
+    """
+    1. 같은 키의 조회수 증가분이 합쳐지는지
+    2. FAQ/용어별로 정렬된 키의 UPDATE ... FROM (VALUES ...) 한 번으로 반영되는지
+    3. 반영 후 대기 중인 증가분이 비워지는지 검증
+    """
+    counter = ViewCountBuffer()
+    counter.incr_faq("연회비란?")
+    counter.incr_faq("결제일 변경")
+    counter.incr_faq("연회비란?", 2)
+    counter.incr_term("리볼빙")
+
+    asyncio.run(counter.flush())
+
+    (faq_sql, faq_params), faq_commit, (term_sql, term_params), term_commit = qna_session.executed
+    assert "UPDATE faqs AS t" in faq_sql and "WHERE t.question = v.key" in faq_sql
+    assert faq_params == {"k0": "결제일 변경", "d0": 1, "k1": "연회비란?", "d1": 3}
+    assert "UPDATE terms AS t" in term_sql and term_params == {"k0": "리볼빙", "d0": 1}
+    assert faq_commit == term_commit == ("COMMIT", None)
+    assert counter.stats() == {
+        "pending_faq_views": 0, "pending_faq_keys": 0,
+        "pending_term_views": 0, "pending_term_keys": 0,
+        "flushed_views": 5, "failed_flushes": 0
+    }
+
+# --- 2. 반영 실패 / 종료 시 반영 테스트 ---
+def test_failed_deltas_are_kept_and_flushed_on_close(qna_session, monkeypatch):
+    """
+    1. 반영에 실패한 증가분은 이후 누적분과 합쳐 다음 반영 대상으로 남는지 (다른 테이블 반영은 진행)
+    2. close() 시 주기를 기다리지 않고 남은 증가분을 반영하는지 검증
+    """
+    monkeypatch.setattr(settings, "VIEW_COUNT_FLUSH_INTERVAL", 3600)
+    counter = ViewCountBuffer()
+    qna_session.fail_tables.add("faqs")
+
+    async def scenario():
+        await counter.start()
+        counter.incr_faq("연회비란?")
+        counter.incr_term("리볼빙")
+        await counter.flush()
+        assert counter.stats()["pending_faq_views"] == 1
+        assert counter.stats()["pending_term_views"] == 0
+
+        counter.incr_faq("연회비란?")
+        qna_session.fail_tables.clear()
+        await counter.close()
+
+    asyncio.run(scenario())
+
+    faq_updates = [params for sql, params in qna_session.executed if "UPDATE faqs" in sql]
+    assert faq_updates == [{"k0": "연회비란?", "d0": 2}]
+    assert counter.failed_flushes == 1
+    assert counter.flushed_views == 3
+    assert counter.stats()["pending_faq_keys"] == 0
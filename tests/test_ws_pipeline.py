@@ -0,0 +1,167 @@
+import asyncio
+
+import pytest
+
+from fastapi import WebSocketDisconnect
+
+from api.routes import ws
+from core.config import settings
+
+
+class FakeState:
+    """ 수신할 프레임을 큐로 주입하고 전송된 프레임을 기록하는 연결 상태 """
+    def __init__(self):
+        self.inbound: asyncio.Queue = asyncio.Queue()
+        self.sent = []
+        self.message_count = 0
+
+    def touch(self):
+        self.message_count += 1
+
+    async def receive(self):
+        data = await self.inbound.get()
+        if data is None:
+            raise WebSocketDisconnect(1000)
+        return data
+
+    async def send(self, payload):
+        self.sent.append(payload)
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    """ 세션당 동시 처리 2개, 대기 큐 2개로 제한하고 메세지 처리를 프레임 이름별 동작으로 대체 """
+    monkeypatch.setattr(settings, "WS_SESSION_CONCURRENCY", 2)
+    monkeypatch.setattr(settings, "WS_SESSION_QUEUE_SIZE", 2)
+    handlers = {}
+    finished, cancelled = [], []
+
+    async def handle_message(session_id, state, data, emit, message, previous):
+        try:
+            await handlers[data.split("-")[0]]()
+        except asyncio.CancelledError:
+            cancelled.append(data)
+            raise
+        finished.append(data)
+        emit({"message": data})
+
+    monkeypatch.setattr(ws, "_handle_message", handle_message)
+    return handlers, finished, cancelled
+
+
+async def until(condition):
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0.001)
+    raise AssertionError("condition not met")
+
+
+# --- 1. 전송 순서 / backpressure 테스트 ---
+def test_replies_keep_submission_order_and_full_queue_blocks_reader(pipeline):
+    """
+    1. 늦게 끝나는 메세지 뒤의 빠른 메세지도 수신 순서대로 전송되는지
+    2. 대기 큐가 가득 차면 다음 메세지를 수신하지 않고(backpressure) 큐가 비면 이어서 처리하는지 검증
+    """
+    handlers, finished, _ = pipeline
+    state = FakeState()
+
+    async def slow():
+        await asyncio.sleep(0.02)
+
+    async def fast():
+        pass
+
+    handlers.update(slow=slow, fast=fast)
+
+    async def scenario():
+        gate = asyncio.Event()
+
+        async def blocked():
+            await gate.wait()
+
+        handlers["blocked"] = blocked
+        serving = asyncio.create_task(ws._serve_messages(None, state))
+        for data in ("slow", "fast"):
+            state.inbound.put_nowait(data)
+        await until(lambda: len(state.sent) == 2)
+        assert finished == ["fast", "slow"]
+        assert state.sent == [{"message": "slow"}, {"message": "fast"}]
+
+        # sender가 첫 메세지 전송을 기다리는 동안 대기 큐(2개)가 차면 4번째 메세지에서 수신 중단
+        for i in range(6):
+            state.inbound.put_nowait(f"blocked-{i}")
+        await until(lambda: state.message_count == 2 + 4)
+        await asyncio.sleep(0.01)
+        assert state.message_count == 2 + 4
+        assert state.inbound.qsize() == 2
+
+        gate.set()
+        await until(lambda: len(state.sent) == 8)
+        state.inbound.put_nowait(None)
+        with pytest.raises(WebSocketDisconnect):
+            await serving
+
+    asyncio.run(scenario())
+
+    assert state.sent[2:] == [{"message": f"blocked-{i}"} for i in range(6)]
+
+# --- 2. 연결 종료 / 처리 오류 테스트 ---
+def test_disconnect_cancels_messages_and_fatal_error_stops_sending(pipeline, monkeypatch):
+    """
+    1. 연결이 끊기면 처리 중(세마포어 획득)/대기 중인 메세지 태스크가 모두 취소되는지
+    2. 메세지 처리 중 알 수 없는 오류(_FATAL) 발생 시 오류 프레임 이후 전송을 멈추고 반환하는지 검증
+    """
+    handlers, finished, cancelled = pipeline
+    messages = []
+
+    class RecordingPendingMessage(ws.PendingMessage):
+        __slots__ = ()
+
+        def __init__(self):
+            super().__init__()
+            messages.append(self)
+
+    monkeypatch.setattr(ws, "PendingMessage", RecordingPendingMessage)
+
+    async def forever():
+        await asyncio.Event().wait()
+
+    async def boom():
+        raise RuntimeError("unexpected")
+
+    async def fast():
+        pass
+
+    handlers.update(forever=forever, boom=boom, fast=fast)
+
+    async def disconnect_scenario():
+        state = FakeState()
+        serving = asyncio.create_task(ws._serve_messages(None, state))
+        for i in range(3):
+            state.inbound.put_nowait(f"forever-{i}")
+        await until(lambda: len(messages) == 3)
+        state.inbound.put_nowait(None)
+        with pytest.raises(WebSocketDisconnect):
+            await serving
+        return state
+
+    state = asyncio.run(disconnect_scenario())
+    assert state.sent == []
+    assert all(message.task.done() for message in messages)
+    # 동시 처리 한도(2)만큼 처리 중이던 메세지는 처리 도중, 나머지는 세마포어 대기 중 취소
+    assert sorted(cancelled) == ["forever-0", "forever-1"]
+
+    async def fatal_scenario():
+        state = FakeState()
+        for data in ("fast-0", "boom", "fast-1"):
+            state.inbound.put_nowait(data)
+        await asyncio.wait_for(ws._serve_messages(None, state), timeout=1)
+        return state
+
+    state = asyncio.run(fatal_scenario())
+    assert state.sent == [
+        {"message": "fast-0"},
+        {"error": "Internal Server Error: Unknown error occurred"}
+    ]
+    assert all(message.task.done() for message in messages[3:])
@@ -0,0 +1,73 @@
+import json
+
+from unittest import mock
+from uuid import uuid4
+
+import pytest
+
+from pydantic import ValidationError
+
+from api.routes.ws import parse_client_message, select_subprotocol
+from core import serialization
+from core.config import settings
+from core.llm import parse_dispatch_body, parse_dispatch_payload
+from schemas.ws import BotFrame
+
+
+# --- 1. 클라이언트 메세지 검증 및 서브프로토콜 협상 테스트 ---
+def test_client_message_validation_and_subprotocol():
+    """
+    1. JSON 텍스트 프레임이 ClientMessage로 검증되고, 필드 누락/UUID가 아닌 message_id는 ValidationError가 발생하는지
+    2. msgpack 요청 시 패키지 설치/설정 여부에 따라 서브프로토콜이 선택되는지
+    3. msgpack 연결의 바이너리 프레임이 MessagePack으로 파싱되는지 검증
+    """
+    message_id = uuid4()
+    req = parse_client_message(json.dumps({"message_id": str(message_id), "message": "카드 추천", "stream": True}), False)
+    assert (req.message_id, req.message, req.stream) == (message_id, "카드 추천", True)
+    for invalid in ('{"message": "ID 없음"}', '{"message_id": "m-1", "message": "UUID가 아닌 ID"}'):
+        with pytest.raises(ValidationError):
+            parse_client_message(invalid, False)
+
+    assert select_subprotocol([]) is None
+    assert select_subprotocol(["json"]) == "json"
+    with mock.patch.object(settings, "WS_MSGPACK_ENABLED", False):
+        assert select_subprotocol(["msgpack", "json"]) == "json"
+    with mock.patch.object(serialization, "MSGPACK_AVAILABLE", False):
+        assert select_subprotocol(["msgpack"]) is None
+
+    if serialization.MSGPACK_AVAILABLE:
+        assert select_subprotocol(["msgpack", "json"]) == "msgpack"
+        frame = serialization.pack({"message_id": str(uuid4()), "message": "연회비"})
+        assert parse_client_message(frame, True).message == "연회비"
+
+# --- 2. LLM 디스패치 응답 파싱 테스트 ---
+def test_dispatch_response_parsing():
+    """
+    1. 툴 응답 본문(bytes)에서 응답에 있는 필드만 추출되는지 (relatedQuestions -> related_questions)
+    2. 빈 tool_response는 표준 응답으로 처리되는지
+    3. 형식이 잘못된 응답은 ValueError가 발생하는지
+    4. 추출 결과로 만든 봇 프레임이 봇 프레임 형식(BotFrame)의 필드만 가지는지 검증
+    """
+    body = json.dumps({"tool_response": {
+        "tool_name": "card_recommend",
+        "tool_response_content": {"answer": "추천 카드입니다.", "card_list": [{"card_id": 1}], "relatedQuestions": []}
+    }}).encode()
+    reply = parse_dispatch_body(body)
+
+    assert reply == {
+        "message": "추천 카드입니다.",
+        "card_list": [{"card_id": 1}],
+        "related_questions": [],
+        "tool_name": "card_recommend"
+    }
+    assert parse_dispatch_payload({"answer": "표준 응답", "tool_response": {}}) == {"message": "표준 응답"}
+    for invalid in ({"answer": ""}, {"tool_response": {"tool_name": "x"}}, {"answer": 1}):
+        with pytest.raises(ValueError):
+            parse_dispatch_payload(invalid)
+
+    frame = {
+        "sender": "bot", "timestamp": "2025-01-01T00:00:00+00:00",
+        "message_id": "m-1", "login_required": False, **reply
+    }
+    assert set(frame) <= set(BotFrame.__annotations__)
+    assert BotFrame.__required_keys__ <= set(frame)